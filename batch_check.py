@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Пакетная проверка списков литературы на соответствие критериям без
+графического интерфейса (PyQt не используется).
+
+Для каждого файла DOCX, PDF и TXT каталога выполняются те же шаги, что
+при импорте в главном окне и проверке на вкладке критериев: выделение
+раздела списка литературы, распознавание ссылок, подсчет статистики и
+проверка критериев. Файлы распределяются по пулу процессов. В каталог
+отчетов сохраняются отчет по каждому файлу (с теми же вложенными
+каталогами, что у файла в проверяемом каталоге) и сводный отчет (summary).
+
+Профиль критериев - JSON-файл с тем же набором ключей, что критерии
+модели (AppModel.criteria); отсутствующие ключи берутся по умолчанию.
+
+Запуск из корня проекта:
+    python batch_check.py <каталог> --criteria profile.json --output reports [--format json]
+"""
+
+import argparse
+import json
+import sys
+from models.app_model import AppModel
+from utils.batch_checker import REPORT_FORMATS, find_files, run_batch
+from utils.reference_parser import ReferenceParser
+
+def load_criteria(path=None):
+    """
+    Загрузка профиля критериев поверх критериев по умолчанию
+    
+    Args:
+        path (str): Путь к JSON-файлу профиля (None - критерии по умолчанию)
+    
+    Returns:
+        dict: Словарь с критериями проверки
+    """
+    criteria = dict(AppModel().criteria)
+    if path:
+        with open(path, 'r', encoding='utf-8') as file:
+            profile = json.load(file)
+        if not isinstance(profile, dict):
+            raise Exception(f"Профиль критериев должен быть объектом JSON: {path}")
+        criteria.update(profile)
+    return criteria
+
+def print_progress(report):
+    """Вывод строки о проверенном файле"""
+    if report['status'] != 'ok':
+        print(f"{report['file']}: ошибка - {report['error']}")
+    elif not report['total']:
+        print(f"{report['file']}: ссылки не найдены")
+    else:
+        print(f"{report['file']}: выполнено {report['passed']} из {report['total']} критериев ({report['seconds']} с)")
+
+def main():
+    """Точка входа пакетной проверки"""
+    parser = argparse.ArgumentParser(description="Пакетная проверка списков литературы на соответствие критериям")
+    parser.add_argument('directory', help="каталог с файлами DOCX, PDF и TXT")
+    parser.add_argument('--criteria', help="профиль критериев (JSON)")
+    parser.add_argument('--output', default="reports", help="каталог отчетов")
+    parser.add_argument('--format', default="csv", choices=REPORT_FORMATS, help="формат отчетов")
+    parser.add_argument('--workers', type=int, help="количество процессов (по умолчанию - число ядер)")
+    parser.add_argument('--recursive', action='store_true', help="проверять также вложенные каталоги")
+    parser.add_argument('--whole-document', action='store_true',
+                        help="импортировать документы целиком, а не только раздел списка литературы")
+    parser.add_argument('--engine', default="regex", choices=ReferenceParser.ENGINES, help="механизм разбора ссылок ГОСТ")
+    args = parser.parse_args()
+    
+    criteria = load_criteria(args.criteria)
+    file_paths = find_files(args.directory, args.recursive)
+    if not file_paths:
+        print(f"В каталоге {args.directory} нет файлов DOCX, PDF и TXT")
+        sys.exit(1)
+    
+    summary = run_batch(file_paths, criteria, args.output, args.format, args.workers,
+                        args.whole_document, args.engine, progress=print_progress, base_dir=args.directory)
+    
+    print()
+    print(f"Проверено файлов: {summary['files']}")
+    print(f"- соответствуют всем критериям: {summary['compliant']}")
+    print(f"- соответствуют частично: {summary['partial']}")
+    print(f"- не соответствуют: {summary['failed']}")
+    print(f"- без ссылок: {summary['empty']}")
+    print(f"- с ошибками: {summary['errors']}")
+    print(f"Отчеты сохранены в {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Инициализация пакета бенчмарков
\ No newline at end of file
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Сравнение механизмов разбора ссылок ГОСТ (regex и tokenizer)
+по точности на размеченных ссылках и по скорости.
+
+Результаты выводятся отдельно по каждому набору. По настроечному набору
+(gost_labeled.jsonl) подбирались правила tokenizer, поэтому точность на
+нем завышена. Отложенный набор (gost_heldout.jsonl) при настройке не
+использовался; он содержит ссылки тех же видов (книги, статьи, статьи
+в сборниках, веб-ресурсы, авторефераты) с другими текстами и не заменяет
+проверку на реальных списках литературы.
+
+Запуск из корня проекта:
+    python -m benchmarks.engine_comparison [--data FILE ...] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import time
+from utils.reference_parser import ReferenceParser
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Размеченные ссылки: по одному JSON-объекту {"text": ..., "expected": {...}}
+# в строке; поля, отсутствующие в expected, должны остаться пустыми.
+# Наборы по умолчанию: (путь, описание)
+DEFAULT_DATASETS = (
+    (os.path.join(DATA_DIR, 'gost_labeled.jsonl'), "настроечный, по нему подбирались правила tokenizer"),
+    (os.path.join(DATA_DIR, 'gost_heldout.jsonl'), "отложенный, при настройке не использовался"),
+)
+
+# Сравниваемые поля BibliographyItem
+FIELDS = (
+    'authors', 'title', 'subtitle', 'journal', 'city', 'publisher', 'year',
+    'edition', 'volume', 'issue', 'pages', 'url', 'doi', 'type'
+)
+
+def load_labeled(path):
+    """
+    Загрузка размеченных ссылок
+    
+    Args:
+        path (str): Путь к файлу JSON Lines
+    
+    Returns:
+        list: Пары (текст ссылки, словарь ожидаемых полей)
+    """
+    samples = []
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                data = json.loads(line)
+                samples.append((data['text'], data.get('expected', {})))
+    return samples
+
+def normalize_value(value):
+    """
+    Приведение значения поля к форме для сравнения: пробелы схлопываются,
+    тире в диапазонах заменяются дефисом, концевая точка отбрасывается
+    
+    Args:
+        value (str | list): Значение поля
+    
+    Returns:
+        str | tuple: Нормализованное значение
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_value(part) for part in value)
+    return ' '.join(str(value or '').replace('–', '-').split()).rstrip('.').strip()
+
+def compare_fields(item, expected):
+    """
+    Сравнение полей распознанной записи с разметкой
+    
+    Args:
+        item (BibliographyItem): Распознанная запись
+        expected (dict): Ожидаемые значения полей
+    
+    Returns:
+        dict: {имя поля: True, если значение совпало}
+    """
+    return {
+        field: normalize_value(getattr(item, field)) == normalize_value(expected.get(field, [] if field == 'authors' else ''))
+        for field in FIELDS
+    }
+
+def evaluate(engine, samples, format_type, repeat):
+    """
+    Оценка одного механизма разбора
+    
+    Args:
+        engine (str): Механизм разбора (regex, tokenizer)
+        samples (list): Размеченные ссылки
+        format_type (str): Тип формата, передаваемый парсеру
+        repeat (int): Количество проходов по ссылкам при замере скорости
+    
+    Returns:
+        dict: Точность по полям, доля полностью верных записей,
+            скорость (ссылок в секунду) и распознанные записи
+    """
+    texts = [text for text, _ in samples]
+    
+    start = time.perf_counter()
+    for _ in range(repeat):
+        items = [ReferenceParser.parse(text, format_type, engine) for text in texts]
+    elapsed = time.perf_counter() - start
+    
+    field_hits = dict.fromkeys(FIELDS, 0)
+    exact = 0
+    for item, (_, expected) in zip(items, samples):
+        matches = compare_fields(item, expected)
+        for field, matched in matches.items():
+            field_hits[field] += matched
+        exact += all(matches.values())
+    
+    count = len(samples)
+    return {
+        'field_accuracy': {field: hits / count for field, hits in field_hits.items()},
+        'exact': exact / count,
+        'throughput': count * repeat / elapsed if elapsed > 0 else 0,
+        'items': items
+    }
+
+def print_results(path, description, format_type, repeat):
+    """
+    Вывод сравнения механизмов на одном наборе ссылок
+    
+    Args:
+        path (str): Путь к файлу набора
+        description (str): Описание набора (пустая строка - без описания)
+        format_type (str): Тип формата, передаваемый парсеру
+        repeat (int): Количество проходов при замере скорости
+    """
+    samples = load_labeled(path)
+    results = {engine: evaluate(engine, samples, format_type, repeat) for engine in ReferenceParser.ENGINES}
+    
+    print(f"Набор {os.path.basename(path)}" + (f" ({description})" if description else ""))
+    print(f"Ссылок: {len(samples)}")
+    print(f"{'Поле':<12}" + ''.join(f"{engine:>12}" for engine in results))
+    for field in FIELDS:
+        print(f"{field:<12}" + ''.join(f"{result['field_accuracy'][field]:>12.1%}" for result in results.values()))
+    print(f"{'все поля':<12}" + ''.join(f"{result['exact']:>12.1%}" for result in results.values()))
+    print(f"{'ссылок/с':<12}" + ''.join(f"{result['throughput']:>12.0f}" for result in results.values()))
+    
+    # Доля ссылок, разобранных механизмами одинаково
+    regex_items, tokenizer_items = results['regex']['items'], results['tokenizer']['items']
+    agreement = sum(
+        all(normalize_value(getattr(a, field)) == normalize_value(getattr(b, field)) for field in FIELDS)
+        for a, b in zip(regex_items, tokenizer_items)
+    )
+    print(f"Совпадение результатов механизмов: {agreement / len(samples):.1%}")
+
+def main():
+    """Точка входа сравнения"""
+    parser = argparse.ArgumentParser(description="Сравнение механизмов разбора ссылок ГОСТ")
+    parser.add_argument('--data', action='append',
+                        help="файл размеченных ссылок (JSON Lines); можно указать несколько раз "
+                             "(по умолчанию - настроечный и отложенный наборы)")
+    parser.add_argument('--format', default="ГОСТ", help="тип формата, передаваемый парсеру")
+    parser.add_argument('--repeat', type=int, default=50, help="количество проходов при замере скорости")
+    args = parser.parse_args()
+    
+    datasets = [(path, "") for path in args.data] if args.data else DEFAULT_DATASETS
+    
+    # Кэш отключается, чтобы замерялся сам разбор
+    ReferenceParser.disable_cache()
+    for index, (path, description) in enumerate(datasets):
+        if index:
+            print()
+        print_results(path, description, args.format, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Бенчмарк скорости и точности ReferenceParser.
+
+Размеченный корпус (benchmarks/data/*_labeled.jsonl) содержит ссылки ГОСТ
+(книги, статьи, статьи в сборниках, веб-ресурсы, авторефераты) и IEEE
+(статьи, доклады конференций, книги). Отчет включает скорость разбора
+(ссылок в секунду), задержку p50/p99 по типам ссылок, точность и полноту
+по полям, а также задержку на синтетических длинных и "враждебных" строках.
+
+Результаты сохраняются в JSON. При сравнении с базовым прогоном
+регрессия выше порога завершает программу с кодом 1. С ключом --instrument
+после замеров выполняется отдельный проход с инструментированием парсера
+и выводятся время и результаты по этапам и шаблонам.
+
+Запуск из корня проекта:
+    python -m benchmarks.parser_benchmark --output run.json [--baseline base.json] [--instrument]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from benchmarks.engine_comparison import FIELDS, load_labeled, normalize_value
+from utils.reference_parser import ReferenceParser
+
+# Изменение задержки меньше этой величины считается шумом измерения
+LATENCY_NOISE_MS = 1.0
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Файлы размеченного корпуса: (формат, путь)
+CORPUS_FILES = (
+    ('ГОСТ', os.path.join(DATA_DIR, 'gost_labeled.jsonl')),
+    ('IEEE', os.path.join(DATA_DIR, 'ieee_labeled.jsonl')),
+)
+
+def load_corpus():
+    """
+    Загрузка размеченного корпуса
+    
+    Returns:
+        list: Тройки (группа "формат/тип", текст ссылки, ожидаемые поля)
+    """
+    corpus = []
+    for format_name, path in CORPUS_FILES:
+        for text, expected in load_labeled(path):
+            corpus.append((f"{format_name}/{expected.get('type', 'book')}", text, expected))
+    return corpus
+
+def synthetic_lines(corpus):
+    """
+    Синтетические длинные и "враждебные" строки без разметки: склеенные
+    при извлечении из PDF ссылки и строки с множеством разделителей,
+    на которых шаблоны с вложенными квантификаторами работают долго
+    
+    Args:
+        corpus (list): Размеченный корпус (для склеенных строк)
+    
+    Returns:
+        list: Пары (имя строки, текст)
+    """
+    glued = ' '.join(text for _, text, _ in corpus)
+    return [
+        ('glued_corpus', glued),
+        ('glued_corpus_x4', ' '.join([glued] * 4)),
+        ('book_separators', "Иванов И. И. " + "раздел : часть / том. — М. : " * 64 + "— 100 с."),
+        ('book_dotted_authors', "Иванов. И. " * 64 + "x : y / z — w : v " * 64 + ", 100 с."),
+        ('thesis_separators', "Иванов. И. " * 64 + "x / y : автореф. дис. ... канд / a / b. " * 64),
+        ('ieee_book_commas', 'A. Roe, Title. Boston, MA: Pub, ' * 64 + 'x'),
+        ('publisher_run', 'М : ' + 'а' * 3000 + ' Издательство ' + 'б' * 3000),
+        ('whitespace_run', 'Иванов И. И. Название' + ' ' * 5000 + '/ ' + ' ' * 5000 + '// x'),
+        ('initials_run', 'Иванов ' + 'И. ' * 2000 + 'Название. — М. : Наука, 2020.'),
+    ]
+
+def percentile(values, fraction):
+    """
+    Процентиль по методу ближайшего ранга
+    
+    Args:
+        values (list): Значения
+        fraction (float): Доля от 0 до 1 (0.5 - медиана)
+    
+    Returns:
+        float: Значение процентиля или 0 для пустого списка
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * fraction))
+    return ordered[rank - 1]
+
+def field_scores(pairs):
+    """
+    Точность (precision) и полнота (recall) распознавания по полям
+    
+    Значение поля считается верным, если после нормализации совпадает
+    с разметкой. Непустое неверное значение - ложное срабатывание, пустое
+    или неверное значение при непустой разметке - пропуск.
+    
+    Args:
+        pairs (list): Пары (распознанная запись, ожидаемые поля)
+    
+    Returns:
+        dict: {имя поля: {'precision', 'recall', 'support'}}
+    """
+    scores = {}
+    for field in FIELDS:
+        true_positive = false_positive = false_negative = 0
+        for item, expected in pairs:
+            predicted = normalize_value(getattr(item, field))
+            target = normalize_value(expected.get(field, [] if field == 'authors' else ''))
+            if predicted and predicted == target:
+                true_positive += 1
+                continue
+            if predicted:
+                false_positive += 1
+            if target:
+                false_negative += 1
+        
+        scores[field] = {
+            'precision': true_positive / (true_positive + false_positive) if true_positive + false_positive else 1.0,
+            'recall': true_positive / (true_positive + false_negative) if true_positive + false_negative else 1.0,
+            'support': true_positive + false_negative
+        }
+    return scores
+
+def run_benchmark(engine="regex", format_type="auto", repeat=20):
+    """
+    Выполнение бенчмарка
+    
+    Args:
+        engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+        format_type (str): Тип формата, передаваемый парсеру
+        repeat (int): Количество проходов по корпусу
+    
+    Returns:
+        dict: Результаты прогона (сериализуемые в JSON)
+    """
+    # Кэш отключается, чтобы замерялся сам разбор
+    ReferenceParser.disable_cache()
+    corpus = load_corpus()
+    
+    latencies = {}
+    items = []
+    total_time = 0.0
+    for _ in range(repeat):
+        items = []
+        for group, text, _ in corpus:
+            start = time.perf_counter()
+            item = ReferenceParser.parse(text, format_type, engine)
+            elapsed = time.perf_counter() - start
+            total_time += elapsed
+            latencies.setdefault(group, []).append(elapsed)
+            items.append(item)
+    
+    synthetic = {}
+    for name, text in synthetic_lines(corpus):
+        timings = []
+        for _ in range(max(1, repeat // 4)):
+            start = time.perf_counter()
+            item = ReferenceParser.parse(text, format_type, engine)
+            timings.append(time.perf_counter() - start)
+        synthetic[name] = {
+            'length': len(text),
+            'best_ms': min(timings) * 1000,
+            'fallback': item.get_additional_info('parse_fallback', '')
+        }
+    
+    return {
+        'engine': engine,
+        'format_type': format_type,
+        'repeat': repeat,
+        'references': len(corpus),
+        'python': platform.python_version(),
+        'throughput': len(corpus) * repeat / total_time if total_time > 0 else 0,
+        'latency_ms': {
+            group: {
+                'count': len(values) // repeat,
+                'p50': percentile(values, 0.5) * 1000,
+                'p99': percentile(values, 0.99) * 1000
+            }
+            for group, values in sorted(latencies.items())
+        },
+        'fields': field_scores([(item, expected) for item, (_, _, expected) in zip(items, corpus)]),
+        'synthetic': synthetic
+    }
+
+def profile_stages(engine="regex", format_type="auto", repeat=5):
+    """
+    Проход по корпусу и синтетическим строкам с инструментированием парсера
+    
+    Args:
+        engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+        format_type (str): Тип формата, передаваемый парсеру
+        repeat (int): Количество проходов по корпусу
+    
+    Returns:
+        ParserInstrumentation: Собранная статистика этапов
+    """
+    ReferenceParser.disable_cache()
+    corpus = load_corpus()
+    texts = [text for _, text, _ in corpus] * repeat + [text for _, text in synthetic_lines(corpus)]
+    
+    instrumentation = ReferenceParser.enable_instrumentation()
+    try:
+        for text in texts:
+            ReferenceParser.parse(text, format_type, engine)
+    finally:
+        ReferenceParser.disable_instrumentation()
+    return instrumentation
+
+def is_slower(value_ms, base_ms, threshold):
+    """
+    Проверка роста задержки сверх порога и шума измерения
+    
+    Args:
+        value_ms (float): Задержка текущего прогона, мс
+        base_ms (float): Задержка базового прогона, мс
+        threshold (float): Допустимый относительный рост
+    
+    Returns:
+        bool: True, если задержка выросла существенно
+    """
+    return value_ms > base_ms * (1 + threshold) and value_ms - base_ms > LATENCY_NOISE_MS
+
+def find_regressions(result, baseline, speed_threshold, accuracy_threshold):
+    """
+    Сравнение прогона с базовым
+    
+    Args:
+        result (dict): Результаты текущего прогона
+        baseline (dict): Результаты базового прогона
+        speed_threshold (float): Допустимое относительное ухудшение скорости
+            и задержек (0.2 - на 20%); рост задержки меньше LATENCY_NOISE_MS
+            не учитывается
+        accuracy_threshold (float): Допустимое абсолютное снижение точности
+            и полноты по полю (0.01 - на один процентный пункт)
+    
+    Returns:
+        list: Описания обнаруженных регрессий
+    """
+    regressions = []
+    
+    if result['throughput'] < baseline['throughput'] * (1 - speed_threshold):
+        regressions.append(
+            f"скорость: {result['throughput']:.0f} ссылок/с против {baseline['throughput']:.0f}"
+        )
+    
+    for group, latency in result['latency_ms'].items():
+        base_latency = baseline['latency_ms'].get(group)
+        if base_latency and is_slower(latency['p99'], base_latency['p99'], speed_threshold):
+            regressions.append(f"p99 {group}: {latency['p99']:.3f} мс против {base_latency['p99']:.3f} мс")
+    
+    for field, scores in result['fields'].items():
+        base_scores = baseline['fields'].get(field)
+        if not base_scores:
+            continue
+        for metric in ('precision', 'recall'):
+            if scores[metric] < base_scores[metric] - accuracy_threshold:
+                regressions.append(f"{metric} {field}: {scores[metric]:.3f} против {base_scores[metric]:.3f}")
+    
+    for name, line in result['synthetic'].items():
+        base_line = baseline['synthetic'].get(name)
+        if base_line and is_slower(line['best_ms'], base_line['best_ms'], speed_threshold):
+            regressions.append(f"строка {name}: {line['best_ms']:.1f} мс против {base_line['best_ms']:.1f} мс")
+    
+    return regressions
+
+def print_report(result):
+    """
+    Вывод результатов прогона
+    
+    Args:
+        result (dict): Результаты прогона
+    """
+    print(f"Механизм: {result['engine']}, формат: {result['format_type']}, ссылок: {result['references']}")
+    print(f"Скорость: {result['throughput']:.0f} ссылок/с")
+    
+    print(f"\n{'Группа':<20}{'ссылок':>8}{'p50, мс':>10}{'p99, мс':>10}")
+    for group, latency in result['latency_ms'].items():
+        print(f"{group:<20}{latency['count']:>8}{latency['p50']:>10.3f}{latency['p99']:>10.3f}")
+    
+    print(f"\n{'Поле':<12}{'точность':>10}{'полнота':>10}{'размечено':>11}")
+    for field, scores in result['fields'].items():
+        print(f"{field:<12}{scores['precision']:>10.1%}{scores['recall']:>10.1%}{scores['support']:>11}")
+    
+    print(f"\n{'Синтетическая строка':<22}{'длина':>8}{'мин, мс':>10}  резервный разбор")
+    for name, line in result['synthetic'].items():
+        print(f"{name:<22}{line['length']:>8}{line['best_ms']:>10.1f}  {line['fallback'] or '-'}")
+
+def main():
+    """Точка входа бенчмарка"""
+    parser = argparse.ArgumentParser(description="Бенчмарк скорости и точности ReferenceParser")
+    parser.add_argument('--engine', default="regex", choices=ReferenceParser.ENGINES, help="механизм разбора ссылок ГОСТ")
+    parser.add_argument('--format', default="auto", help="тип формата, передаваемый парсеру")
+    parser.add_argument('--repeat', type=int, default=20, help="количество проходов по корпусу")
+    parser.add_argument('--output', help="файл для сохранения результатов (JSON)")
+    parser.add_argument('--baseline', help="файл результатов базового прогона для сравнения")
+    parser.add_argument('--speed-threshold', type=float, default=0.2,
+                        help="допустимое относительное ухудшение скорости и задержек")
+    parser.add_argument('--accuracy-threshold', type=float, default=0.01,
+                        help="допустимое абсолютное снижение точности и полноты")
+    parser.add_argument('--instrument', action='store_true',
+                        help="вывести время и результаты по этапам и шаблонам разбора")
+    args = parser.parse_args()
+    
+    result = run_benchmark(args.engine, args.format, args.repeat)
+    print_report(result)
+    
+    if args.instrument:
+        print()
+        print(profile_stages(args.engine, args.format).report())
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = find_regressions(result, baseline, args.speed_threshold, args.accuracy_threshold)
+        if regressions:
+            print("\nРегрессии относительно базового прогона:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\nРегрессий относительно базового прогона нет")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Микробенчмарк вспомогательных методов ReferenceParser.
+
+Сравнивает прежние реализации (компиляция шаблонов при каждом вызове,
+re.search со строковым шаблоном, подсчет букв через findall) с текущими
+(шаблоны, скомпилированные на уровне класса).
+
+Запуск из корня проекта:
+    python -m benchmarks.parser_helpers_benchmark [--number N]
+"""
+
+import argparse
+import re
+import timeit
+from models.bibliography_item import BibliographyItem
+from utils.reference_parser import ReferenceParser
+
+AUTHORS_TEXT = "Иванов И. И., Петров П. П. и Сидоров С. С."
+TITLES = (
+    "Основы программирования и анализ данных в современных системах",
+    "Deep learning for natural language processing tasks",
+)
+GOST_TEXT = "Иванов И. И. Методы анализа // Вестник МГУ. — 2020. — Т. 5. — № 3. — С. 10-20."
+IEEE_TEXT = '[1] A. Smith, "Title of paper," IEEE Trans. Comput., vol. 5, no. 3, pp. 10-20, 2020, doi: 10.1109/5.771073'
+GENERAL_TEXT = "Smith J., Doe A. Some title. Oxford University Press, 2019. 200 p."
+
+# Шаблоны, которые раньше передавались в re.search/re.sub строкой при каждом
+# вызове: (имя константы, исходная строка шаблона, флаги, пример текста)
+INLINE_PATTERNS = (
+    ('GOST_SPLIT_JOURNAL_PATTERN', r'^([^\.—]+)', 0, "Вестник МГУ. — 2020. — Т. 5."),
+    ('GOST_SPLIT_AUTHORS_PATTERN', r'^(.*?)\.\s+', 0, "Иванов И. И. Методы анализа"),
+    ('GOST_SPLIT_TITLE_PATTERN', r'^.*?\.\s+(.*?)(?:\s+/\s+.*?)?$', 0, "Иванов И. И. Методы анализа"),
+    ('GOST_SPLIT_YEAR_PATTERN', r'—\s+(\d{4})', 0, GOST_TEXT),
+    ('GOST_SPLIT_VOLUME_PATTERN', r'Т\.\s+(\d+)', 0, GOST_TEXT),
+    ('GOST_SPLIT_ISSUE_PATTERN', r'№\s+(\d+)', 0, GOST_TEXT),
+    ('GOST_SPLIT_PAGES_PATTERN', r'С\.\s*(\d+(?:.\d+)?)', 0, GOST_TEXT),
+    ('PUBLISHER_PATTERN', r'(?<![\s:])(?:[\s:]*:|\s)([^:,\.]+(?:Издательство|Изд-во|Press|Publishing)[^:,\.]+)(?:,|\.|$)', re.IGNORECASE, GENERAL_TEXT),
+    ('PLAIN_YEAR_PATTERN', r'\b(19|20)\d{2}\b', 0, GENERAL_TEXT),
+    ('IEEE_QUOTED_TITLE_PATTERN', r'"([^"]+)"', 0, IEEE_TEXT),
+    ('IEEE_JOURNAL_PATTERN', r'^\s*,\s*([^,]+)', 0, ', IEEE Trans. Comput., vol. 5'),
+    ('IEEE_VOLUME_PATTERN', r'vol\.\s*(\d+)', re.IGNORECASE, IEEE_TEXT),
+    ('IEEE_ISSUE_PATTERN', r'no\.\s*(\d+)', re.IGNORECASE, IEEE_TEXT),
+    ('IEEE_PAGES_PATTERN', r'pp\.\s*(\d+)[-–](\d+)|p\.\s*(\d+)', re.IGNORECASE, IEEE_TEXT),
+    ('IEEE_DOI_PATTERN', r'doi:?\s*(10\.\d{4,}(?:\.\d+)*\/(?:(?!["&\'])\S)+)', re.IGNORECASE, IEEE_TEXT),
+    ('WEB_ADDRESS_PATTERN', r'https?:|www\.', re.IGNORECASE, "Smith J., Doe A"),
+    ('INITIALS_PATTERN', r'[А-Яа-яA-Za-z]\.\s*[А-Яа-яA-Za-z]\.', 0, "Smith J. A."),
+)
+
+def legacy_process_authors(authors_text):
+    """Прежняя реализация ReferenceParser._process_authors"""
+    if not authors_text:
+        return []
+    authors_text = authors_text.replace(" и ", ", ").replace(" and ", ", ").replace("&", ",")
+    gost_pattern = re.compile(r'([А-Яа-яA-Za-z]+)\s+([А-Яа-яA-Za-z]\.(?:\s*[А-Яа-яA-Za-z]\.)?)')
+    ieee_pattern = re.compile(r'([А-Яа-яA-Za-z]\.(?:\s*[А-Яа-яA-Za-z]\.)?)\s+([А-Яа-яA-Za-z]+)')
+    if gost_pattern.search(authors_text):
+        return [part.strip() for part in authors_text.split(',') if part.strip()]
+    if ieee_pattern.search(authors_text):
+        return [part.strip() for part in authors_text.split(',') if part.strip()]
+    return [part.strip() for part in authors_text.split(',') if part.strip()]
+
+def legacy_detect_language(item):
+    """Прежняя реализация ReferenceParser._detect_language"""
+    if item.title:
+        ru_pattern = re.compile(r'[а-яА-ЯёЁ]')
+        en_pattern = re.compile(r'[a-zA-Z]')
+        ru_count = len(ru_pattern.findall(item.title))
+        en_count = len(en_pattern.findall(item.title))
+        if ru_count > en_count:
+            item.language = 'ru'
+        elif en_count > ru_count:
+            item.language = 'en'
+
+def measure(func, number):
+    """
+    Время одного вызова функции
+    
+    Args:
+        func (callable): Функция без аргументов
+        number (int): Количество вызовов в одном замере
+    
+    Returns:
+        float: Лучшее из пяти замеров время одного вызова, мкс
+    """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+def run(number):
+    """
+    Выполнение всех замеров
+    
+    Args:
+        number (int): Количество вызовов в одном замере
+    
+    Returns:
+        list: Кортежи (название, прежнее время, текущее время), мкс
+    """
+    results = []
+    
+    assert legacy_process_authors(AUTHORS_TEXT) == ReferenceParser._process_authors(AUTHORS_TEXT)
+    results.append((
+        '_process_authors',
+        measure(lambda: legacy_process_authors(AUTHORS_TEXT), number),
+        measure(lambda: ReferenceParser._process_authors(AUTHORS_TEXT), number)
+    ))
+    
+    for title in TITLES:
+        legacy_item = BibliographyItem()
+        legacy_item.title = title
+        item = BibliographyItem()
+        item.title = title
+        legacy_detect_language(legacy_item)
+        ReferenceParser._detect_language(item)
+        assert legacy_item.language == item.language
+        results.append((
+            f'_detect_language ({item.language})',
+            measure(lambda: legacy_detect_language(legacy_item), number),
+            measure(lambda: ReferenceParser._detect_language(item), number)
+        ))
+    
+    for name, source, flags, text in INLINE_PATTERNS:
+        pattern = getattr(ReferenceParser, name)
+        assert pattern.pattern == source and pattern.flags & re.IGNORECASE == flags
+        results.append((
+            name,
+            measure(lambda: re.search(source, text, flags), number),
+            measure(lambda: pattern.search(text), number)
+        ))
+    
+    return results
+
+def main():
+    """Точка входа бенчмарка"""
+    parser = argparse.ArgumentParser(description="Микробенчмарк вспомогательных методов ReferenceParser")
+    parser.add_argument('--number', type=int, default=20000, help="количество вызовов в одном замере")
+    args = parser.parse_args()
+    
+    print(f"{'Метод / шаблон':<34}{'было, мкс':>12}{'стало, мкс':>12}{'ускорение':>11}")
+    for name, before, after in run(args.number):
+        print(f"{name:<34}{before:>12.3f}{after:>12.3f}{before / after:>10.2f}x")
+
+if __name__ == "__main__":
+    main()
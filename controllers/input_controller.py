@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from models.bibliography_item import BibliographyItem
+from models.model_events import BibliographyEvent
 from utils.reference_parser import ReferenceParser
 
 class InputController:
@@ -26,9 +27,15 @@ class InputController:
         self.view.add_structured_bibliography_signal.connect(self.add_structured_bibliography)
         self.view.edit_bibliography_signal.connect(self.edit_bibliography)
         self.view.update_item_property_signal.connect(self.update_item_property)
+        self.view.sort_bibliography_signal.connect(self.sort_bibliography)
+        self.view.search_signal.connect(self.search)
         self.view.parse_text_signal.connect(self.parse_text)
         self.view.remove_item_signal.connect(self.remove_item)
         
+        # Подписка на изменения списка в модели: представление
+        # обновляется точечно по событиям
+        self.model.subscribe(self.on_model_event)
+        
         # Начальное обновление списка в представлении
         self.update_view()
     
@@ -48,9 +55,6 @@ class InputController:
         
         # Добавление в модель
         self.model.add_bibliography_item(item)
-        
-        # Обновление представления
-        self.update_view()
     
     def edit_bibliography(self, text, index, format_type):
         """
@@ -65,10 +69,7 @@ class InputController:
             return
         
         # Замена существующей записи
-        self.model.bibliography_list[index] = BibliographyItem(text)
-        
-        # Обновление представления
-        self.update_view()
+        self.model.replace_bibliography_item(index, BibliographyItem(text))
     
     def parse_text(self, text):
         """
@@ -98,14 +99,24 @@ class InputController:
         
         # Удаление записи из модели
         self.model.remove_bibliography_item(index)
-        
-        # Обновление представления
-        self.update_view()
     
     def update_view(self):
         """Обновление представления списка библиографических ссылок"""
         self.view.update_bibliography_list(self.model.bibliography_list)
     
+    def on_model_event(self, event):
+        """
+        Обработка события изменения библиографического списка в модели
+        
+        Args:
+            event (BibliographyEvent): Событие изменения списка
+        """
+        if event.kind == BibliographyEvent.RESET:
+            # Список заменен целиком (очистка, отмена очистки)
+            self.update_view()
+        else:
+            self.view.apply_bibliography_event(event)
+    
     def add_structured_bibliography(self, data):
         """
         Добавление новой библиографической ссылки из структурированных данных
@@ -117,7 +128,7 @@ class InputController:
             return
         
         # Создание объекта библиографической записи из словаря
-        item = BibliographyItem.from_dict(data)
+        item = BibliographyItem.from_dict(data, self.model.vocabularies)
         
         # Устанавливаем сырой текст ссылки (полную библиографическую ссылку)
         if 'raw_text' in data and data['raw_text']:
@@ -127,9 +138,6 @@ class InputController:
         
         # Добавление в модель
         self.model.add_bibliography_item(item)
-        
-        # Обновление представления
-        self.update_view()
     
     def update_item_property(self, index, property_name, value):
         """
@@ -143,5 +151,27 @@ class InputController:
         if index < 0 or index >= len(self.model.bibliography_list):
             return
             
-        # Обновление свойства
-        setattr(self.model.bibliography_list[index], property_name, value) 
\ No newline at end of file
+        # Обновление свойства (с записью в журнал отмены)
+        self.model.set_item_field(index, property_name, value)
+    
+    def sort_bibliography(self, key, reverse):
+        """
+        Сортировка библиографического списка
+        
+        Args:
+            key (callable): Ключ сортировки записи
+            reverse (bool): Сортировка по убыванию
+        """
+        self.model.sort_bibliography(key, reverse) 
+    
+    def search(self, text):
+        """
+        Поиск по таблице библиографических ссылок
+        
+        Args:
+            text (str): Поисковый запрос
+        """
+        # Если список совпадает с файлом проекта, поиск выполняется
+        # по его полнотекстовому индексу, иначе - перебором записей
+        indexed_matches = self.model.search_project(text) if text else None
+        self.view.apply_search(text, indexed_matches)
@@ -5,8 +5,10 @@ from views.input_tab import InputTab
 from views.criteria_tab import CriteriaTab
 from controllers.input_controller import InputController
 from controllers.criteria_controller import CriteriaController
-from utils.file_utils import read_file, save_file
-from models.bibliography_item import BibliographyItem
+from utils.file_utils import iter_file, save_file
+from utils.reference_parser import ReferenceParser
+from utils.reference_segmenter import ReferenceSegmenter
+from utils.section_locator import iter_bibliography_section
 
 class MainController:
     """
@@ -28,12 +30,19 @@ class MainController:
         # Подключение сигналов представления к обработчикам
         self.view.import_bibliography_signal.connect(self.import_bibliography)
         self.view.export_bibliography_signal.connect(self.export_bibliography)
+        self.view.open_project_signal.connect(self.open_project)
+        self.view.save_project_signal.connect(self.save_project)
+        self.view.create_bibliography_signal.connect(self.create_bibliography)
+        self.view.duplicate_bibliography_signal.connect(self.duplicate_bibliography)
+        self.view.switch_bibliography_signal.connect(self.switch_bibliography)
         
         # Инициализация вкладок
         self.init_tabs()
+        self.update_bibliography_names()
         
-        # Подключение обработчика отмены действия
+        # Подключение обработчиков отмены и повтора действия
         self.view.on_undo = self.undo_last_action
+        self.view.on_redo = self.redo_last_action
     
     def init_tabs(self):
         """Инициализация вкладок приложения и их контроллеров"""
@@ -67,26 +76,104 @@ class MainController:
             file_format (str): Формат файла (docx, pdf, txt)
         """
         try:
-            # Чтение текста из файла
-            text = read_file(file_path)
+            # Потоковое чтение файла порциями: по умолчанию только раздел
+            # списка литературы (PDF просматривается с конца)
+            if self.view.is_whole_document_import():
+                chunks = iter_file(file_path)
+            else:
+                chunks = iter_bibliography_section(file_path)
             
-            # Разделение текста на библиографические ссылки
-            # Предполагаем, что каждая ссылка находится на отдельной строке
-            references = [ref.strip() for ref in text.split('\n') if ref.strip()]
+            # Выделение ссылок: в PDF ссылка может быть перенесена на
+            # несколько строк, в DOCX и TXT каждая строка - отдельная ссылка
+            references = ReferenceSegmenter.segment(chunks, wrapped=file_format == 'pdf')
             
-            # Добавление каждой ссылки в модель
-            for ref in references:
-                item = BibliographyItem(ref)
-                self.model.add_bibliography_item(item)
-            
-            # Обновление представления
-            self.input_controller.update_view()
+            # Распознавание ссылок начинается до окончания чтения файла;
+            # добавление каждой распознанной ссылки в модель
+            # (импорт отменяется одним шагом, таблица получает одно
+            # событие вставки по окончании импорта)
+            with self.model.batch():
+                for item in ReferenceParser.parse_stream(references):
+                    self.model.add_bibliography_item(item)
             
             self.view.show_status_message(f"Файл {file_path} успешно импортирован")
             
         except Exception as e:
             self.view.show_error_message("Ошибка импорта", f"Не удалось импортировать файл: {str(e)}")
     
+    def open_project(self, file_path):
+        """
+        Открытие файла проекта
+        
+        Args:
+            file_path (str): Путь к файлу проекта
+        """
+        try:
+            self.model.open_project(file_path)
+            self.view.show_status_message(f"Проект {file_path} открыт")
+        except Exception as e:
+            self.view.show_error_message("Ошибка открытия проекта", f"Не удалось открыть проект: {str(e)}")
+    
+    def save_project(self, file_path):
+        """
+        Сохранение библиографического списка в файл проекта
+        
+        Args:
+            file_path (str): Путь к файлу проекта
+        """
+        try:
+            self.model.save_project(file_path)
+            self.view.show_status_message(f"Проект сохранен в {file_path}")
+        except Exception as e:
+            self.view.show_error_message("Ошибка сохранения проекта", f"Не удалось сохранить проект: {str(e)}")
+    
+    def update_bibliography_names(self):
+        """Передача представлению названий списков сеанса и текущего списка"""
+        self.view.update_bibliography_names(self.model.bibliography_names, self.model.active_bibliography)
+    
+    def create_bibliography(self, name):
+        """
+        Создание пустого списка и переход к нему
+        
+        Args:
+            name (str): Название списка
+        """
+        try:
+            self.model.create_bibliography(name)
+            self.model.switch_bibliography(name)
+            self.update_bibliography_names()
+            self.view.show_status_message(f"Создан список {name}")
+        except Exception as e:
+            self.view.show_error_message("Ошибка создания списка", str(e))
+    
+    def duplicate_bibliography(self, name):
+        """
+        Копирование текущего списка и переход к копии
+        
+        Args:
+            name (str): Название копии
+        """
+        try:
+            self.model.duplicate_bibliography(name)
+            self.model.switch_bibliography(name)
+            self.update_bibliography_names()
+            self.view.show_status_message(f"Создана копия списка: {name}")
+        except Exception as e:
+            self.view.show_error_message("Ошибка копирования списка", str(e))
+    
+    def switch_bibliography(self, name):
+        """
+        Переход к другому списку сеанса
+        
+        Args:
+            name (str): Название списка
+        """
+        try:
+            self.model.switch_bibliography(name)
+            self.update_bibliography_names()
+            self.view.show_status_message(f"Текущий список: {name}")
+        except Exception as e:
+            self.view.show_error_message("Ошибка переключения списка", str(e))
+    
     def export_bibliography(self, file_path, file_format):
         """
         Экспорт библиографического списка в файл
@@ -110,12 +197,17 @@ class MainController:
     def undo_last_action(self):
         """Отмена последнего действия"""
         if self.model.revert_to_previous():
-            # Обновление представления
-            self.input_controller.update_view()
             self.view.show_status_message("Последнее действие отменено")
         else:
             self.view.show_status_message("Нет действий для отмены")
     
+    def redo_last_action(self):
+        """Повтор последнего отмененного действия"""
+        if self.model.redo():
+            self.view.show_status_message("Отмененное действие повторено")
+        else:
+            self.view.show_status_message("Нет действий для повтора")
+    
     def add_bibliography_item(self, item):
         """
         Добавление библиографической записи
@@ -124,8 +216,6 @@ class MainController:
             item: Библиографическая запись для добавления
         """
         self.model.add_bibliography_item(item)
-        # Обновление представления
-        self.input_controller.update_view()
         self.view.show_status_message("Библиографическая запись добавлена")
     
     def remove_bibliography_item(self, index):
@@ -136,13 +226,9 @@ class MainController:
             index (int): Индекс записи для удаления
         """
         self.model.remove_bibliography_item(index)
-        # Обновление представления
-        self.input_controller.update_view()
         self.view.show_status_message("Библиографическая запись удалена")
     
     def clear_bibliography(self):
         """Очистка библиографического списка"""
         self.model.clear_bibliography()
-        # Обновление представления
-        self.input_controller.update_view()
         self.view.show_status_message("Библиографический список очищен") 
\ No newline at end of file
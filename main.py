@@ -1,22 +1,61 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 import sys
 from PyQt5.QtWidgets import QApplication
 from controllers.main_controller import MainController
 from models.app_model import AppModel
+from models.autosave_log import AutosaveLog
 from views.main_window import MainWindow
+from utils.reference_parser import ReferenceParser
+
+# Файл кэша распознанных ссылок, сохраняемого между запусками
+PARSE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".biblioanalytics", "parse_cache.json")
+
+# Каталог автосохранения (файлы удаляются при штатном завершении)
+AUTOSAVE_DIR = os.path.join(os.path.expanduser("~"), ".biblioanalytics", "autosave")
 
 def main():
     """Точка входа в приложение"""
     app = QApplication(sys.argv)
     app.setApplicationName("БиблиоАналитика")
     
+    # Кэш результатов распознавания: повторяющиеся ссылки не разбираются заново
+    parse_cache = ReferenceParser.enable_cache(path=PARSE_CACHE_PATH)
+    app.aboutToQuit.connect(parse_cache.save)
+    
     # Инициализация основных компонентов MVC
     model = AppModel()
     view = MainWindow()
     controller = MainController(model, view)
     
+    # Распознанные записи разделяют строки журналов, издательств и авторов
+    # со словарями модели
+    ReferenceParser.enable_vocabularies(model.vocabularies)
+    
+    # Восстановление списка после аварийного завершения прошлого сеанса
+    # и автосохранение изменений текущего
+    autosave = AutosaveLog(AUTOSAVE_DIR)
+    try:
+        recovered = autosave.recover()
+    except Exception as e:
+        recovered = None
+        view.show_error_message("Ошибка восстановления", f"Не удалось восстановить список: {str(e)}")
+    if recovered is not None:
+        active, bibliographies = recovered
+        count = sum(len(items) for items in bibliographies.values())
+        if count or len(bibliographies) > 1:
+            model.restore_bibliographies(bibliographies, active)
+            controller.update_bibliography_names()
+            view.show_status_message(
+                f"Восстановлено после аварийного завершения списков: {len(bibliographies)}, записей: {count}"
+            )
+    model.enable_autosave(autosave)
+    app.aboutToQuit.connect(model.disable_autosave)
+    # Файлы проектов и архивов закрываются после остановки автосохранения
+    app.aboutToQuit.connect(model.close)
+    
     # Запуск главного окна
     view.show()
     
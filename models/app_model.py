@@ -1,18 +1,64 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+from collections import deque
+from contextlib import contextmanager
+from models.bibliography_snapshot import BibliographySnapshot
+from models.bibliography_store import BibliographyStore
+from models.edit_journal import EditJournal
+from models.model_events import BibliographyEvent
+from models.project_store import ProjectStore
+from models.binary_project import BinaryProjectReader, BinaryProjectWriter, LazyItemList
+from models.vocabulary import Vocabularies
+
 class AppModel:
     """
     Основная модель приложения.
     Содержит данные и бизнес-логику приложения.
     """
     
+    # Расширение файлов двоичного архива (остальные файлы - проекты SQLite)
+    ARCHIVE_EXTENSION = '.bibarc'
+    # Количество последних операций, доступных через changes_since
+    CHANGE_HISTORY = 256
+    # Название списка, с которым начинается сеанс
+    DEFAULT_BIBLIOGRAPHY = "Основной список"
+    
     def __init__(self):
         """Инициализация модели приложения"""
-        # Текущий библиографический список
-        self._bibliography_list = []
-        # История библиографических списков
-        self._history = []
+        # Словари повторяющихся значений полей записей (журналы, авторы...),
+        # общие для всех списков модели
+        self._vocabularies = Vocabularies()
+        # Текущий библиографический список (колоночное хранилище,
+        # ведущее себя как список записей)
+        self._bibliography_list = BibliographyStore(vocabularies=self._vocabularies)
+        # Журнал отмены и повтора изменений библиографического списка
+        self._journal = EditJournal()
+        # Операции текущего пакетного изменения (None - вне пакета)
+        self._batch = None
+        # Подписчики на изменения библиографического списка и события,
+        # накопленные за пакетное изменение (None - события отправляются сразу)
+        self._listeners = []
+        self._pending_events = None
+        # Открытый файл проекта и признак изменения списка после его
+        # открытия или сохранения
+        self._project = None
+        self._project_modified = False
+        # Архивы, открытые моделью (BinaryProjectReader): из них
+        # декодируются записи ленивых списков, в том числе в журналах отмены
+        self._archives = []
+        # Журнал автосохранения (AutosaveLog или None)
+        self._autosave = None
+        # Версия списка (увеличивается каждой операцией), последние
+        # операции и последний снимок списка
+        self._version = 0
+        self._changes = deque(maxlen=AppModel.CHANGE_HISTORY)
+        self._snapshot = None
+        # Именованные списки сеанса: название текущего и состояние
+        # остальных (список, журнал отмены, файл проекта, признак изменения)
+        self._active_bibliography = AppModel.DEFAULT_BIBLIOGRAPHY
+        self._bibliographies = {AppModel.DEFAULT_BIBLIOGRAPHY: None}
         # Критерии проверки
         self._criteria = {
             # Английские источники
@@ -43,17 +89,240 @@ class AppModel:
             'specified_author': ''  # Новое поле для хранения ФИО указанного автора
         }
     
+    @property
+    def vocabularies(self):
+        """Словари повторяющихся значений полей записей (Vocabularies)"""
+        return self._vocabularies
+    
+    @property
+    def version(self):
+        """Версия библиографического списка (номер последней операции)"""
+        return self._version
+    
+    def snapshot(self):
+        """
+        Неизменяемый снимок текущего списка для чтения из фоновых потоков
+        (создается за O(1); пока список не изменился, возвращается тот же)
+        
+        Returns:
+            BibliographySnapshot: Снимок списка
+        """
+        if self._snapshot is None:
+            self._snapshot = BibliographySnapshot(self._bibliography_list.freeze(), self._version, self)
+        return self._snapshot
+    
+    def changes_since(self, version):
+        """
+        Операции над списком после указанной версии (для исправления
+        результатов, посчитанных по устаревшему снимку)
+        
+        Args:
+            version (int): Версия списка (например, BibliographySnapshot.version)
+        
+        Returns:
+            list: Операции в порядке применения (см. EditJournal) или None,
+                если версия старше CHANGE_HISTORY последних операций
+        """
+        count = self._version - version
+        if count < 0 or count > len(self._changes):
+            return None
+        return list(self._changes)[len(self._changes) - count:]
+    
+    @property
+    def bibliography_names(self):
+        """Названия списков сеанса в порядке создания"""
+        return list(self._bibliographies)
+    
+    @property
+    def active_bibliography(self):
+        """Название текущего списка"""
+        return self._active_bibliography
+    
+    def get_bibliography(self, name):
+        """
+        Получить список по названию (например, для сравнения с текущим)
+        
+        Args:
+            name (str): Название списка
+        
+        Returns:
+            BibliographyStore: Библиографический список
+        """
+        self._check_bibliography(name)
+        if name == self._active_bibliography:
+            return self._bibliography_list
+        return self._bibliographies[name][0]
+    
+    def create_bibliography(self, name):
+        """
+        Создать пустой список (текущим остается прежний)
+        
+        Args:
+            name (str): Название нового списка
+        """
+        self._check_new_bibliography(name)
+        self._bibliographies[name] = (BibliographyStore(vocabularies=self._vocabularies), EditJournal(), None, False)
+        self._record_autosave(('create_list', name))
+    
+    def duplicate_bibliography(self, name, source=None):
+        """
+        Создать копию списка за O(1): записи разделяются с исходным списком
+        до их изменения в одном из списков (см. BibliographyStore.copy)
+        
+        Args:
+            name (str): Название копии
+            source (str): Название исходного списка (по умолчанию - текущий)
+        """
+        self._check_new_bibliography(name)
+        if source is None:
+            source = self._active_bibliography
+        store = self.get_bibliography(source)
+        self._bibliographies[name] = (store.copy(), EditJournal(), None, False)
+        self._record_autosave(('duplicate_list', name, source))
+    
+    def rename_bibliography(self, name, new_name):
+        """
+        Переименовать список
+        
+        Args:
+            name (str): Название списка
+            new_name (str): Новое название
+        """
+        self._check_bibliography(name)
+        self._check_new_bibliography(new_name)
+        # Порядок списков сохраняется
+        self._bibliographies = {
+            (new_name if key == name else key): state for key, state in self._bibliographies.items()
+        }
+        if self._active_bibliography == name:
+            self._active_bibliography = new_name
+        self._record_autosave(('rename_list', name, new_name))
+    
+    def remove_bibliography(self, name):
+        """
+        Удалить список (кроме текущего)
+        
+        Args:
+            name (str): Название списка
+        """
+        self._check_bibliography(name)
+        if name == self._active_bibliography:
+            raise Exception("Нельзя удалить текущий список")
+        project = self._bibliographies.pop(name)[2]
+        if project is not None:
+            project.close()
+        self._record_autosave(('remove_list', name))
+    
+    def switch_bibliography(self, name):
+        """
+        Сделать текущим другой список. У каждого списка свои журнал
+        отмены и файл проекта; автосохранение ведется для всех списков
+        
+        Args:
+            name (str): Название списка
+        """
+        self._check_bibliography(name)
+        if name == self._active_bibliography:
+            return
+        if self._batch is not None:
+            raise Exception("Нельзя сменить список во время пакетного изменения")
+        
+        self._bibliographies[self._active_bibliography] = (
+            self._bibliography_list, self._journal, self._project, self._project_modified
+        )
+        self._bibliography_list, self._journal, self._project, project_modified = self._bibliographies[name]
+        self._bibliographies[name] = None
+        self._active_bibliography = name
+        
+        # Снимки и операции прежнего списка к новому не относятся
+        self._version += 1
+        self._changes.clear()
+        self._snapshot = None
+        self._notify(BibliographyEvent(BibliographyEvent.RESET))
+        self._project_modified = project_modified
+        self._record_autosave(('switch_list', name))
+    
+    def restore_bibliographies(self, bibliographies, active):
+        """
+        Заменить списки сеанса восстановленными (например, после
+        аварийного завершения, см. AutosaveLog.recover). Журналы отмены
+        списков начинаются заново
+        
+        Args:
+            bibliographies (dict): Записи списков по названиям
+            active (str): Название текущего списка
+        """
+        if active not in bibliographies:
+            raise Exception(f"Список не найден: {active}")
+        if self._batch is not None:
+            raise Exception("Нельзя заменить списки во время пакетного изменения")
+        # Прежние списки и журналы отмены заменяются, их файлы закрываются
+        self.close()
+        
+        stores = {}
+        for name, items in bibliographies.items():
+            if isinstance(items, LazyItemList):
+                # Архив, открытый при восстановлении, принадлежит модели
+                if items.reader not in self._archives:
+                    items.reader.vocabularies = self._vocabularies
+                    self._archives.append(items.reader)
+                items = BibliographyStore.lazy(items, self._vocabularies)
+            elif not isinstance(items, BibliographyStore):
+                items = BibliographyStore(items, self._vocabularies)
+            stores[name] = items
+        self._bibliographies = {name: (store, EditJournal(), None, True) for name, store in stores.items()}
+        self._bibliographies[active] = None
+        self._active_bibliography = active
+        self._bibliography_list = stores[active]
+        self._journal = EditJournal()
+        
+        self._version += 1
+        self._changes.clear()
+        self._snapshot = None
+        self._notify(BibliographyEvent(BibliographyEvent.RESET))
+        if self._autosave is not None:
+            self._autosave.compact()
+    
+    def _autosave_state(self):
+        """
+        Состояние списков для снимка автосохранения
+        
+        Returns:
+            tuple: (название текущего списка, [(название, список), ...])
+        """
+        return self._active_bibliography, [
+            (name, self._bibliography_list if state is None else state[0])
+            for name, state in self._bibliographies.items()
+        ]
+    
+    def _record_autosave(self, operation):
+        """Запись операции в журнал автосохранения (если оно включено)"""
+        if self._autosave is not None:
+            self._autosave.record(operation)
+    
+    def _check_bibliography(self, name):
+        """Проверка существования списка с названием name"""
+        if name not in self._bibliographies:
+            raise Exception(f"Список не найден: {name}")
+    
+    def _check_new_bibliography(self, name):
+        """Проверка названия нового списка"""
+        if not name or not name.strip():
+            raise Exception("Название списка не может быть пустым")
+        if name in self._bibliographies:
+            raise Exception(f"Список с названием {name} уже существует")
+    
     @property
     def bibliography_list(self):
         """Получить текущий библиографический список"""
         return self._bibliography_list
-        
+    
     @bibliography_list.setter
     def bibliography_list(self, value):
-        """Установить текущий библиографический список и добавить в историю"""
-        if self._bibliography_list:
-            self._history.append(self._bibliography_list.copy())
-        self._bibliography_list = value
+        """Установить текущий библиографический список (с записью в журнал)"""
+        if not isinstance(value, BibliographyStore):
+            value = BibliographyStore(value, self._vocabularies)
+        self._execute(('assign', self._bibliography_list, value))
     
     @property
     def criteria(self):
@@ -66,28 +335,371 @@ class AppModel:
         self._criteria = value
     
     @property
-    def history(self):
-        """Получить историю библиографических списков"""
-        return self._history
+    def journal(self):
+        """Получить журнал отмены и повтора изменений"""
+        return self._journal
+    
+    @property
+    def project(self):
+        """Получить открытый файл проекта (ProjectStore или None)"""
+        return self._project
+    
+    def is_project_current(self):
+        """
+        Совпадает ли библиографический список с открытым файлом проекта
+        
+        Returns:
+            bool: True, если проект открыт и список не изменялся после
+                открытия или сохранения
+        """
+        return self._project is not None and not self._project_modified
+    
+    def open_project(self, path):
+        """
+        Открыть файл проекта и загрузить из него библиографический список
+        (открытие отменяется как замена списка). Двоичный архив открывается
+        без загрузки: записи декодируются при первом обращении, файл
+        остается открытым до закрытия проекта
+        
+        Args:
+            path (str): Путь к файлу проекта или архива
+        """
+        if path.lower().endswith(AppModel.ARCHIVE_EXTENSION):
+            reader = BinaryProjectReader(path, self._vocabularies)
+            self.close_project()
+            self._archives.append(reader)
+            self.bibliography_list = BibliographyStore.lazy(LazyItemList(reader), self._vocabularies)
+            return
+        
+        project = ProjectStore(path)
+        try:
+            items = project.load(self._vocabularies)
+        except Exception:
+            project.close()
+            raise
+        self.close_project()
+        self.bibliography_list = items
+        self._project = project
+        self._project_modified = False
+    
+    def save_project(self, path=None):
+        """
+        Сохранить библиографический список в файл проекта
+        
+        Args:
+            path (str): Путь к файлу проекта или архива; None - открытый проект
+        """
+        if path is not None and path.lower().endswith(AppModel.ARCHIVE_EXTENSION):
+            # Архив записывается потоково во временный файл и заменяет
+            # прежний. Открытый прежний файл переносится в память: записи
+            # списков из него остаются доступными, а отображенный в память
+            # файл заменить нельзя (Windows)
+            replaced = [
+                reader for reader in self._archives
+                if reader.mapped and os.path.exists(path) and os.path.samefile(reader.path, path)
+            ]
+            for reader in replaced:
+                reader.detach()
+            BinaryProjectWriter.write(path, self._bibliography_list)
+            # Снимок автосохранения ссылался на номера записей прежнего файла
+            if replaced and self._autosave is not None:
+                self._autosave.compact()
+            return
+        if path is not None and (self._project is None or path != self._project.path):
+            project = ProjectStore(path)
+            self.close_project()
+            self._project = project
+        if self._project is None:
+            raise Exception("Файл проекта не указан")
+        self._project.save(self._bibliography_list)
+        self._project_modified = False
+    
+    def close_project(self):
+        """
+        Закрыть файл проекта (библиографический список сохраняется
+        в памяти). Открытые архивы переносятся в память: их файлы
+        закрываются, а записи ленивых списков остаются доступными
+        """
+        if self._project is not None:
+            self._project.close()
+            self._project = None
+        for reader in self._archives:
+            reader.detach()
+    
+    def close(self):
+        """
+        Закрыть все файлы проектов и архивов (при завершении работы;
+        записи ленивых списков, не декодированные до этого, недоступны)
+        """
+        if self._project is not None:
+            self._project.close()
+            self._project = None
+        for state in self._bibliographies.values():
+            if state is not None and state[2] is not None:
+                state[2].close()
+        for reader in self._archives:
+            reader.close()
+        self._archives = []
+    
+    def enable_autosave(self, autosave):
+        """
+        Включить автосохранение: все последующие изменения списков
+        сеанса дописываются в журнал автосохранения
+        
+        Args:
+            autosave (AutosaveLog): Журнал автосохранения
+        """
+        self._autosave = autosave
+        autosave.start(self._autosave_state)
+    
+    def disable_autosave(self, remove=True):
+        """
+        Выключить автосохранение
+        
+        Args:
+            remove (bool): Удалить файлы автосохранения (штатное завершение)
+        """
+        if self._autosave is not None:
+            self._autosave.close(remove)
+            self._autosave = None
+    
+    def search_project(self, text):
+        """
+        Поиск записей по полнотекстовому индексу файла проекта
+        
+        Args:
+            text (str): Искомая подстрока
+        
+        Returns:
+            list: Индексы найденных записей или None, если список
+                не совпадает с файлом проекта или запрос не может быть
+                выполнен по индексу (поиск в записях тогда быстрее)
+        """
+        if not self.is_project_current() or not self._project.is_indexed_query(text):
+            return None
+        return self._project.search(text)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Пакетное изменение: операции внутри блока with отменяются
+        и повторяются одним шагом (например, импорт файла)
+        """
+        if self._batch is not None:
+            yield
+            return
+        self._batch = []
+        self._pending_events = []
+        try:
+            yield
+        finally:
+            operations, self._batch = self._batch, None
+            self._journal.record(operations)
+            self._flush_events()
+    
+    def subscribe(self, listener):
+        """
+        Подписка на изменения библиографического списка
+        
+        Args:
+            listener (callable): Обработчик, принимающий BibliographyEvent
+        """
+        self._listeners.append(listener)
+    
+    def unsubscribe(self, listener):
+        """
+        Отмена подписки на изменения библиографического списка
+        
+        Args:
+            listener (callable): Обработчик, переданный в subscribe
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
     
     def add_bibliography_item(self, item):
         """Добавить элемент в библиографический список"""
-        self._bibliography_list.append(item)
+        self._execute(('insert', len(self._bibliography_list), item))
     
     def remove_bibliography_item(self, index):
         """Удалить элемент из библиографического списка по индексу"""
         if 0 <= index < len(self._bibliography_list):
-            del self._bibliography_list[index]
-            
+            self._execute(('remove', index, self._bibliography_list[index]))
+    
+    def replace_bibliography_item(self, index, item):
+        """Заменить элемент библиографического списка по индексу"""
+        if 0 <= index < len(self._bibliography_list):
+            self._execute(('replace', index, self._bibliography_list[index], item))
+    
+    def set_item_field(self, index, name, value):
+        """Изменить поле элемента библиографического списка по индексу"""
+        if 0 <= index < len(self._bibliography_list):
+            old_value = getattr(self._bibliography_list[index], name)
+            if old_value != value:
+                self._execute(('set_field', index, name, old_value, value))
+    
+    def sort_bibliography(self, key=None, reverse=False):
+        """Отсортировать библиографический список"""
+        order = self._bibliography_list.sort_order(key, reverse)
+        if order != list(range(len(order))):
+            self._execute(('reorder', order))
+    
     def clear_bibliography(self):
         """Очистить текущий библиографический список"""
         if self._bibliography_list:
-            self._history.append(self._bibliography_list.copy())
-        self._bibliography_list = []
+            self._execute(('assign', self._bibliography_list, BibliographyStore(vocabularies=self._vocabularies)))
+    
+    def undo(self):
+        """
+        Отменить последний шаг изменений библиографического списка
+        
+        Returns:
+            bool: True, если шаг отменен
+        """
+        operations = self._journal.pop_undo()
+        if operations is None:
+            return False
+        self._pending_events = []
+        for operation in reversed(operations):
+            self._apply(EditJournal.inverse(operation))
+        self._flush_events()
+        return True
+    
+    def redo(self):
+        """
+        Повторить последний отмененный шаг изменений
+        
+        Returns:
+            bool: True, если шаг повторен
+        """
+        operations = self._journal.pop_redo()
+        if operations is None:
+            return False
+        self._pending_events = []
+        for operation in operations:
+            self._apply(operation)
+        self._flush_events()
+        return True
     
     def revert_to_previous(self):
         """Вернуться к предыдущему состоянию библиографического списка"""
-        if self._history:
-            self._bibliography_list = self._history.pop()
-            return True
-        return False 
\ No newline at end of file
+        return self.undo()
+    
+    def _execute(self, operation):
+        """
+        Выполнение операции и ее запись в журнал (или в текущий пакет)
+        
+        Args:
+            operation (tuple): Операция (см. EditJournal)
+        """
+        self._apply(operation)
+        if self._batch is not None:
+            self._batch.append(operation)
+        else:
+            self._journal.record([operation])
+    
+    def _apply(self, operation):
+        """
+        Применение операции к библиографическому списку
+        
+        Args:
+            operation (tuple): Операция (см. EditJournal)
+        """
+        kind = operation[0]
+        store = self._bibliography_list
+        if kind == 'insert':
+            store.insert(operation[1], operation[2])
+            self._notify(BibliographyEvent(BibliographyEvent.INSERTED, operation[1], operation[1]))
+        elif kind == 'remove':
+            del store[operation[1]]
+            self._notify(BibliographyEvent(BibliographyEvent.REMOVED, operation[1], operation[1]))
+        elif kind == 'replace':
+            store[operation[1]] = operation[3]
+            self._notify(BibliographyEvent(BibliographyEvent.CHANGED, operation[1], operation[1]))
+        elif kind == 'set_field':
+            # Запись, входящая в снимок, заменяется копией
+            setattr(store.writable_item(operation[1]), operation[2], operation[4])
+            store.refresh(operation[1])
+            self._notify(BibliographyEvent(BibliographyEvent.CHANGED, operation[1], operation[1]))
+        elif kind == 'assign':
+            self._bibliography_list = operation[2]
+            self._notify(BibliographyEvent(BibliographyEvent.RESET))
+        elif kind == 'reorder':
+            store.reorder(operation[1])
+            self._notify(BibliographyEvent(BibliographyEvent.MOVED, 0, len(store) - 1, operation[1]))
+        else:
+            raise Exception(f"Неизвестная операция журнала: {kind}")
+        
+        self._version += 1
+        self._changes.append(operation)
+        # Снимок прежней версии остается у фоновых задач, модель его не держит
+        self._snapshot = None
+        self._record_autosave(operation)
+    
+    def _notify(self, event):
+        """
+        Отправка события подписчикам (в пакетном изменении - накопление
+        с объединением соседних вставок, удалений и изменений)
+        
+        Args:
+            event (BibliographyEvent): Событие
+        """
+        self._project_modified = True
+        if self._pending_events is None:
+            for listener in list(self._listeners):
+                listener(event)
+            return
+        
+        pending = self._pending_events
+        if pending and AppModel._merge_events(pending[-1], event):
+            return
+        pending.append(event)
+    
+    def _flush_events(self):
+        """Отправка событий, накопленных за пакетное изменение"""
+        events, self._pending_events = self._pending_events, None
+        if not events:
+            return
+        # Несколько событий, оставшихся после объединения, индексируют
+        # промежуточные состояния списка, а подписчики читают записи
+        # по индексам из итогового списка, поэтому такие события заменяются
+        # одним событием RESET. Исключение - только изменения записей:
+        # они не сдвигают индексы
+        if len(events) > 1 and any(event.kind != BibliographyEvent.CHANGED for event in events):
+            events = [BibliographyEvent(BibliographyEvent.RESET)]
+        for event in events:
+            self._notify(event)
+    
+    @staticmethod
+    def _merge_events(previous, event):
+        """
+        Объединение события с предыдущим, если они описывают один
+        непрерывный диапазон записей
+        
+        Args:
+            previous (BibliographyEvent): Предыдущее событие (изменяется на месте)
+            event (BibliographyEvent): Новое событие
+        
+        Returns:
+            bool: True, если событие объединено с предыдущим
+        """
+        if previous.kind != event.kind:
+            return False
+        if event.kind == BibliographyEvent.INSERTED:
+            # Вставка сразу после вставленного диапазона
+            if event.first == previous.last + 1:
+                previous.last = event.last
+                return True
+        elif event.kind == BibliographyEvent.REMOVED:
+            # Удаление на месте удаленного диапазона или перед ним
+            if event.first == previous.first:
+                previous.last += event.count
+                return True
+            if event.last == previous.first - 1:
+                previous.first = event.first
+                return True
+        elif event.kind == BibliographyEvent.CHANGED:
+            if event.first <= previous.last + 1 and event.last >= previous.first - 1:
+                previous.first = min(previous.first, event.first)
+                previous.last = max(previous.last, event.last)
+                return True
+        return False
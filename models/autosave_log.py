@@ -0,0 +1,411 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import os
+import queue
+import threading
+import time
+from models.bibliography_item import BibliographyItem
+from models.bibliography_store import BibliographyStore
+from models.binary_project import BinaryProjectReader, LazyItemList
+
+class AutosaveLog:
+    """
+    Журнал автосохранения библиографических списков сеанса для
+    восстановления после аварийного завершения.
+    
+    Изменения текущего списка и операции над списками сеанса (создание,
+    копирование, переименование, удаление, смена текущего) дописываются
+    в файл journal.jsonl (строка JSON на операцию), периодически все
+    списки записываются в снимок snapshot.json под своими названиями,
+    после чего журнал начинается заново. Список, открытый из архива
+    (.bibarc), записывается в снимок ссылкой на файл архива и номерами
+    еще не декодированных записей, поэтому снимок не декодирует архив.
+    Снимок и журнал
+    помечены номером поколения: журнал, не совпадающий по поколению
+    со снимком, при восстановлении не применяется.
+    
+    Запись в файлы и fsync выполняет фоновый поток: поток графического
+    интерфейса только ставит операции в очередь, а поток записывает все
+    накопившиеся операции одной порцией.
+    
+    При штатном завершении (close) файлы удаляются, поэтому их наличие
+    при запуске означает аварийное завершение прошлого сеанса.
+    """
+    
+    SNAPSHOT_FILE = 'snapshot.json'
+    JOURNAL_FILE = 'journal.jsonl'
+    
+    def __init__(self, directory, compact_every=1000, flush_delay=0.2):
+        """
+        Инициализация журнала
+        
+        Args:
+            directory (str): Каталог файлов автосохранения
+            compact_every (int): Количество операций, после которого
+                журнал сворачивается в снимок
+            flush_delay (float): Задержка записи, с: операции, поступившие
+                за это время, записываются одной порцией
+        """
+        self.directory = directory
+        self.compact_every = compact_every
+        self.flush_delay = flush_delay
+        self.snapshot_path = os.path.join(directory, AutosaveLog.SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, AutosaveLog.JOURNAL_FILE)
+        # Ошибка записи в фоновом потоке (после нее запись прекращается)
+        self.error = None
+        self._queue = queue.Queue()
+        self._thread = None
+        self._generation = 0
+        self._operations = 0
+        # Источник состояния списков для снимка (см. start)
+        self._source = None
+    
+    # Восстановление
+    
+    def recover(self):
+        """
+        Восстановление списков по снимку и журналу прошлого сеанса
+        
+        Returns:
+            tuple: (название текущего списка, {название: записи}) или None,
+                если прошлый сеанс завершился штатно (файлов
+                автосохранения нет). Записи списка из архива - LazyItemList
+                над заново открытым архивом
+        """
+        if not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError) as e:
+            raise Exception(f"Ошибка при чтении снимка автосохранения: {str(e)}")
+        
+        readers = {}
+        try:
+            bibliographies = {
+                name: AutosaveLog._load_items(entry, readers) for name, entry in snapshot['bibliographies']
+            }
+        except Exception:
+            for reader in readers.values():
+                reader.close()
+            raise
+        state = {'active': snapshot['active'], 'bibliographies': bibliographies}
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as file:
+                lines = iter(file)
+                header = AutosaveLog._read_record(next(lines, ''))
+                # Журнал предыдущего поколения не применяется: снимок
+                # уже содержит его изменения
+                if header is not None and header.get('generation') == snapshot['generation']:
+                    for line in lines:
+                        record = AutosaveLog._read_record(line)
+                        if record is None:
+                            # Строка, не дописанная до аварийного завершения
+                            break
+                        AutosaveLog._replay(state, record)
+        return state['active'], state['bibliographies']
+    
+    @staticmethod
+    def _load_items(entry, readers):
+        """
+        Записи списка из снимка
+        
+        Args:
+            entry (list | dict): Записи списка в снимке (см. _encode_items)
+            readers (dict): Открытые архивы по путям (пополняется)
+        
+        Returns:
+            list | LazyItemList: Библиографические записи
+        """
+        if isinstance(entry, list):
+            return [BibliographyItem.from_dict(data) for data in entry]
+        path = entry['archive']
+        reader = readers.get(path)
+        if reader is None:
+            reader = BinaryProjectReader(path)
+            if reader.size != entry['size'] or reader.mtime_ns != entry['mtime_ns']:
+                reader.close()
+                raise Exception(f"Архив {path} изменен после автосохранения")
+            readers[path] = reader
+        return LazyItemList.from_slots(reader, [
+            slot if isinstance(slot, int) else BibliographyItem.from_dict(slot) for slot in entry['items']
+        ])
+    
+    @staticmethod
+    def _read_record(line):
+        """
+        Разбор строки журнала
+        
+        Args:
+            line (str): Строка журнала
+        
+        Returns:
+            object: Запись или None, если строка пустая или повреждена
+        """
+        if not line.endswith('\n'):
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _replay(state, record):
+        """
+        Применение записи журнала к спискам
+        
+        Args:
+            state (dict): Название текущего списка (active) и списки
+                по названиям (bibliographies); изменяется на месте
+            record (list): Запись журнала (см. _encode)
+        """
+        kind = record[0]
+        bibliographies = state['bibliographies']
+        if kind == 'create_list':
+            bibliographies[record[1]] = []
+            return
+        if kind == 'duplicate_list':
+            source = bibliographies[record[2]]
+            if isinstance(source, LazyItemList):
+                bibliographies[record[1]] = source.copy(copy_items=True)
+            else:
+                bibliographies[record[1]] = copy.deepcopy(source)
+            return
+        if kind == 'rename_list':
+            # Порядок списков сохраняется
+            state['bibliographies'] = {
+                (record[2] if name == record[1] else name): items for name, items in bibliographies.items()
+            }
+            if state['active'] == record[1]:
+                state['active'] = record[2]
+            return
+        if kind == 'remove_list':
+            del bibliographies[record[1]]
+            return
+        if kind == 'switch_list':
+            state['active'] = record[1]
+            return
+        
+        items = bibliographies[state['active']]
+        if kind == 'insert':
+            items.insert(record[1], BibliographyItem.from_dict(record[2]))
+        elif kind == 'remove':
+            del items[record[1]]
+        elif kind == 'replace':
+            items[record[1]] = BibliographyItem.from_dict(record[2])
+        elif kind == 'set_field':
+            setattr(items[record[1]], record[2], record[3])
+        elif kind == 'reorder':
+            if isinstance(items, LazyItemList):
+                items.reorder(record[1])
+            else:
+                items[:] = [items[index] for index in record[1]]
+        else:
+            raise Exception(f"Неизвестная операция журнала автосохранения: {kind}")
+    
+    # Запись
+    
+    def start(self, source):
+        """
+        Начало автосохранения: запуск фонового потока и запись снимка
+        списков сеанса
+        
+        Args:
+            source (callable): Функция без аргументов, возвращающая
+                состояние списков для снимка: (название текущего списка,
+                [(название, записи), ...])
+        """
+        if self._thread is not None:
+            return
+        self._source = source
+        os.makedirs(self.directory, exist_ok=True)
+        # Поколения уникальны между сеансами: журнал прошлого сеанса
+        # не совпадет по поколению со снимком нового
+        self._generation = time.time_ns()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+        self.compact()
+    
+    def record(self, operation):
+        """
+        Постановка операции в очередь записи
+        
+        Args:
+            operation (tuple): Операция над текущим списком (см. EditJournal)
+                или над списками сеанса: ('create_list', название),
+                ('duplicate_list', название, исходный список),
+                ('rename_list', название, новое название),
+                ('remove_list', название), ('switch_list', название)
+        """
+        if self._thread is None:
+            return
+        if operation[0] == 'assign' or self._operations >= self.compact_every:
+            # Замена списка целиком записывается снимком
+            self.compact()
+            return
+        self._queue.put(('record', AutosaveLog._encode(operation)))
+        self._operations += 1
+    
+    def close(self, remove=True):
+        """
+        Остановка автосохранения с записью всех операций из очереди
+        
+        Args:
+            remove (bool): Удалить файлы автосохранения (штатное завершение)
+        """
+        if self._thread is None:
+            return
+        self._queue.put(('stop', None))
+        self._thread.join()
+        self._thread = None
+        if remove:
+            for path in (self.journal_path, self.snapshot_path):
+                if os.path.exists(path):
+                    os.remove(path)
+    
+    def compact(self):
+        """Постановка в очередь снимка всех списков (журнал начинается заново)"""
+        if self._thread is None:
+            return
+        active, bibliographies = self._source()
+        # Снимок хранилища фиксирует состав списка и поля записей;
+        # для списка из архива берутся ячейки без декодирования записей
+        snapshot = []
+        for name, items in bibliographies:
+            if isinstance(items, BibliographyStore):
+                frozen = items.freeze()
+                archive = frozen.archive_slots()
+                snapshot.append((name, archive if archive is not None else frozen))
+            else:
+                snapshot.append((name, list(items)))
+        self._generation += 1
+        self._operations = 0
+        self._queue.put(('snapshot', (self._generation, active, snapshot)))
+    
+    @staticmethod
+    def _encode(operation):
+        """
+        Запись журнала для операции (записи заменяются словарями to_dict)
+        
+        Args:
+            operation (tuple): Операция (см. EditJournal)
+        
+        Returns:
+            list: Запись журнала
+        """
+        kind = operation[0]
+        if kind in ('create_list', 'duplicate_list', 'rename_list', 'remove_list', 'switch_list'):
+            return list(operation)
+        if kind == 'insert':
+            return ['insert', operation[1], operation[2].to_dict()]
+        if kind == 'remove':
+            return ['remove', operation[1]]
+        if kind == 'replace':
+            return ['replace', operation[1], operation[3].to_dict()]
+        if kind == 'set_field':
+            return ['set_field', operation[1], operation[2], operation[4]]
+        if kind == 'reorder':
+            return ['reorder', operation[1]]
+        raise Exception(f"Неизвестная операция журнала: {kind}")
+    
+    def _run(self):
+        """Фоновый поток записи"""
+        journal = None
+        stopping = False
+        while not stopping:
+            entries = [self._queue.get()]
+            # Операции, поступившие за время задержки, записываются вместе
+            time.sleep(self.flush_delay)
+            while True:
+                try:
+                    entries.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            if self.error is not None:
+                stopping = any(kind == 'stop' for kind, _ in entries)
+                continue
+            
+            try:
+                lines = []
+                for kind, value in entries:
+                    if kind == 'record':
+                        lines.append(json.dumps(value, ensure_ascii=False) + '\n')
+                    elif kind == 'snapshot':
+                        # Снимок заменяет журнал: операции до него не нужны
+                        lines = []
+                        if journal is not None:
+                            journal.close()
+                        journal = self._write_snapshot(*value)
+                    elif kind == 'stop':
+                        stopping = True
+                if lines and journal is not None:
+                    journal.write(''.join(lines))
+                    journal.flush()
+                    os.fsync(journal.fileno())
+            except Exception as e:
+                self.error = e
+        
+        if journal is not None:
+            journal.close()
+    
+    def _write_snapshot(self, generation, active, bibliographies):
+        """
+        Запись снимка списков и начало нового журнала
+        
+        Args:
+            generation (int): Номер поколения
+            active (str): Название текущего списка
+            bibliographies (list): Списки [(название, записи или
+                (архив, ячейки)), ...]
+        
+        Returns:
+            file: Открытый файл нового журнала
+        """
+        temporary_path = self.snapshot_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({
+                'generation': generation,
+                'active': active,
+                'bibliographies': [[name, AutosaveLog._encode_items(items)] for name, items in bibliographies]
+            }, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        
+        journal = open(self.journal_path, 'w', encoding='utf-8')
+        journal.write(json.dumps({'generation': generation}) + '\n')
+        journal.flush()
+        os.fsync(journal.fileno())
+        return journal
+    
+    @staticmethod
+    def _encode_items(items):
+        """
+        Записи списка для снимка
+        
+        Args:
+            items (Sequence | tuple): Записи или (архив, ячейки) для списка
+                из архива (см. BibliographyStore.archive_slots)
+        
+        Returns:
+            list | dict: Словари to_dict или, если файл архива не изменился,
+                ссылка на архив (archive, size, mtime_ns) и ячейки (items):
+                номера не декодированных записей архива и словари остальных
+        """
+        if not isinstance(items, tuple):
+            return [item.to_dict() for item in items]
+        reader, slots = items
+        if reader.mapped and reader.matches_file():
+            return {
+                'archive': os.path.abspath(reader.path),
+                'size': reader.size,
+                'mtime_ns': reader.mtime_ns,
+                'items': [slot if isinstance(slot, int) else slot.to_dict() for slot in slots]
+            }
+        # Архив перенесен в память или файл заменен: записи сохраняются
+        # словарями без создания объектов записей
+        return [reader.read_dict(slot) if isinstance(slot, int) else slot.to_dict() for slot in slots]
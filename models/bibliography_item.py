@@ -5,8 +5,36 @@ class BibliographyItem:
     """
     Модель для представления библиографической записи.
     Содержит информацию о библиографической ссылке и ее элементах.
+    
+    Поля хранятся в __slots__ без словаря экземпляра. Год числом и текст
+    для поиска вычисляются при каждом обращении и в записи не хранятся
+    (текст для поиска держит таблица, пока задан фильтр). Строковое
+    представление записи без исходного текста кэшируется вместе со
+    значениями полей, из которых получено: после присваивания поля (или
+    изменения списка авторов) оно вычисляется заново.
     """
     
+    # Поля библиографической записи
+    FIELDS = (
+        'raw_text', 'authors', 'title', 'subtitle', 'year', 'publisher', 'city',
+        'edition', 'journal', 'volume', 'issue', 'pages', 'doi', 'url',
+        'language', 'type', 'is_vak', 'is_rinc'
+    )
+    
+    # Кэш строкового представления: исходные значения и результат
+    CACHE_SLOTS = ('_text_source', '_text')
+    
+    __slots__ = FIELDS + ('_additional_info',) + CACHE_SLOTS
+    
+    # Поля, по которым выполняется поиск (см. search_text)
+    SEARCH_FIELDS = ('title', 'year', 'journal', 'publisher', 'doi', 'url')
+    
+    # Поля, из которых формируется текст записи без исходного текста
+    TEXT_FIELDS = (
+        'title', 'edition', 'journal', 'year', 'city', 'publisher',
+        'volume', 'issue', 'pages', 'doi', 'url'
+    )
+    
     def __init__(self, raw_text=""):
         """
         Инициализация библиографической записи
@@ -32,14 +60,100 @@ class BibliographyItem:
         self.type = "book"    # book, article, web, etc.
         self.is_vak = False
         self.is_rinc = False
-        self.additional_info = {}
+        self._additional_info = None
+        self._reset_cache()
+    
+    def _reset_cache(self):
+        """Сброс кэша производных значений"""
+        for name in BibliographyItem.CACHE_SLOTS:
+            setattr(self, name, None)
+    
+    def __getstate__(self):
+        """Состояние для pickle и copy: поля без кэша производных значений"""
+        return tuple(getattr(self, name) for name in BibliographyItem.FIELDS) + (self._additional_info,)
+    
+    def __setstate__(self, state):
+        """Восстановление состояния, сохраненного __getstate__"""
+        for name, value in zip(BibliographyItem.FIELDS, state):
+            setattr(self, name, value)
+        self._additional_info = state[-1]
+        self._reset_cache()
+    
+    @property
+    def additional_info(self):
+        """
+        Дополнительные сведения о записи (словарь создается при первом обращении)
+        
+        Returns:
+            dict: Дополнительные сведения
+        """
+        if self._additional_info is None:
+            self._additional_info = {}
+        return self._additional_info
+    
+    @additional_info.setter
+    def additional_info(self, value):
+        self._additional_info = value
+    
+    def get_additional_info(self, key, default=None):
+        """
+        Получение дополнительного сведения без создания словаря
+        
+        Args:
+            key (str): Ключ сведения
+            default: Значение по умолчанию
+        
+        Returns:
+            Значение сведения или default
+        """
+        if not self._additional_info:
+            return default
+        return self._additional_info.get(key, default)
+    
+    @property
+    def year_int(self):
+        """
+        Год издания числом
+        
+        Returns:
+            int: Год или None, если год не указан или не является числом
+        """
+        year = self.year
+        return int(year) if year and year.isdigit() else None
+    
+    @property
+    def search_text(self):
+        """
+        Текст записи в нижнем регистре для поиска подстроки:
+        строковое представление, авторы и поля SEARCH_FIELDS через перевод строки
+        
+        Returns:
+            str: Текст для поиска
+        """
+        parts = [str(self)]
+        parts.extend(self.authors)
+        parts.extend(getattr(self, name) for name in BibliographyItem.SEARCH_FIELDS)
+        return '\n'.join(parts).lower()
     
     def __str__(self):
         """Строковое представление библиографической записи"""
         if self.raw_text:
             return self.raw_text
         
-        # Если сырого текста нет, формируем его из элементов
+        # Если сырого текста нет, формируем его из элементов (кэшируется)
+        source = tuple(self.authors) + tuple(getattr(self, name) for name in BibliographyItem.TEXT_FIELDS)
+        if self._text_source != source:
+            self._text = self._compose_text()
+            self._text_source = source
+        return self._text
+    
+    def _compose_text(self):
+        """
+        Формирование текста записи из элементов, если сырого текста нет
+        
+        Returns:
+            str: Текст записи
+        """
         result = ""
         if self.authors:
             result += ", ".join(self.authors)
@@ -94,7 +208,7 @@ class BibliographyItem:
         
         Args:
             format_type (str): Тип форматирования (GOST, APA, MLA, etc.)
-            
+        
         Returns:
             str: Отформатированная библиографическая запись
         """
@@ -145,23 +259,26 @@ class BibliographyItem:
             'type': self.type,
             'is_vak': self.is_vak,
             'is_rinc': self.is_rinc,
-            'additional_info': self.additional_info
+            'additional_info': self._additional_info if self._additional_info is not None else {}
         }
     
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, vocabularies=None):
         """
         Создание библиографической записи из словаря
         
         Args:
             data (dict): Словарь с данными библиографической записи
-            
+            vocabularies (Vocabularies): Словари проекта, через которые
+                пропускаются повторяющиеся значения полей (опционально)
+        
         Returns:
             BibliographyItem: Новый экземпляр библиографической записи
         """
         item = cls(data.get('raw_text', ''))
         item.authors = data.get('authors', [])
         item.title = data.get('title', '')
+        item.subtitle = data.get('subtitle', '')
         item.year = data.get('year', '')
         item.city = data.get('city', '')
         item.publisher = data.get('publisher', '')
@@ -176,5 +293,8 @@ class BibliographyItem:
         item.type = data.get('type', 'book')
         item.is_vak = data.get('is_vak', False)
         item.is_rinc = data.get('is_rinc', False)
-        item.additional_info = data.get('additional_info', {})
+        if data.get('additional_info'):
+            item.additional_info = data['additional_info']
+        if vocabularies is not None:
+            vocabularies.intern_item(item)
         return item 
\ No newline at end of file
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections.abc import Sequence
+
+class BibliographySnapshot(Sequence):
+    """
+    Неизменяемый снимок библиографического списка модели для чтения
+    из фоновых потоков (подсчеты, экспорт, построение индексов).
+    
+    Снимок создается методом AppModel.snapshot за O(1) и не меняется
+    при последующем редактировании списка (см. BibliographyStore.freeze).
+    Номер версии снимка - номер версии модели в момент создания:
+    is_stale сообщает, что список с тех пор изменился, а изменения
+    после снимка можно получить методом AppModel.changes_since.
+    """
+    
+    def __init__(self, store, version, model):
+        """
+        Инициализация снимка
+        
+        Args:
+            store (BibliographyStore): Замороженное хранилище (freeze)
+            version (int): Версия списка модели
+            model (AppModel): Модель, список которой снят
+        """
+        self._store = store
+        self._model = model
+        self.version = version
+    
+    @property
+    def store(self):
+        """Хранилище снимка (для подсчетов; изменять его нельзя)"""
+        return self._store
+    
+    def is_stale(self):
+        """
+        Изменился ли список модели после создания снимка
+        
+        Returns:
+            bool: True, если версия модели отличается от версии снимка
+        """
+        return self._model.version != self.version
+    
+    def __len__(self):
+        return len(self._store)
+    
+    def __getitem__(self, index):
+        return self._store[index]
+    
+    def __iter__(self):
+        return iter(self._store)
+    
+    def __repr__(self):
+        return f"BibliographySnapshot(version={self.version}, items={len(self._store)})"
@@ -0,0 +1,579 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+from array import array
+from collections import Counter
+from collections.abc import MutableSequence
+from models.binary_project import LazyItemList
+from models.vocabulary import Vocabularies
+
+# NumPy необязателен: без него подсчеты выполняются на чистом Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class BibliographyStore(MutableSequence):
+    """
+    Колоночное хранилище библиографического списка.
+    
+    Наряду с самими записями хранит колонки для аналитики: год (массив int,
+    0 - год не указан), язык и тип (коды словарей), признаки ВАК и РИНЦ
+    (массивы байтов 0/1), журнал и первого автора (коды словарей).
+    Словари (Vocabularies) общие для проекта: при добавлении в хранилище
+    значения полей записи заменяются общими экземплярами строк.
+    Подсчеты выполняются операциями над массивами (count, Counter)
+    без обращения к атрибутам записей.
+    
+    Хранилище ведет себя как список записей: индексация, срезы, append,
+    insert, del, sort, copy. После изменения полей записи на месте
+    колонки обновляются вызовом refresh(index).
+    
+    Хранилище, созданное методом lazy, строит колонки при первом
+    подсчете: записи ленивого списка (архива) до этого не декодируются.
+    
+    Копии (copy) и снимки (freeze) создаются за O(1): копия разделяет
+    с хранилищем список записей и колонки. Первое изменение хранилища
+    или копии копирует список и колонки, а изменение полей записи
+    выполняется над копией записи (writable_item), поэтому снимок можно
+    читать из другого потока без блокировок.
+    """
+    
+    # Размер списка, начиная с которого подсчеты statistics выполняются
+    # векторными операциями NumPy (если он установлен)
+    NUMPY_MIN_ITEMS = 5000
+    
+    # Колонки: (атрибут, код типа array) в порядке значений _encode
+    COLUMNS = (
+        ('_years', 'i'), ('_languages', 'H'), ('_types', 'H'), ('_vak', 'B'),
+        ('_rinc', 'B'), ('_journals', 'I'), ('_first_authors', 'I')
+    )
+    
+    def __init__(self, items=(), vocabularies=None):
+        """
+        Инициализация хранилища
+        
+        Args:
+            items (iterable): Библиографические записи
+            vocabularies (Vocabularies): Словари значений полей проекта
+                (по умолчанию - новые)
+        """
+        self._items = []
+        for name, typecode in BibliographyStore.COLUMNS:
+            setattr(self, name, array(typecode))
+        
+        if vocabularies is None:
+            vocabularies = Vocabularies()
+        self._vocabularies = vocabularies
+        # Колонки соответствуют записям (иначе строятся при первом подсчете)
+        self._columns_built = True
+        # Список записей и колонки разделяются с копией или снимком
+        self._shared = False
+        # id записей, скопированных после последней копии (их можно
+        # изменять на месте); None - копий не было
+        self._private = None
+        
+        self.extend(items)
+    
+    @classmethod
+    def lazy(cls, items, vocabularies=None):
+        """
+        Хранилище над списком записей без построения колонок
+        
+        Args:
+            items (MutableSequence): Список записей (например, LazyItemList),
+                используемый хранилищем без копирования
+            vocabularies (Vocabularies): Словари значений полей проекта
+        
+        Returns:
+            BibliographyStore: Хранилище
+        """
+        store = cls(vocabularies=vocabularies)
+        store._items = items
+        store._columns_built = False
+        return store
+    
+    @property
+    def vocabularies(self):
+        """Словари значений полей (коды колонок - коды этих словарей)"""
+        return self._vocabularies
+    
+    def _ensure_columns(self):
+        """Построение колонок по записям, если они еще не построены"""
+        if self._columns_built:
+            return
+        # Колонки строятся в новых массивах: пустые массивы могут
+        # разделяться со снимком, строящим свои колонки в другом потоке
+        columns = tuple(array(typecode) for _, typecode in BibliographyStore.COLUMNS)
+        for item in self._items:
+            for column, value in zip(columns, self._encode(item)):
+                column.append(value)
+        for (name, _), column in zip(BibliographyStore.COLUMNS, columns):
+            setattr(self, name, column)
+        self._columns_built = True
+    
+    def _encode(self, item):
+        """
+        Значения колонок для записи (значения полей записи заменяются
+        общими экземплярами из словарей)
+        
+        Args:
+            item (BibliographyItem): Библиографическая запись
+        
+        Returns:
+            tuple: (год, язык, тип, ВАК, РИНЦ, журнал, первый автор)
+        """
+        vocabularies = self._vocabularies
+        vocabularies.intern_item(item)
+        year = item.year_int
+        return (
+            year if year is not None else 0,
+            vocabularies['language'].encode(item.language),
+            vocabularies['type'].encode(item.type),
+            1 if item.is_vak else 0,
+            1 if item.is_rinc else 0,
+            vocabularies['journal'].encode(item.journal),
+            vocabularies['author'].encode(item.authors[0] if item.authors else "")
+        )
+    
+    def _columns(self):
+        """
+        Колонки хранилища в порядке значений _encode
+        
+        Returns:
+            tuple: Массивы колонок
+        """
+        return (
+            self._years, self._languages, self._types, self._vak,
+            self._rinc, self._journals, self._first_authors
+        )
+    
+    # Протокол списка
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def __getitem__(self, index):
+        return self._items[index]
+    
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            items = self._items[:]
+            items[index] = item
+            self._rebuild(items)
+            return
+        self._unshare()
+        self._items[index] = item
+        if self._columns_built:
+            for column, value in zip(self._columns(), self._encode(item)):
+                column[index] = value
+    
+    def __delitem__(self, index):
+        self._unshare()
+        del self._items[index]
+        if self._columns_built:
+            for column in self._columns():
+                del column[index]
+    
+    def insert(self, index, item):
+        self._unshare()
+        self._items.insert(index, item)
+        if self._columns_built:
+            for column, value in zip(self._columns(), self._encode(item)):
+                column.insert(index, value)
+    
+    def append(self, item):
+        self._unshare()
+        self._items.append(item)
+        if self._columns_built:
+            for column, value in zip(self._columns(), self._encode(item)):
+                column.append(value)
+    
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+    
+    def __iter__(self):
+        return iter(self._items)
+    
+    def __contains__(self, item):
+        return item in self._items
+    
+    def __eq__(self, other):
+        if isinstance(other, BibliographyStore):
+            other = other._items
+        return list(self._items) == list(other)
+    
+    def __repr__(self):
+        return f"BibliographyStore({self._items!r})"
+    
+    def copy(self):
+        """
+        Копия хранилища за O(1) с копированием при записи: список записей
+        и колонки разделяются до первого изменения одной из копий, а запись -
+        до изменения ее полей (см. writable_item). Записи ленивого списка
+        не декодируются
+        
+        Returns:
+            BibliographyStore: Копия
+        """
+        store = BibliographyStore(vocabularies=self._vocabularies)
+        store._items = self._items
+        store._columns_built = self._columns_built
+        for name, _ in BibliographyStore.COLUMNS:
+            setattr(store, name, getattr(self, name))
+        store._shared = self._shared = True
+        # Все записи теперь общие: поля любой из них изменяются в копии записи
+        store._private = set()
+        self._private = set()
+        return store
+    
+    def freeze(self):
+        """
+        Неизменяемый снимок хранилища за O(1) для чтения из другого потока
+        (копия, которую не изменяют; см. copy)
+        
+        Returns:
+            BibliographyStore: Снимок
+        """
+        return self.copy()
+    
+    def archive_slots(self):
+        """
+        Состав списка, открытого из архива, без декодирования записей
+        (для снимка автосохранения)
+        
+        Returns:
+            tuple: (BinaryProjectReader, ячейки LazyItemList.slots) или
+                None, если записи хранилища не читаются из архива
+        """
+        if not isinstance(self._items, LazyItemList):
+            return None
+        return self._items.reader, self._items.slots()
+    
+    def _unshare(self):
+        """Копирование списка записей и колонок, разделяемых с копией"""
+        if not self._shared:
+            return
+        self._items = self._items.copy()
+        if self._columns_built:
+            for name, _ in BibliographyStore.COLUMNS:
+                setattr(self, name, getattr(self, name)[:])
+        self._shared = False
+    
+    def writable_item(self, index):
+        """
+        Запись для изменения полей на месте: запись, которая может
+        входить в копию или снимок, заменяется в хранилище своей копией
+        
+        Args:
+            index (int): Индекс записи
+        
+        Returns:
+            BibliographyItem: Запись, принадлежащая только хранилищу
+        """
+        item = self._items[index]
+        if self._private is None or id(item) in self._private:
+            return item
+        # Строки полей общие, списки и словари копируются
+        item = copy.deepcopy(item)
+        self[index] = item
+        self._private.add(id(item))
+        return item
+    
+    def sort(self, key=None, reverse=False):
+        """
+        Сортировка записей (как list.sort) с перестановкой колонок
+        
+        Args:
+            key (callable): Ключ сортировки записи
+            reverse (bool): Сортировка по убыванию
+        """
+        self.reorder(self.sort_order(key, reverse))
+    
+    def sort_order(self, key=None, reverse=False):
+        """
+        Перестановка, упорядочивающая записи (без изменения хранилища)
+        
+        Args:
+            key (callable): Ключ сортировки записи
+            reverse (bool): Сортировка по убыванию
+        
+        Returns:
+            list: Индексы записей в порядке сортировки
+        """
+        items = self._items
+        keys = items if key is None else [key(item) for item in items]
+        return sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+    
+    def reorder(self, order):
+        """
+        Перестановка записей и колонок
+        
+        Args:
+            order (list): Индексы записей в новом порядке
+        """
+        items = self._items
+        self._items = [items[index] for index in order]
+        # Новый список и новые колонки не разделяются с копиями
+        self._shared = False
+        if not self._columns_built:
+            return
+        for name, typecode in BibliographyStore.COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, array(typecode, [column[index] for index in order]))
+    
+    def refresh(self, index):
+        """
+        Обновление колонок после изменения полей записи на месте
+        
+        Args:
+            index (int): Индекс записи
+        """
+        if not self._columns_built:
+            return
+        self._unshare()
+        item = self._items[index]
+        for column, value in zip(self._columns(), self._encode(item)):
+            column[index] = value
+    
+    def _rebuild(self, items):
+        """
+        Заполнение хранилища заново
+        
+        Args:
+            items (list): Библиографические записи
+        """
+        self._items = []
+        for name, typecode in BibliographyStore.COLUMNS:
+            setattr(self, name, array(typecode))
+        self._columns_built = True
+        self._shared = False
+        self.extend(items)
+    
+    # Аналитика
+    
+    def count_language(self, language):
+        """
+        Количество записей на языке
+        
+        Args:
+            language (str): Код языка (ru, en)
+        
+        Returns:
+            int: Количество записей
+        """
+        self._ensure_columns()
+        code = self._vocabularies['language'].lookup(language)
+        return self._languages.count(code) if code is not None else 0
+    
+    def count_vak(self):
+        """
+        Количество записей из перечня ВАК
+        
+        Returns:
+            int: Количество записей
+        """
+        self._ensure_columns()
+        return self._vak.count(1)
+    
+    def count_rinc(self):
+        """
+        Количество записей, индексируемых в РИНЦ
+        
+        Returns:
+            int: Количество записей
+        """
+        self._ensure_columns()
+        return self._rinc.count(1)
+    
+    def year_histogram(self):
+        """
+        Распределение записей по годам
+        
+        Returns:
+            Counter: {год: количество записей} без записей без года
+        """
+        self._ensure_columns()
+        histogram = Counter(self._years)
+        histogram.pop(0, None)
+        return histogram
+    
+    def count_since(self, year):
+        """
+        Количество записей, изданных не ранее указанного года
+        
+        Args:
+            year (int): Год
+        
+        Returns:
+            int: Количество записей
+        """
+        return sum(count for value, count in self.year_histogram().items() if value >= year)
+    
+    def year_range(self):
+        """
+        Минимальный, максимальный и средний год издания
+        
+        Returns:
+            tuple: (минимальный год, максимальный год, средний год с точностью
+                до десятых) или (None, None, None), если годы не указаны
+        """
+        histogram = self.year_histogram()
+        if not histogram:
+            return None, None, None
+        total = sum(histogram.values())
+        average = sum(value * count for value, count in histogram.items()) / total
+        return min(histogram), max(histogram), round(average, 1)
+    
+    def type_counts(self):
+        """
+        Распределение записей по типам источников
+        
+        Returns:
+            dict: {тип: количество записей}
+        """
+        self._ensure_columns()
+        decode = self._vocabularies['type'].decode
+        return {decode(code): count for code, count in Counter(self._types).items()}
+    
+    def first_author_counts(self):
+        """
+        Распределение записей по первому автору
+        
+        Returns:
+            Counter: {первый автор: количество записей} без записей без авторов
+        """
+        self._ensure_columns()
+        decode = self._vocabularies['author'].decode
+        counts = Counter(self._first_authors)
+        counts.pop(0, None)
+        return Counter({decode(code): count for code, count in counts.items()})
+    
+    def journal_counts(self):
+        """
+        Распределение записей по журналам
+        
+        Returns:
+            Counter: {журнал: количество записей} без записей без журнала
+        """
+        self._ensure_columns()
+        decode = self._vocabularies['journal'].decode
+        counts = Counter(self._journals)
+        counts.pop(0, None)
+        return Counter({decode(code): count for code, count in counts.items()})
+    
+    def statistics(self, recent_year, specified_author=""):
+        """
+        Подсчеты для проверки критериев (те же, что StatisticsAggregator.statistics)
+        
+        Args:
+            recent_year (int): Год, начиная с которого источник считается свежим
+            specified_author (str): Автор, источники которого подсчитываются
+                (в любой позиции, не только первым)
+        
+        Returns:
+            dict: Количества (total_items, english_count, recent_count,
+                vak_count, rinc_count, specified_author_count), распределения
+                (first_author_counts, type_counts) и year_range
+        """
+        specified_author_count = 0
+        if specified_author:
+            specified_author_count = sum(1 for item in self._items if specified_author in item.authors)
+        
+        if np is not None and len(self._items) >= BibliographyStore.NUMPY_MIN_ITEMS:
+            return self._numpy_statistics(recent_year, specified_author_count)
+        
+        return {
+            'total_items': len(self._items),
+            'english_count': self.count_language('en'),
+            'recent_count': self.count_since(recent_year),
+            'vak_count': self.count_vak(),
+            'rinc_count': self.count_rinc(),
+            'specified_author_count': specified_author_count,
+            'first_author_counts': self.first_author_counts(),
+            'type_counts': self.type_counts(),
+            'year_range': self.year_range()
+        }
+    
+    def _numpy_statistics(self, recent_year, specified_author_count):
+        """
+        Подсчеты statistics векторными операциями NumPy над колонками хранилища
+        
+        Args:
+            recent_year (int): Год, начиная с которого источник считается свежим
+            specified_author_count (int): Количество источников указанного
+                автора (считается по записям)
+        
+        Returns:
+            dict: Те же значения, что у подсчетов на чистом Python
+        """
+        self._ensure_columns()
+        # Копии колонок: массив NumPy поверх буфера array запретил бы
+        # изменять размер колонки, пока массив существует
+        years = BibliographyStore._numpy_column(self._years)
+        languages = BibliographyStore._numpy_column(self._languages)
+        
+        known_years = years[years > 0]
+        if known_years.size:
+            average = int(known_years.sum(dtype=np.int64)) / known_years.size
+            year_range = (int(known_years.min()), int(known_years.max()), round(average, 1))
+        else:
+            year_range = (None, None, None)
+        
+        english_code = self._vocabularies['language'].lookup('en')
+        english_count = int(np.count_nonzero(languages == english_code)) if english_code is not None else 0
+        
+        first_author_counts = self._numpy_counts(self._first_authors, 'author')
+        first_author_counts.pop("", None)
+        
+        return {
+            'total_items': len(self._items),
+            'english_count': english_count,
+            'recent_count': int(np.count_nonzero(known_years >= recent_year)),
+            'vak_count': int(np.count_nonzero(BibliographyStore._numpy_column(self._vak))),
+            'rinc_count': int(np.count_nonzero(BibliographyStore._numpy_column(self._rinc))),
+            'specified_author_count': specified_author_count,
+            'first_author_counts': Counter(first_author_counts),
+            'type_counts': self._numpy_counts(self._types, 'type'),
+            'year_range': year_range
+        }
+    
+    @staticmethod
+    def _numpy_column(column):
+        """
+        Копия колонки в массиве NumPy того же типа
+        
+        Args:
+            column (array): Колонка хранилища
+        
+        Returns:
+            numpy.ndarray: Массив значений
+        """
+        return np.frombuffer(column, dtype=np.dtype(column.typecode)).copy()
+    
+    def _numpy_counts(self, column, vocabulary):
+        """
+        Распределение значений колонки кодов словаря
+        
+        Args:
+            column (array): Колонка кодов
+            vocabulary (str): Словарь колонки
+        
+        Returns:
+            dict: {значение: количество записей} в порядке первого
+                появления значения в списке (как у Counter по колонке)
+        """
+        codes = BibliographyStore._numpy_column(column)
+        counts = np.bincount(codes)
+        # Первое появление кода: позиции присваиваются с конца списка,
+        # при повторе индекса остается последнее присвоенное значение
+        first_positions = np.full(counts.size, codes.size)
+        first_positions[codes[::-1]] = np.arange(codes.size - 1, -1, -1)
+        present = np.flatnonzero(counts)
+        decode = self._vocabularies[vocabulary].decode
+        return {
+            decode(int(code)): int(counts[code])
+            for code in present[np.argsort(first_positions[present], kind='stable')]
+        }
@@ -0,0 +1,562 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import MutableSequence
+from models.bibliography_item import BibliographyItem
+
+class BinaryProjectFormat:
+    """
+    Двоичный формат архива библиографических записей.
+    
+    Файл состоит из заголовка, записей и индекса смещений:
+        заголовок: сигнатура BIBA, версия (u16), флаги (u16),
+            количество записей (u64), смещение индекса (u64)
+        запись: длина (u32) и поля в порядке ключей
+            BibliographyItem.to_dict: строка - длина (u32) и UTF-8,
+            список строк - количество (u16) и строки, логическое
+            значение - байт, словарь - строка JSON
+        индекс: смещения записей (u64)
+    Все числа - little-endian. Нулевое смещение индекса означает
+    незавершенную запись файла: записи находятся последовательным
+    просмотром.
+    """
+    
+    MAGIC = b'BIBA'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHHQQ')
+    LENGTH = struct.Struct('<I')
+    COUNT = struct.Struct('<H')
+    FLAG = struct.Struct('<B')
+    
+    # Поля записи и их виды в порядке to_dict (контракт формата)
+    FIELDS = tuple(BibliographyItem().to_dict().items())
+    FIELD_KINDS = tuple(
+        (name, 'list' if isinstance(value, list) else
+               'bool' if isinstance(value, bool) else
+               'json' if isinstance(value, dict) else 'str')
+        for name, value in FIELDS
+    )
+    
+    @staticmethod
+    def encode(data):
+        """
+        Кодирование полей записи
+        
+        Args:
+            data (dict): Словарь to_dict
+        
+        Returns:
+            bytes: Запись без префикса длины
+        """
+        length = BinaryProjectFormat.LENGTH.pack
+        parts = []
+        for name, kind in BinaryProjectFormat.FIELD_KINDS:
+            value = data.get(name)
+            if kind == 'str':
+                encoded = (value or "").encode('utf-8')
+                parts.append(length(len(encoded)))
+                parts.append(encoded)
+            elif kind == 'list':
+                value = value or []
+                parts.append(BinaryProjectFormat.COUNT.pack(len(value)))
+                for element in value:
+                    encoded = element.encode('utf-8')
+                    parts.append(length(len(encoded)))
+                    parts.append(encoded)
+            elif kind == 'bool':
+                parts.append(BinaryProjectFormat.FLAG.pack(1 if value else 0))
+            else:
+                encoded = json.dumps(value, ensure_ascii=False).encode('utf-8') if value else b''
+                parts.append(length(len(encoded)))
+                parts.append(encoded)
+        return b''.join(parts)
+    
+    @staticmethod
+    def decode(buffer, offset):
+        """
+        Декодирование записи
+        
+        Args:
+            buffer (mmap | bytes): Содержимое файла
+            offset (int): Смещение записи (ее префикса длины)
+        
+        Returns:
+            dict: Словарь в формате to_dict
+        """
+        unpack_length = BinaryProjectFormat.LENGTH.unpack_from
+        position = offset + 4
+        data = {}
+        for name, kind in BinaryProjectFormat.FIELD_KINDS:
+            if kind == 'str' or kind == 'json':
+                size, = unpack_length(buffer, position)
+                position += 4
+                text = buffer[position:position + size].decode('utf-8')
+                position += size
+                if kind == 'json':
+                    data[name] = json.loads(text) if text else {}
+                else:
+                    data[name] = text
+            elif kind == 'list':
+                count, = BinaryProjectFormat.COUNT.unpack_from(buffer, position)
+                position += 2
+                elements = []
+                for _ in range(count):
+                    size, = unpack_length(buffer, position)
+                    position += 4
+                    elements.append(buffer[position:position + size].decode('utf-8'))
+                    position += size
+                data[name] = elements
+            else:
+                data[name] = buffer[position] != 0
+                position += 1
+        return data
+
+class BinaryProjectReader:
+    """
+    Чтение архива через mmap. Открытие занимает O(1) по количеству
+    записей: читается только заголовок, индекс смещений отображается
+    из файла без копирования. Записи декодируются по запросу.
+    
+    Метод detach переносит содержимое архива в память и закрывает файл:
+    записи остаются доступными, а файл можно заменить (в Windows
+    отображенный в память файл заменить нельзя).
+    """
+    
+    def __init__(self, path, vocabularies=None):
+        """
+        Открытие архива
+        
+        Args:
+            path (str): Путь к файлу архива
+            vocabularies (Vocabularies): Словари проекта для значений полей
+                декодируемых записей (опционально)
+        """
+        self.path = path
+        self.vocabularies = vocabularies
+        header = BinaryProjectFormat.HEADER
+        self._file = None
+        self._map = None
+        try:
+            self._file = open(path, 'rb')
+            status = os.fstat(self._file.fileno())
+            size = status.st_size
+            # Размер и время изменения файла при открытии: по ним
+            # проверяется, что номера записей относятся к этому архиву
+            self.size = size
+            self.mtime_ns = status.st_mtime_ns
+            if size < header.size:
+                raise OSError("файл поврежден")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            if self._file is not None:
+                self._file.close()
+            raise Exception(f"Ошибка при открытии архива: {str(e)}")
+        
+        magic, version, _, count, index_offset = header.unpack_from(self._map, 0)
+        self._index_offset = index_offset
+        if magic != BinaryProjectFormat.MAGIC:
+            self.close()
+            raise Exception("Файл не является архивом библиографических записей")
+        if version != BinaryProjectFormat.VERSION:
+            self.close()
+            raise Exception(f"Неподдерживаемая версия архива: {version}")
+        
+        if index_offset and sys.byteorder == 'little':
+            self._offsets = memoryview(self._map)[index_offset:index_offset + 8 * count].cast('Q')
+        elif index_offset:
+            self._offsets = array('Q', self._map[index_offset:index_offset + 8 * count])
+            self._offsets.byteswap()
+        else:
+            # Запись архива не завершена: индекс строится просмотром записей
+            self._offsets = BinaryProjectReader._scan(self._map, header.size, size)
+    
+    @property
+    def mapped(self):
+        """Отображен ли архив из файла (False после detach и close)"""
+        return isinstance(self._map, mmap.mmap)
+    
+    def matches_file(self):
+        """
+        Совпадает ли файл архива с открытым (не заменен и не изменен)
+        
+        Returns:
+            bool: True, если размер и время изменения файла не изменились
+        """
+        try:
+            status = os.stat(self.path)
+        except OSError:
+            return False
+        return status.st_size == self.size and status.st_mtime_ns == self.mtime_ns
+    
+    def detach(self):
+        """
+        Перенос содержимого архива в память и закрытие файла. Записи,
+        не декодированные до этого, остаются доступными
+        """
+        if not self.mapped:
+            return
+        data = self._map[:]
+        if isinstance(self._offsets, memoryview):
+            # Индекс отображался из файла: теперь он читается из копии
+            count = len(self._offsets)
+            self._offsets.release()
+            self._offsets = memoryview(data)[self._index_offset:self._index_offset + 8 * count].cast('Q')
+        self._map.close()
+        self._map = data
+        self._file.close()
+    
+    @staticmethod
+    def _scan(buffer, start, size):
+        """
+        Поиск полностью записанных записей последовательным просмотром
+        
+        Args:
+            buffer (mmap): Содержимое файла
+            start (int): Смещение первой записи
+            size (int): Размер файла
+        
+        Returns:
+            array: Смещения записей
+        """
+        offsets = array('Q')
+        position = start
+        while position + 4 <= size:
+            length, = BinaryProjectFormat.LENGTH.unpack_from(buffer, position)
+            if position + 4 + length > size:
+                break
+            offsets.append(position)
+            position += 4 + length
+        return offsets
+    
+    def __len__(self):
+        return len(self._offsets)
+    
+    def read_dict(self, index):
+        """
+        Декодирование записи в словарь to_dict
+        
+        Args:
+            index (int): Номер записи
+        
+        Returns:
+            dict: Данные записи
+        """
+        return BinaryProjectFormat.decode(self._map, self._offsets[index])
+    
+    def read_item(self, index):
+        """
+        Декодирование записи
+        
+        Args:
+            index (int): Номер записи
+        
+        Returns:
+            BibliographyItem: Библиографическая запись
+        """
+        return BibliographyItem.from_dict(self.read_dict(index), self.vocabularies)
+    
+    def close(self):
+        """Закрытие архива (записи, не декодированные до этого, недоступны)"""
+        if isinstance(getattr(self, '_offsets', None), memoryview):
+            self._offsets.release()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = None
+        self._file.close()
+
+class BinaryProjectWriter:
+    """
+    Потоковая запись архива: записи дописываются в файл по мере
+    поступления, индекс и заголовок записываются при закрытии.
+    
+    Новый архив пишется во временный файл и заменяет прежний при
+    закрытии, поэтому прежний файл может оставаться открытым для
+    чтения. При дописывании (append=True) файл изменяется на месте
+    и не должен быть открыт для чтения.
+    """
+    
+    def __init__(self, path, append=False):
+        """
+        Открытие архива для записи
+        
+        Args:
+            path (str): Путь к файлу архива
+            append (bool): Дописывать записи в существующий архив
+        """
+        self.path = path
+        header = BinaryProjectFormat.HEADER
+        try:
+            if append and os.path.exists(path):
+                reader = BinaryProjectReader(path)
+                self._offsets = array('Q', reader._offsets)
+                # Новые записи пишутся на место индекса, после последней записи
+                self._position = header.size
+                if self._offsets:
+                    last = self._offsets[-1]
+                    self._position = last + 4 + BinaryProjectFormat.LENGTH.unpack_from(reader._map, last)[0]
+                reader.close()
+                self._temporary_path = None
+                self._file = open(path, 'r+b')
+                # До закрытия архив помечен незавершенным: при сбое записи
+                # находятся просмотром файла
+                self._file.write(header.pack(BinaryProjectFormat.MAGIC, BinaryProjectFormat.VERSION, 0, 0, 0))
+                self._file.seek(self._position)
+                self._file.truncate()
+            else:
+                self._offsets = array('Q')
+                self._position = header.size
+                self._temporary_path = path + '.tmp'
+                self._file = open(self._temporary_path, 'wb')
+                self._file.write(header.pack(BinaryProjectFormat.MAGIC, BinaryProjectFormat.VERSION, 0, 0, 0))
+        except OSError as e:
+            raise Exception(f"Ошибка при открытии архива для записи: {str(e)}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def append(self, item):
+        """
+        Дописывание записи
+        
+        Args:
+            item (BibliographyItem | dict): Запись или словарь to_dict
+        """
+        data = item if isinstance(item, dict) else item.to_dict()
+        record = BinaryProjectFormat.encode(data)
+        self._file.write(BinaryProjectFormat.LENGTH.pack(len(record)))
+        self._file.write(record)
+        self._offsets.append(self._position)
+        self._position += 4 + len(record)
+    
+    def extend(self, items):
+        """
+        Дописывание записей
+        
+        Args:
+            items (iterable): Записи или словари to_dict
+        """
+        for item in items:
+            self.append(item)
+    
+    def close(self):
+        """Запись индекса и заголовка и закрытие файла"""
+        if self._file is None:
+            return
+        offsets = array('Q', self._offsets)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        self._file.write(offsets.tobytes())
+        self._file.seek(0)
+        self._file.write(BinaryProjectFormat.HEADER.pack(
+            BinaryProjectFormat.MAGIC, BinaryProjectFormat.VERSION, 0, len(self._offsets), self._position
+        ))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        if self._temporary_path is not None:
+            os.replace(self._temporary_path, self.path)
+    
+    @staticmethod
+    def write(path, items):
+        """
+        Запись архива
+        
+        Args:
+            path (str): Путь к файлу архива
+            items (iterable): Библиографические записи
+        """
+        with BinaryProjectWriter(path) as writer:
+            writer.extend(items)
+
+class LazyItemList(MutableSequence):
+    """
+    Список записей архива, декодируемых при первом обращении.
+    
+    До первого изменения состава списка декодированные записи хранятся
+    в словаре по номеру, поэтому создание списка занимает O(1). При
+    изменении состава создается список ячеек: запись или номер еще
+    не декодированной записи архива. Повторное обращение возвращает
+    тот же объект записи, поэтому изменения полей сохраняются.
+    Декодирование выполняется под блокировкой: список может читаться
+    снимком хранилища из другого потока.
+    """
+    
+    def __init__(self, reader):
+        """
+        Инициализация списка
+        
+        Args:
+            reader (BinaryProjectReader): Открытый архив
+        """
+        self._reader = reader
+        self._decoded = {}
+        self._slots = None
+        self._lock = threading.Lock()
+    
+    def _materialize(self):
+        """Создание списка ячеек перед изменением состава списка"""
+        if self._slots is not None:
+            return
+        with self._lock:
+            slots = list(range(len(self._reader)))
+            for index, item in self._decoded.items():
+                slots[index] = item
+            self._slots = slots
+            # Пустой словарь, а не None: читатель в другом потоке мог
+            # проверить _slots до его заполнения
+            self._decoded = {}
+    
+    def _item(self, index):
+        """
+        Запись по неотрицательному индексу (декодируется при первом обращении)
+        
+        Args:
+            index (int): Индекс записи
+        
+        Returns:
+            BibliographyItem: Библиографическая запись
+        """
+        slots = self._slots
+        item = self._decoded.get(index) if slots is None else slots[index]
+        if item is not None and not isinstance(item, int):
+            return item
+        with self._lock:
+            if self._slots is None:
+                item = self._decoded.get(index)
+                if item is None:
+                    item = self._decoded[index] = self._reader.read_item(index)
+                return item
+            slot = self._slots[index]
+            if isinstance(slot, int):
+                slot = self._slots[index] = self._reader.read_item(slot)
+            return slot
+    
+    def _normalize(self, index):
+        """
+        Неотрицательный индекс с проверкой границ
+        
+        Args:
+            index (int): Индекс (возможно, отрицательный)
+        
+        Returns:
+            int: Неотрицательный индекс
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("индекс записи вне диапазона")
+        return index
+    
+    def __len__(self):
+        return len(self._reader) if self._slots is None else len(self._slots)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(position) for position in range(*index.indices(len(self)))]
+        return self._item(self._normalize(index))
+    
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            raise TypeError("присваивание срезу не поддерживается")
+        index = self._normalize(index)
+        self._materialize()
+        self._slots[index] = item
+    
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            raise TypeError("удаление среза не поддерживается")
+        index = self._normalize(index)
+        self._materialize()
+        del self._slots[index]
+    
+    def insert(self, index, item):
+        self._materialize()
+        self._slots.insert(index, item)
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._item(index)
+    
+    @property
+    def reader(self):
+        """Архив, из которого декодируются записи (BinaryProjectReader)"""
+        return self._reader
+    
+    def slots(self):
+        """
+        Состав списка без декодирования записей
+        
+        Returns:
+            list: Для каждой позиции - запись или номер еще не
+                декодированной записи архива
+        """
+        with self._lock:
+            if self._slots is not None:
+                return self._slots[:]
+            slots = list(range(len(self._reader)))
+            for index, item in self._decoded.items():
+                slots[index] = item
+            return slots
+    
+    @classmethod
+    def from_slots(cls, reader, slots):
+        """
+        Список из ячеек (см. slots)
+        
+        Args:
+            reader (BinaryProjectReader): Открытый архив
+            slots (list): Записи и номера записей архива (используется
+                без копирования)
+        
+        Returns:
+            LazyItemList: Список
+        """
+        items = cls(reader)
+        items._slots = slots
+        return items
+    
+    def reorder(self, order):
+        """
+        Перестановка записей без декодирования
+        
+        Args:
+            order (list): order[новый индекс] = старый индекс
+        """
+        self._materialize()
+        with self._lock:
+            slots = self._slots
+            self._slots = [slots[index] for index in order]
+    
+    def copy(self, copy_items=False):
+        """
+        Копия списка без декодирования записей
+        
+        Args:
+            copy_items (bool): Копировать уже декодированные записи
+                (иначе записи общие)
+        
+        Returns:
+            LazyItemList: Копия
+        """
+        self._materialize()
+        duplicate = LazyItemList(self._reader)
+        with self._lock:
+            duplicate._slots = self._slots[:]
+        if copy_items:
+            duplicate._slots = [
+                slot if isinstance(slot, int) else copy.deepcopy(slot) for slot in duplicate._slots
+            ]
+        return duplicate
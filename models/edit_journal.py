@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import deque
+
+class EditJournal:
+    """
+    Журнал отмены и повтора изменений библиографического списка.
+    
+    Хранит не снимки списка, а шаги из мелких операций (кортежей):
+        ('insert', индекс, запись)
+        ('remove', индекс, запись)
+        ('replace', индекс, старая запись, новая запись)
+        ('set_field', индекс, имя поля, старое значение, новое значение)
+        ('assign', старый список, новый список)
+        ('reorder', перестановка индексов)
+    Операции применяет AppModel (отмена - применение обратных операций,
+    см. inverse), поэтому отмена и повтор занимают время, пропорциональное
+    изменению. Занимаемая журналом память оценивается приблизительно;
+    при превышении max_memory или max_steps отбрасываются самые старые шаги.
+    """
+    
+    # Оценка памяти на запись, удерживаемую журналом, и на операцию, байт
+    ITEM_SIZE = 1024
+    OPERATION_SIZE = 96
+    
+    def __init__(self, max_memory=16 * 1024 * 1024, max_steps=1000):
+        """
+        Инициализация журнала
+        
+        Args:
+            max_memory (int): Предельная оценка памяти шагов отмены и повтора, байт
+            max_steps (int): Предельное количество шагов отмены
+        """
+        self.max_memory = max_memory
+        self.max_steps = max_steps
+        # Шаги: пары (список операций, оценка памяти)
+        self._undo = deque()
+        self._redo = []
+        self._memory = 0
+    
+    @staticmethod
+    def estimate(operations):
+        """
+        Приблизительная оценка памяти, удерживаемой операциями шага
+        
+        Args:
+            operations (list): Операции шага
+        
+        Returns:
+            int: Оценка в байтах
+        """
+        size = 0
+        for operation in operations:
+            kind = operation[0]
+            size += EditJournal.OPERATION_SIZE
+            if kind in ('insert', 'remove'):
+                size += EditJournal.ITEM_SIZE
+            elif kind == 'replace':
+                size += 2 * EditJournal.ITEM_SIZE
+            elif kind == 'assign':
+                size += len(operation[1]) * EditJournal.ITEM_SIZE
+            elif kind == 'reorder':
+                size += 8 * len(operation[1])
+        return size
+    
+    @staticmethod
+    def inverse(operation):
+        """
+        Операция, отменяющая данную
+        
+        Args:
+            operation (tuple): Операция
+        
+        Returns:
+            tuple: Обратная операция
+        """
+        kind = operation[0]
+        if kind == 'insert':
+            return ('remove', operation[1], operation[2])
+        if kind == 'remove':
+            return ('insert', operation[1], operation[2])
+        if kind == 'replace':
+            return ('replace', operation[1], operation[3], operation[2])
+        if kind == 'set_field':
+            return ('set_field', operation[1], operation[2], operation[4], operation[3])
+        if kind == 'assign':
+            return ('assign', operation[2], operation[1])
+        if kind == 'reorder':
+            order = operation[1]
+            inverse = [0] * len(order)
+            for position, index in enumerate(order):
+                inverse[index] = position
+            return ('reorder', inverse)
+        raise Exception(f"Неизвестная операция журнала: {kind}")
+    
+    def record(self, operations):
+        """
+        Запись шага изменений; шаги повтора при этом сбрасываются
+        
+        Args:
+            operations (list): Операции шага в порядке выполнения
+        """
+        if not operations:
+            return
+        self._drop_redo()
+        size = EditJournal.estimate(operations)
+        self._undo.append((operations, size))
+        self._memory += size
+        self._trim()
+    
+    def pop_undo(self):
+        """
+        Извлечение последнего шага для отмены (шаг переходит в стек повтора)
+        
+        Returns:
+            list: Операции шага или None, если отменять нечего
+        """
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        self._redo.append(step)
+        return step[0]
+    
+    def pop_redo(self):
+        """
+        Извлечение последнего отмененного шага для повтора
+        
+        Returns:
+            list: Операции шага или None, если повторять нечего
+        """
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        self._undo.append(step)
+        return step[0]
+    
+    def can_undo(self):
+        """Есть ли шаги для отмены"""
+        return bool(self._undo)
+    
+    def can_redo(self):
+        """Есть ли шаги для повтора"""
+        return bool(self._redo)
+    
+    @property
+    def memory(self):
+        """Оценка памяти, занимаемой журналом, байт"""
+        return self._memory
+    
+    def clear(self):
+        """Очистка журнала"""
+        self._undo.clear()
+        self._redo = []
+        self._memory = 0
+    
+    def _drop_redo(self):
+        """Сброс шагов повтора"""
+        for _, size in self._redo:
+            self._memory -= size
+        self._redo = []
+    
+    def _trim(self):
+        """Отбрасывание самых старых шагов сверх ограничений (последний шаг сохраняется)"""
+        while len(self._undo) > 1 and (self._memory > self.max_memory or len(self._undo) > self.max_steps):
+            _, size = self._undo.popleft()
+            self._memory -= size
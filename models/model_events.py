@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+class BibliographyEvent:
+    """
+    Уведомление об изменении библиографического списка модели.
+    
+    Виды событий:
+        INSERTED - вставлены записи с индексами first..last
+        REMOVED - удалены записи, занимавшие индексы first..last
+        CHANGED - изменены записи с индексами first..last
+        MOVED - записи переставлены: order[новый индекс] = старый индекс
+        RESET - список заменен целиком
+    События отправляются после изменения списка.
+    """
+    
+    INSERTED = 'inserted'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+    MOVED = 'moved'
+    RESET = 'reset'
+    
+    __slots__ = ('kind', 'first', 'last', 'order')
+    
+    def __init__(self, kind, first=0, last=-1, order=None):
+        """
+        Инициализация события
+        
+        Args:
+            kind (str): Вид события
+            first (int): Индекс первой затронутой записи
+            last (int): Индекс последней затронутой записи
+            order (list): Перестановка для события MOVED
+        """
+        self.kind = kind
+        self.first = first
+        self.last = last
+        self.order = order
+    
+    @property
+    def count(self):
+        """Количество затронутых записей"""
+        return self.last - self.first + 1
+    
+    def __repr__(self):
+        return f"BibliographyEvent({self.kind!r}, {self.first}, {self.last})"
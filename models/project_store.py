@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import sqlite3
+from models.bibliography_item import BibliographyItem
+
+class ProjectStore:
+    """
+    Файл проекта библиографического списка на основе SQLite.
+    
+    Каждая запись хранится строкой таблицы items. Колонки таблицы
+    соответствуют ключам BibliographyItem.to_dict: это соответствие
+    и есть контракт схемы. Списки и словари хранятся в JSON. Кроме них
+    таблица содержит производную колонку года (числом) для индекса.
+    По тексту, авторам и названию строится полнотекстовый индекс FTS5
+    (триграммы, поиск подстроки). Если SQLite собран без FTS5,
+    поиск выполняется сканированием таблицы.
+    """
+    
+    # Версия схемы файла проекта
+    SCHEMA_VERSION = 3
+    
+    # Колонки записей: ключи to_dict в порядке словаря
+    ITEM_COLUMNS = tuple(BibliographyItem().to_dict())
+    # Колонки, хранимые в JSON
+    JSON_COLUMNS = ('authors', 'additional_info')
+    # Логические колонки (хранятся как 0/1)
+    BOOL_COLUMNS = ('is_vak', 'is_rinc')
+    # Производные колонки: год числом (для индекса)
+    DERIVED_COLUMNS = ('year_int',)
+    # Колонки с индексами для выборок
+    INDEXED_COLUMNS = ('year_int', 'language', 'type', 'journal')
+    # Колонки полнотекстового индекса; details - журнал, издательство,
+    # год, DOI и URL (как в BibliographyItem.search_text)
+    FTS_COLUMNS = ('raw_text', 'authors', 'title', 'details')
+    # Минимальная длина запроса для триграммного индекса
+    MIN_FTS_QUERY = 3
+    
+    def __init__(self, path):
+        """
+        Открытие (или создание) файла проекта
+        
+        Args:
+            path (str): Путь к файлу проекта
+        """
+        self.path = path
+        try:
+            self._connection = sqlite3.connect(path)
+            self._connection.create_function('lower_text', 1, ProjectStore._lower_text, deterministic=True)
+            self._create_schema()
+        except sqlite3.Error as e:
+            raise Exception(f"Ошибка при открытии файла проекта: {str(e)}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Закрытие файла проекта"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+    
+    @staticmethod
+    def _lower_text(value):
+        """Нижний регистр с учетом кириллицы (lower() в SQLite - только ASCII)"""
+        return value.lower() if value else ""
+    
+    def _create_schema(self):
+        """Создание таблиц и индексов (если их нет) и проверка версии схемы"""
+        connection = self._connection
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(ProjectStore.SCHEMA_VERSION),)
+                )
+            elif int(row[0]) != ProjectStore.SCHEMA_VERSION:
+                raise Exception(f"Неподдерживаемая версия файла проекта: {row[0]}")
+            
+            columns = ', '.join(ProjectStore.ITEM_COLUMNS + ProjectStore.DERIVED_COLUMNS)
+            connection.execute(f"CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, {columns})")
+            for name in ProjectStore.INDEXED_COLUMNS:
+                connection.execute(f"CREATE INDEX IF NOT EXISTS items_{name} ON items ({name})")
+        
+        try:
+            with connection:
+                fts_columns = ', '.join(ProjectStore.FTS_COLUMNS)
+                connection.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5({fts_columns}, tokenize='trigram')"
+                )
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        
+        # Файл сохранен SQLite без FTS5: индекс строится по записям
+        if self.has_fts:
+            indexed = connection.execute("SELECT COUNT(*) FROM items_fts").fetchone()[0]
+            if indexed != self.count():
+                with connection:
+                    self._index_items(self.load())
+    
+    @staticmethod
+    def _item_row(item):
+        """
+        Строка таблицы items для записи (по to_dict)
+        
+        Args:
+            item (BibliographyItem): Библиографическая запись
+        
+        Returns:
+            tuple: Значения ITEM_COLUMNS и DERIVED_COLUMNS
+        """
+        data = item.to_dict()
+        row = []
+        for name in ProjectStore.ITEM_COLUMNS:
+            value = data[name]
+            if name in ProjectStore.JSON_COLUMNS:
+                value = json.dumps(value, ensure_ascii=False)
+            elif name in ProjectStore.BOOL_COLUMNS:
+                value = 1 if value else 0
+            row.append(value)
+        row.append(item.year_int)
+        return tuple(row)
+    
+    @staticmethod
+    def _fts_row(item):
+        """
+        Строка полнотекстового индекса для записи
+        
+        Args:
+            item (BibliographyItem): Библиографическая запись
+        
+        Returns:
+            tuple: Значения FTS_COLUMNS
+        """
+        details = '\n'.join((item.journal, item.publisher, item.year, item.doi, item.url))
+        return (str(item), '\n'.join(item.authors), item.title, details)
+    
+    def save(self, items):
+        """
+        Сохранение библиографического списка (содержимое проекта заменяется)
+        
+        Args:
+            items (iterable): Библиографические записи в порядке списка
+        """
+        placeholders = ', '.join('?' * (1 + len(ProjectStore.ITEM_COLUMNS) + len(ProjectStore.DERIVED_COLUMNS)))
+        items = list(items)
+        try:
+            with self._connection as connection:
+                connection.execute("DELETE FROM items")
+                connection.executemany(
+                    f"INSERT INTO items VALUES ({placeholders})",
+                    ((position + 1,) + ProjectStore._item_row(item) for position, item in enumerate(items))
+                )
+                if self.has_fts:
+                    self._index_items(items)
+        except sqlite3.Error as e:
+            raise Exception(f"Ошибка при сохранении файла проекта: {str(e)}")
+    
+    def _index_items(self, items):
+        """
+        Заполнение полнотекстового индекса заново (в транзакции вызывающего)
+        
+        Args:
+            items (list): Библиографические записи в порядке списка
+        """
+        columns = ', '.join(ProjectStore.FTS_COLUMNS)
+        placeholders = ', '.join('?' * (1 + len(ProjectStore.FTS_COLUMNS)))
+        self._connection.execute("DELETE FROM items_fts")
+        self._connection.executemany(
+            f"INSERT INTO items_fts (rowid, {columns}) VALUES ({placeholders})",
+            ((position + 1,) + ProjectStore._fts_row(item) for position, item in enumerate(items))
+        )
+    
+    def load(self, vocabularies=None):
+        """
+        Загрузка библиографического списка
+        
+        Args:
+            vocabularies (Vocabularies): Словари проекта для значений полей
+                записей (опционально)
+        
+        Returns:
+            list: Библиографические записи в порядке списка
+        """
+        columns = ProjectStore.ITEM_COLUMNS
+        try:
+            rows = self._connection.execute(f"SELECT {', '.join(columns)} FROM items ORDER BY id").fetchall()
+        except sqlite3.Error as e:
+            raise Exception(f"Ошибка при чтении файла проекта: {str(e)}")
+        
+        # Колонки JSON разбираются одним вызовом json.loads на колонку:
+        # это в несколько раз быстрее разбора значения каждой строки
+        decoded = {}
+        for name in ProjectStore.JSON_COLUMNS:
+            position = columns.index(name)
+            decoded[name] = json.loads('[' + ','.join(row[position] or 'null' for row in rows) + ']')
+        
+        items = []
+        for index, row in enumerate(rows):
+            data = dict(zip(columns, row))
+            for name in ProjectStore.JSON_COLUMNS:
+                data[name] = decoded[name][index]
+            for name in ProjectStore.BOOL_COLUMNS:
+                data[name] = bool(data[name])
+            if data['authors'] is None:
+                data['authors'] = []
+            items.append(BibliographyItem.from_dict(data, vocabularies))
+        return items
+    
+    def count(self):
+        """
+        Количество записей в проекте
+        
+        Returns:
+            int: Количество записей
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    
+    def is_indexed_query(self, text):
+        """
+        Выполняется ли поиск подстроки по полнотекстовому индексу
+        
+        Args:
+            text (str): Искомая подстрока
+        
+        Returns:
+            bool: True, если индекс доступен и запрос не короче MIN_FTS_QUERY
+        """
+        return self.has_fts and len(text.strip()) >= ProjectStore.MIN_FTS_QUERY
+    
+    def search(self, text):
+        """
+        Поиск записей, содержащих подстроку (без учета регистра),
+        по полнотекстовому индексу
+        
+        Args:
+            text (str): Искомая подстрока
+        
+        Returns:
+            list: Индексы найденных записей в списке по возрастанию
+        """
+        text = text.strip()
+        if not text:
+            return list(range(self.count()))
+        
+        if self.is_indexed_query(text):
+            # Запрос - фраза в кавычках: триграммы ищут ее как подстроку
+            query = '"' + text.replace('"', '""') + '"'
+            cursor = self._connection.execute(
+                "SELECT rowid FROM items_fts WHERE items_fts MATCH ? ORDER BY rowid", (query,)
+            )
+        else:
+            # Короткий запрос или SQLite без FTS5: сканирование таблицы
+            searched = " || char(10) || ".join(
+                f"coalesce({name}, '')"
+                for name in ('raw_text', 'authors', 'title', 'journal', 'publisher', 'year', 'doi', 'url')
+            )
+            cursor = self._connection.execute(
+                f"SELECT id FROM items WHERE instr(lower_text({searched}), ?) > 0 ORDER BY id",
+                (text.lower(),)
+            )
+        return [row[0] - 1 for row in cursor]
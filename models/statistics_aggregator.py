@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+from models.model_events import BibliographyEvent
+
+class StatisticsAggregator:
+    """
+    Подсчеты для проверки критериев, поддерживаемые по мере изменения
+    библиографического списка.
+    
+    Все счетчики заполняются одним проходом по списку (reset), после чего
+    обновляются по событиям модели (apply_event): добавление, удаление
+    и изменение записи меняют счетчики за O(1) по длине списка. Для каждой
+    записи хранится ее вклад в счетчики, чтобы его можно было вычесть
+    при удалении или изменении. Годы хранятся гистограммой, поэтому
+    количество свежих источников считается для любого года без прохода
+    по списку.
+    
+    Замена списка целиком (событие RESET) только помечает счетчики
+    устаревшими: они заполняются заново при следующем запросе подсчетов.
+    Поэтому открытие ленивого архива не декодирует записи, пока подсчеты
+    не понадобятся.
+    """
+    
+    def __init__(self, items=()):
+        """
+        Инициализация счетчиков (заполняются при первом запросе подсчетов)
+        
+        Args:
+            items (Sequence): Библиографические записи
+        """
+        self.invalidate(items)
+    
+    def invalidate(self, items):
+        """
+        Пометка счетчиков устаревшими: они будут заполнены по списку
+        при следующем запросе подсчетов
+        
+        Args:
+            items (Sequence): Библиографические записи
+        """
+        self._entries = None
+        self._pending_items = items
+    
+    def _ensure_entries(self):
+        """Заполнение устаревших счетчиков"""
+        if self._entries is None:
+            self.reset(self._pending_items)
+    
+    def reset(self, items):
+        """
+        Заполнение счетчиков заново одним проходом по списку
+        
+        Args:
+            items (iterable): Библиографические записи
+        """
+        self._pending_items = None
+        self._entries = []
+        self._years = Counter()
+        self._languages = Counter()
+        self._types = Counter()
+        self._first_authors = Counter()
+        self._authors = Counter()
+        self._vak = 0
+        self._rinc = 0
+        for item in items:
+            entry = StatisticsAggregator._entry(item)
+            self._entries.append(entry)
+            self._add(entry)
+    
+    @staticmethod
+    def _entry(item):
+        """
+        Вклад записи в счетчики
+        
+        Args:
+            item (BibliographyItem): Библиографическая запись
+        
+        Returns:
+            tuple: (год или 0, язык, тип, ВАК, РИНЦ, первый автор,
+                авторы без повторов)
+        """
+        year = item.year_int
+        return (
+            year if year is not None else 0,
+            item.language,
+            item.type,
+            bool(item.is_vak),
+            bool(item.is_rinc),
+            item.authors[0] if item.authors else "",
+            frozenset(item.authors)
+        )
+    
+    def _add(self, entry):
+        """Добавление вклада записи в счетчики"""
+        year, language, source_type, vak, rinc, first_author, authors = entry
+        self._years[year] += 1
+        self._languages[language] += 1
+        self._types[source_type] += 1
+        self._vak += vak
+        self._rinc += rinc
+        if first_author:
+            self._first_authors[first_author] += 1
+        for author in authors:
+            self._authors[author] += 1
+    
+    def _subtract(self, entry):
+        """Вычитание вклада записи из счетчиков (нулевые значения удаляются)"""
+        year, language, source_type, vak, rinc, first_author, authors = entry
+        StatisticsAggregator._decrement(self._years, year)
+        StatisticsAggregator._decrement(self._languages, language)
+        StatisticsAggregator._decrement(self._types, source_type)
+        self._vak -= vak
+        self._rinc -= rinc
+        if first_author:
+            StatisticsAggregator._decrement(self._first_authors, first_author)
+        for author in authors:
+            StatisticsAggregator._decrement(self._authors, author)
+    
+    @staticmethod
+    def _decrement(counter, key):
+        """Уменьшение счетчика на 1 с удалением нулевого значения"""
+        count = counter[key] - 1
+        if count:
+            counter[key] = count
+        else:
+            del counter[key]
+    
+    # Изменения списка
+    
+    def insert(self, index, item):
+        """
+        Учет вставленной записи
+        
+        Args:
+            index (int): Индекс записи в списке
+            item (BibliographyItem): Библиографическая запись
+        """
+        if self._entries is None:
+            return
+        entry = StatisticsAggregator._entry(item)
+        self._entries.insert(index, entry)
+        self._add(entry)
+    
+    def remove(self, index):
+        """
+        Учет удаления записи
+        
+        Args:
+            index (int): Индекс, который занимала запись
+        """
+        if self._entries is None:
+            return
+        self._subtract(self._entries.pop(index))
+    
+    def update(self, index, item):
+        """
+        Учет изменения (или замены) записи
+        
+        Args:
+            index (int): Индекс записи в списке
+            item (BibliographyItem): Запись после изменения
+        """
+        if self._entries is None:
+            return
+        entry = StatisticsAggregator._entry(item)
+        self._subtract(self._entries[index])
+        self._entries[index] = entry
+        self._add(entry)
+    
+    def reorder(self, order):
+        """
+        Учет перестановки записей (счетчики не меняются)
+        
+        Args:
+            order (list): order[новый индекс] = старый индекс
+        """
+        if self._entries is None:
+            return
+        entries = self._entries
+        self._entries = [entries[index] for index in order]
+    
+    def apply_event(self, event, items):
+        """
+        Обновление счетчиков по событию модели
+        
+        Args:
+            event (BibliographyEvent): Событие изменения списка
+            items (Sequence): Список после изменения
+        """
+        kind = event.kind
+        if kind == BibliographyEvent.RESET or self._entries is None:
+            # Устаревшие счетчики не обновляются по отдельным событиям
+            self.invalidate(items)
+        elif kind == BibliographyEvent.INSERTED:
+            for index in range(event.first, event.last + 1):
+                self.insert(index, items[index])
+        elif kind == BibliographyEvent.REMOVED:
+            for index in range(event.last, event.first - 1, -1):
+                self.remove(index)
+        elif kind == BibliographyEvent.CHANGED:
+            for index in range(event.first, event.last + 1):
+                self.update(index, items[index])
+        elif kind == BibliographyEvent.MOVED:
+            self.reorder(event.order)
+        else:
+            self.invalidate(items)
+    
+    # Подсчеты
+    
+    def __len__(self):
+        self._ensure_entries()
+        return len(self._entries)
+    
+    def statistics(self, recent_year, specified_author=""):
+        """
+        Подсчеты для проверки критериев (те же, что BibliographyStore.statistics)
+        
+        Args:
+            recent_year (int): Год, начиная с которого источник считается свежим
+            specified_author (str): Автор, источники которого подсчитываются
+                (в любой позиции, не только первым)
+        
+        Returns:
+            dict: Количества (total_items, english_count, recent_count,
+                vak_count, rinc_count, specified_author_count), распределения
+                (first_author_counts, type_counts) и year_range
+        """
+        self._ensure_entries()
+        histogram = {year: count for year, count in self._years.items() if year}
+        if histogram:
+            total = sum(histogram.values())
+            average = sum(year * count for year, count in histogram.items()) / total
+            year_range = (min(histogram), max(histogram), round(average, 1))
+        else:
+            year_range = (None, None, None)
+        
+        specified_author_count = 0
+        if specified_author:
+            specified_author_count = self._authors.get(specified_author, 0)
+        
+        return {
+            'total_items': len(self._entries),
+            'english_count': self._languages.get('en', 0),
+            'recent_count': sum(count for year, count in histogram.items() if year >= recent_year),
+            'vak_count': self._vak,
+            'rinc_count': self._rinc,
+            'specified_author_count': specified_author_count,
+            'first_author_counts': Counter(self._first_authors),
+            'type_counts': dict(self._types),
+            'year_range': year_range
+        }
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+
+class Vocabulary:
+    """
+    Словарь повторяющихся строковых значений одного поля.
+    
+    Каждое значение хранится в одном экземпляре и получает целый код:
+    записи с одинаковыми значениями ссылаются на одну строку, а подсчеты
+    и индексы работают с кодами. Код 0 зарезервирован за пустым значением.
+    Коды только добавляются, поэтому словарь может разделяться
+    несколькими списками (копиями хранилища) одного проекта. Добавление
+    значения выполняется под блокировкой: словарь пополняется и при
+    построении колонок снимка в фоновом потоке.
+    """
+    
+    def __init__(self):
+        """Инициализация словаря"""
+        self._values = [""]
+        self._codes = {"": 0}
+        self._lock = threading.Lock()
+    
+    def encode(self, value):
+        """
+        Получение кода значения (новое значение добавляется в словарь)
+        
+        Args:
+            value (str): Значение
+        
+        Returns:
+            int: Код значения
+        """
+        value = value or ""
+        code = self._codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(value)
+                if code is None:
+                    # Значение добавляется в список до словаря кодов:
+                    # код, видимый без блокировки, уже декодируется
+                    code = len(self._values)
+                    self._values.append(value)
+                    self._codes[value] = code
+        return code
+    
+    def intern(self, value):
+        """
+        Общий экземпляр значения (новое значение добавляется в словарь)
+        
+        Args:
+            value (str): Значение
+        
+        Returns:
+            str: Равная строка из словаря
+        """
+        return self._values[self.encode(value)]
+    
+    def lookup(self, value):
+        """
+        Получение кода значения без добавления в словарь
+        
+        Args:
+            value (str): Значение
+        
+        Returns:
+            int: Код значения или None, если значения нет в словаре
+        """
+        return self._codes.get(value or "")
+    
+    def decode(self, code):
+        """
+        Получение значения по коду
+        
+        Args:
+            code (int): Код значения
+        
+        Returns:
+            str: Значение
+        """
+        return self._values[code]
+    
+    def __len__(self):
+        return len(self._values)
+
+class Vocabularies:
+    """
+    Словари повторяющихся значений полей библиографических записей
+    одного проекта: журналы, издательства, города, годы, языки, типы
+    источников и имена авторов (общий словарь для всех позиций).
+    
+    Словари только растут: значения удаленных записей остаются в них
+    до конца работы с проектом.
+    """
+    
+    # Поля записи, значения которых хранятся в словарях
+    FIELDS = ('journal', 'publisher', 'city', 'year', 'language', 'type')
+    # Словарь имен авторов
+    AUTHOR = 'author'
+    
+    def __init__(self):
+        """Инициализация пустых словарей"""
+        self._vocabularies = {name: Vocabulary() for name in Vocabularies.FIELDS + (Vocabularies.AUTHOR,)}
+    
+    def __getitem__(self, name):
+        """
+        Словарь поля
+        
+        Args:
+            name (str): Поле записи (FIELDS) или AUTHOR
+        
+        Returns:
+            Vocabulary: Словарь значений поля
+        """
+        return self._vocabularies[name]
+    
+    def intern_item(self, item):
+        """
+        Замена значений полей записи общими экземплярами из словарей
+        (значения не изменяются, меняются только объекты строк)
+        
+        Args:
+            item (BibliographyItem): Библиографическая запись (изменяется на месте)
+        
+        Returns:
+            BibliographyItem: Та же запись
+        """
+        vocabularies = self._vocabularies
+        for name in Vocabularies.FIELDS:
+            value = getattr(item, name)
+            if value:
+                setattr(item, name, vocabularies[name].intern(value))
+        authors = item.authors
+        if authors:
+            # Новый список: прежний может читаться снимком в другом потоке
+            intern = vocabularies[Vocabularies.AUTHOR].intern
+            item.authors = [intern(author) for author in authors]
+        return item
+    
+    def statistics(self):
+        """
+        Размеры словарей
+        
+        Returns:
+            dict: {поле: количество различных значений}
+        """
+        return {name: len(vocabulary) - 1 for name, vocabulary in self._vocabularies.items()}
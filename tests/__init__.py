@@ -0,0 +1 @@
+# Инициализация пакета тестов
\ No newline at end of file
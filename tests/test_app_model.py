@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Проверка событий пакетных изменений модели.
+
+Запуск из корня проекта:
+    python -m unittest discover tests
+"""
+
+import unittest
+from models.app_model import AppModel
+from models.bibliography_item import BibliographyItem
+from models.model_events import BibliographyEvent
+from models.statistics_aggregator import StatisticsAggregator
+
+def make_item(number):
+    """Запись с автором A<number> и годом 2000 + number"""
+    item = BibliographyItem(f"A{number}. Запись {number}. 20{number:02d}.")
+    item.authors = [f"A{number}"]
+    item.year = str(2000 + number)
+    return item
+
+class BatchEventsTest(unittest.TestCase):
+    """События пакета, отправляемые подписчикам"""
+    
+    def setUp(self):
+        self.model = AppModel()
+        for number in range(8):
+            self.model.add_bibliography_item(make_item(number))
+        self.aggregator = StatisticsAggregator(self.model.bibliography_list)
+        self.aggregator.statistics(2000)
+        self.events = []
+        self.model.subscribe(self.on_event)
+    
+    def on_event(self, event):
+        self.events.append(event)
+        self.aggregator.apply_event(event, self.model.bibliography_list)
+    
+    def assert_counts_match(self):
+        expected = StatisticsAggregator(list(self.model.bibliography_list)).statistics(2000)
+        self.assertEqual(self.aggregator.statistics(2000), expected)
+    
+    def test_separate_removes_and_undo(self):
+        with self.model.batch():
+            self.model.remove_bibliography_item(2)
+            self.model.remove_bibliography_item(5)
+        self.assert_counts_match()
+        
+        self.events.clear()
+        self.assertTrue(self.model.undo())
+        self.assertEqual([event.kind for event in self.events], [BibliographyEvent.RESET])
+        self.assert_counts_match()
+        
+        self.assertTrue(self.model.redo())
+        self.assert_counts_match()
+    
+    def test_separate_inserts(self):
+        with self.model.batch():
+            self.model.add_bibliography_item(make_item(8))
+            self.model.remove_bibliography_item(0)
+            self.model.add_bibliography_item(make_item(9))
+        self.assert_counts_match()
+    
+    def test_merged_removes_keep_range_event(self):
+        with self.model.batch():
+            self.model.remove_bibliography_item(3)
+            self.model.remove_bibliography_item(3)
+        self.assertEqual([(event.kind, event.first, event.last) for event in self.events],
+                         [(BibliographyEvent.REMOVED, 3, 4)])
+        self.assert_counts_match()
+    
+    def test_separate_changes_are_sent_one_by_one(self):
+        with self.model.batch():
+            self.model.set_item_field(1, 'year', "1990")
+            self.model.set_item_field(6, 'year', "1991")
+        self.assertEqual([event.kind for event in self.events], [BibliographyEvent.CHANGED] * 2)
+        self.assert_counts_match()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Проверка путей отчетов пакетной проверки.
+
+Запуск из корня проекта:
+    python -m unittest discover tests
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from utils.batch_checker import find_files, report_path, run_batch
+
+class ReportPathTest(unittest.TestCase):
+    """Отчеты по одноименным файлам разных каталогов"""
+    
+    REFERENCES = (
+        "Иванов И. И. Основы программирования : учебник / И. И. Иванов. — М. : Наука, 2020. — 350 с.\n"
+        "Петров П. П. Теория алгоритмов / П. П. Петров. — СПб. : Питер, 2018. — 512 с.\n"
+    )
+    
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.output = os.path.join(self.directory, "reports")
+        self.input = os.path.join(self.directory, "input")
+        for subdirectory in ("a", "b"):
+            os.makedirs(os.path.join(self.input, subdirectory))
+            with open(os.path.join(self.input, subdirectory, "thesis.txt"), 'w', encoding='utf-8') as file:
+                file.write(ReportPathTest.REFERENCES)
+    
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+    
+    def test_relative_paths_differ(self):
+        first = report_path("reports", os.path.join("input", "a", "thesis.docx"), 'csv', "input")
+        second = report_path("reports", os.path.join("input", "b", "thesis.docx"), 'csv', "input")
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, os.path.join("reports", "a", "thesis.docx.csv"))
+    
+    def test_file_outside_base_dir(self):
+        path = report_path("reports", os.path.join("other", "thesis.pdf"), 'json', "input")
+        self.assertEqual(path, os.path.join("reports", "thesis.pdf.json"))
+    
+    def test_recursive_batch_keeps_all_reports(self):
+        file_paths = find_files(self.input, recursive=True)
+        self.assertEqual(len(file_paths), 2)
+        summary = run_batch(file_paths, {}, self.output, 'json', workers=1, whole_document=True, base_dir=self.input)
+        self.assertEqual(summary['files'], 2)
+        self.assertEqual(summary['errors'], 0)
+        for subdirectory in ("a", "b"):
+            self.assertTrue(os.path.isfile(os.path.join(self.output, subdirectory, "thesis.txt.json")))
+    
+    def test_default_base_dir(self):
+        file_paths = find_files(self.input, recursive=True)
+        run_batch(file_paths, {}, self.output, 'csv', workers=1, whole_document=True)
+        for subdirectory in ("a", "b"):
+            self.assertTrue(os.path.isfile(os.path.join(self.output, subdirectory, "thesis.txt.csv")))
+
+if __name__ == '__main__':
+    unittest.main()
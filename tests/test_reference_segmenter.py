@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Проверка выделения ссылок из текста документа.
+
+Запуск из корня проекта:
+    python -m unittest discover tests
+"""
+
+import unittest
+from utils.reference_segmenter import ReferenceSegmenter
+
+class HeadingTest(unittest.TestCase):
+    """Строки из заглавных букв и заголовки разделов"""
+    
+    def test_wrapped_upper_case_line_stays_in_reference(self):
+        text = (
+            "1. Global report on diabetes / World Health Organization. —\n"
+            "WORLD HEALTH ORGANIZATION\n"
+            "Geneva, 2016. — 86 p.\n"
+            "2. Петров П. П. Теория алгоритмов. — СПб. : Питер, 2018. — 512 с."
+        )
+        references = list(ReferenceSegmenter.segment([text], wrapped=True))
+        self.assertEqual(references, [
+            "Global report on diabetes / World Health Organization. — WORLD HEALTH ORGANIZATION Geneva, 2016. — 86 p.",
+            "Петров П. П. Теория алгоритмов. — СПб. : Питер, 2018. — 512 с."
+        ])
+    
+    def test_upper_case_reference_is_kept(self):
+        lines = [
+            "ГОСТ Р ИСО МЭК",
+            "Иванов И. И. Основы программирования. — М. : Наука, 2020. — 350 с."
+        ]
+        self.assertEqual(list(ReferenceSegmenter.segment(lines)), lines)
+    
+    def test_section_headings_end_reference(self):
+        text = (
+            "Список литературы\n"
+            "1. Иванов И. И. Основы программирования. — М. :\n"
+            "Наука, 2020. — 350 с.\n"
+            "ПРИЛОЖЕНИЕ А\n"
+            "Листинг программы"
+        )
+        references = list(ReferenceSegmenter.segment([text], wrapped=True))
+        self.assertEqual(references[0], "Иванов И. И. Основы программирования. — М. : Наука, 2020. — 350 с.")
+        self.assertNotIn("ПРИЛОЖЕНИЕ А", ' '.join(references))
+    
+    def test_numbering_continues_after_heading(self):
+        text = (
+            "1. Иванов И. И. Основы программирования. — М. : Наука, 2020. — 350 с.\n"
+            "ЗАКЛЮЧЕНИЕ\n"
+            "2. Петров П. П. Теория алгоритмов. — СПб. : Питер, 2018. — 512 с."
+        )
+        references = list(ReferenceSegmenter.segment([text], wrapped=True))
+        self.assertEqual(references, [
+            "Иванов И. И. Основы программирования. — М. : Наука, 2020. — 350 с.",
+            "Петров П. П. Теория алгоритмов. — СПб. : Питер, 2018. — 512 с."
+        ])
+    
+    def test_appendix_like_reference_is_not_heading(self):
+        self.assertFalse(ReferenceSegmenter._is_heading("Приложение к приказу Минобрнауки России от 01.01.2020 № 1"))
+        self.assertTrue(ReferenceSegmenter._is_heading("ПРИЛОЖЕНИЕ Б"))
+        self.assertTrue(ReferenceSegmenter._is_heading("Содержание"))
+
+if __name__ == '__main__':
+    unittest.main()
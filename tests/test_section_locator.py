@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Проверка поиска конца раздела списка литературы.
+
+Запуск из корня проекта:
+    python -m unittest discover tests
+"""
+
+import unittest
+from utils.section_locator import cut_at_section_end, is_section_end
+
+class SectionEndTest(unittest.TestCase):
+    """Заголовки приложений и похожие на них ссылки"""
+    
+    HEADINGS = (
+        "ПРИЛОЖЕНИЕ А",
+        "Приложение 1",
+        "Приложения",
+        "Приложение Б. Листинг программы",
+        "Приложение А — Исходный код",
+        "Appendix A: Proofs",
+        "Appendices"
+    )
+    
+    REFERENCES = (
+        "Приложение к приказу Минобрнауки России от 01.01.2020 № 1",
+        "Приложение 1 к постановлению Правительства РФ от 16.04.2021 № 5",
+        "Приложение А к ГОСТ Р 7.0.5-2008. — М. : Стандартинформ, 2008. — 23 с.",
+        "Приложения к диссертации // Вестник МГУ. 2020. № 2. С. 1-5.",
+        "Appendix to the report / ed. by J. Smith"
+    )
+    
+    def test_headings(self):
+        for line in SectionEndTest.HEADINGS:
+            self.assertTrue(is_section_end(line), line)
+    
+    def test_references_are_not_headings(self):
+        for line in SectionEndTest.REFERENCES:
+            self.assertFalse(is_section_end(line), line)
+    
+    def test_references_after_appendix_like_reference_are_kept(self):
+        lines = [
+            "Иванов И. И. Основы программирования. — М. : Наука, 2020. — 350 с.",
+            "Приложение к приказу Минобрнауки России от 01.01.2020 № 1",
+            "Петров П. П. Анализ данных // Вестник МГУ. — 2021. — № 3. — С. 10-20.",
+            "Сидоров С. С. Теория алгоритмов. — СПб. : Питер, 2018. — 512 с."
+        ]
+        chunks = ['\n'.join(lines) + '\nПРИЛОЖЕНИЕ А\nЛистинг программы']
+        self.assertEqual(list(cut_at_section_end(chunks)), ['\n'.join(lines)])
+
+if __name__ == '__main__':
+    unittest.main()
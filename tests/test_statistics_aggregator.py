@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Проверка счетчиков StatisticsAggregator на случайных сеансах правки:
+после каждого шага счетчики, обновляемые по событиям модели, должны
+совпадать с подсчетом по списку заново.
+
+Запуск из корня проекта:
+    python -m unittest discover tests
+"""
+
+import random
+import unittest
+from models.app_model import AppModel
+from models.bibliography_item import BibliographyItem
+from models.statistics_aggregator import StatisticsAggregator
+
+AUTHORS = ("Иванов И. И.", "Петров П. П.", "Smith J.", "Lee K.")
+LANGUAGES = ("ru", "en")
+TYPES = ("book", "article", "web")
+
+def random_item(rng):
+    """Случайная библиографическая запись"""
+    item = BibliographyItem(f"Запись {rng.random()}")
+    item.authors = rng.sample(AUTHORS, rng.randint(0, 2))
+    item.year = rng.choice(("", "1999", "2015", "2020", "2023", "н.д."))
+    item.language = rng.choice(LANGUAGES)
+    item.type = rng.choice(TYPES)
+    item.is_vak = rng.random() < 0.3
+    item.is_rinc = rng.random() < 0.5
+    return item
+
+class RandomSessionTest(unittest.TestCase):
+    """Случайные правки, пакеты, отмена и повтор"""
+    
+    STEPS = 400
+    
+    def setUp(self):
+        self.model = AppModel()
+        self.aggregator = StatisticsAggregator(self.model.bibliography_list)
+        self.model.subscribe(lambda event: self.aggregator.apply_event(event, self.model.bibliography_list))
+    
+    def assert_counts_match(self, step):
+        for recent_year, author in ((2015, ""), (2020, "Иванов И. И."), (2000, "Lee K.")):
+            expected = StatisticsAggregator(list(self.model.bibliography_list)).statistics(recent_year, author)
+            self.assertEqual(self.aggregator.statistics(recent_year, author), expected, f"шаг {step}")
+    
+    def random_remove(self, rng):
+        if len(self.model.bibliography_list):
+            self.model.remove_bibliography_item(rng.randrange(len(self.model.bibliography_list)))
+    
+    def random_edit(self, rng):
+        model = self.model
+        count = len(model.bibliography_list)
+        action = rng.random()
+        if action < 0.35 or not count:
+            model.add_bibliography_item(random_item(rng))
+        elif action < 0.55:
+            self.random_remove(rng)
+        elif action < 0.7:
+            model.set_item_field(rng.randrange(count), 'year', rng.choice(("2010", "2021", "")))
+        elif action < 0.8:
+            model.replace_bibliography_item(rng.randrange(count), random_item(rng))
+        elif action < 0.9:
+            model.set_item_field(rng.randrange(count), 'language', rng.choice(LANGUAGES))
+        elif action < 0.97:
+            model.sort_bibliography(key=lambda item: item.year, reverse=rng.random() < 0.5)
+        else:
+            model.clear_bibliography()
+    
+    def test_random_session(self):
+        rng = random.Random(20240517)
+        for _ in range(20):
+            self.model.add_bibliography_item(random_item(rng))
+        
+        for step in range(RandomSessionTest.STEPS):
+            action = rng.random()
+            if action < 0.5:
+                self.random_edit(rng)
+            elif action < 0.7:
+                with self.model.batch():
+                    for _ in range(rng.randint(2, 5)):
+                        self.random_edit(rng)
+            elif action < 0.8:
+                # Удаления из разных мест списка одним пакетом
+                with self.model.batch():
+                    for _ in range(rng.randint(2, 4)):
+                        self.random_remove(rng)
+            elif action < 0.92:
+                self.model.undo()
+            else:
+                self.model.redo()
+            self.assert_counts_match(step)
+    
+    def test_batched_removes_and_undo(self):
+        for number in range(8):
+            item = BibliographyItem(f"A{number}")
+            item.authors = [f"A{number}"]
+            self.model.add_bibliography_item(item)
+        self.aggregator.statistics(2000)
+        
+        with self.model.batch():
+            self.model.remove_bibliography_item(2)
+            self.model.remove_bibliography_item(5)
+        self.assert_counts_match("remove")
+        self.model.undo()
+        self.assert_counts_match("undo")
+        self.assertEqual(self.aggregator.statistics(2000, "A6")['specified_author_count'], 1)
+        self.model.redo()
+        self.assert_counts_match("redo")
+
+if __name__ == '__main__':
+    unittest.main()
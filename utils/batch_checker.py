@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from utils.criteria_checker import CriteriaChecker
+from utils.file_utils import iter_file
+from utils.reference_parser import ReferenceParser
+from utils.reference_segmenter import ReferenceSegmenter
+from utils.section_locator import iter_bibliography_section
+
+# Форматы файлов, принимаемые пакетной проверкой
+SUPPORTED_EXTENSIONS = ('.docx', '.pdf', '.txt')
+
+# Форматы отчетов
+REPORT_FORMATS = ('csv', 'json')
+
+# Имя файла сводного отчета (без расширения)
+SUMMARY_NAME = "summary"
+
+# Порядок критериев в отчетах (ключи результатов check_compliance)
+CRITERIA_KEYS = ('english', 'recent', 'vak', 'rinc', 'author')
+
+def find_files(directory, recursive=False):
+    """
+    Поиск файлов поддерживаемых форматов в каталоге
+    
+    Args:
+        directory (str): Каталог с файлами
+        recursive (bool): Искать также во вложенных каталогах
+    
+    Returns:
+        list: Пути к файлам в алфавитном порядке
+    """
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                paths.append(os.path.join(root, name))
+        if not recursive:
+            break
+    return paths
+
+def check_file(file_path, criteria, whole_document=False, engine="regex"):
+    """
+    Импорт, распознавание и проверка списка литературы одного файла
+    (те же шаги, что импорт в главном окне и проверка на вкладке критериев)
+    
+    Args:
+        file_path (str): Путь к файлу (DOCX, PDF, TXT)
+        criteria (dict): Словарь с критериями проверки
+        whole_document (bool): Импортировать весь документ, а не только
+            раздел списка литературы
+        engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+    
+    Returns:
+        dict: Отчет по файлу: file, status (ok, error), error, seconds,
+            parse_errors, statistics, results, passed, total
+    """
+    started = time.perf_counter()
+    report = {
+        'file': file_path,
+        'status': 'ok',
+        'error': "",
+        'seconds': 0.0,
+        'parse_errors': 0,
+        'statistics': None,
+        'results': {},
+        'passed': 0,
+        'total': 0
+    }
+    try:
+        if whole_document:
+            chunks = iter_file(file_path)
+        else:
+            chunks = iter_bibliography_section(file_path)
+        wrapped = os.path.splitext(file_path)[1].lower() == '.pdf'
+        references = ReferenceSegmenter.segment(chunks, wrapped=wrapped)
+        
+        # Файлы распределены по процессам пула, поэтому ссылки одного
+        # файла распознаются в текущем процессе
+        items = ReferenceParser.parse_many(references, workers=1, engine=engine)
+        report['parse_errors'] = sum(1 for item in items if item.get_additional_info('parse_error') is not None)
+        
+        stats = CriteriaChecker.list_statistics(items, criteria)
+        results = CriteriaChecker.check_compliance(stats, criteria) if items else {}
+        report['statistics'] = stats
+        report['results'] = results
+        report['passed'] = sum(1 for result in results.values() if result['match'])
+        report['total'] = len(results)
+    except Exception as e:
+        report['status'] = 'error'
+        report['error'] = str(e)
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    return report
+
+def _init_worker():
+    """Инициализация процесса пула: кэш распознанных ссылок в памяти"""
+    # Одни и те же источники часто встречаются в разных работах; кэш
+    # не сохраняется на диск, чтобы процессы не перезаписывали файл
+    ReferenceParser.enable_cache()
+
+def check_files(file_paths, criteria, workers=None, whole_document=False, engine="regex"):
+    """
+    Проверка файлов в пуле процессов (по одному файлу на задачу)
+    
+    Args:
+        file_paths (list): Пути к файлам
+        criteria (dict): Словарь с критериями проверки
+        workers (int): Количество процессов (по умолчанию - число ядер).
+            При workers <= 1 файлы проверяются в текущем процессе
+        whole_document (bool): Импортировать документы целиком
+        engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+    
+    Yields:
+        dict: Отчеты check_file в порядке file_paths
+    """
+    file_paths = list(file_paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(file_paths))
+    
+    if workers <= 1:
+        for file_path in file_paths:
+            yield check_file(file_path, criteria, whole_document, engine)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        yield from executor.map(check_file, file_paths, repeat(criteria), repeat(whole_document), repeat(engine))
+
+def common_directory(file_paths):
+    """
+    Общий каталог проверяемых файлов
+    
+    Args:
+        file_paths (list): Пути к файлам
+    
+    Returns:
+        str: Общий каталог или None (нет файлов, файлы на разных дисках)
+    """
+    directories = [os.path.dirname(os.path.abspath(file_path)) for file_path in file_paths]
+    if not directories:
+        return None
+    try:
+        return os.path.commonpath(directories)
+    except ValueError:
+        return None
+
+def report_path(output_dir, file_path, report_format, base_dir=None):
+    """
+    Путь к отчету по файлу. Вложенные каталоги относительно base_dir
+    повторяются в каталоге отчетов, чтобы отчеты по одноименным файлам
+    разных каталогов (a/thesis.docx и b/thesis.docx) не перезаписывали
+    друг друга; расширение исходного файла сохраняется в имени отчета
+    (у работы могут быть файлы DOCX и PDF с одним именем)
+    
+    Args:
+        output_dir (str): Каталог отчетов
+        file_path (str): Путь к проверенному файлу
+        report_format (str): Формат отчета (csv, json)
+        base_dir (str): Каталог, относительно которого строится путь
+            (None или файл вне каталога - только имя файла)
+    
+    Returns:
+        str: Путь к файлу отчета
+    """
+    name = os.path.basename(file_path)
+    if base_dir is not None:
+        try:
+            relative = os.path.relpath(os.path.abspath(file_path), os.path.abspath(base_dir))
+        except ValueError:
+            relative = name
+        if relative != os.pardir and not relative.startswith(os.pardir + os.sep):
+            name = relative
+    return os.path.join(output_dir, f"{name}.{report_format}")
+
+def write_report(report, path, report_format):
+    """
+    Сохранение отчета по файлу
+    
+    Args:
+        report (dict): Отчет check_file
+        path (str): Путь к файлу отчета
+        report_format (str): Формат отчета (csv - строка на критерий,
+            json - отчет целиком со статистикой)
+    """
+    if report_format == 'json':
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        return
+    
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['criterion', 'name', 'required', 'current', 'match'])
+        for key in CRITERIA_KEYS:
+            result = report['results'].get(key)
+            if result:
+                writer.writerow([key, result['name'], result['required'], result['current'], int(result['match'])])
+        if report['status'] != 'ok':
+            writer.writerow(['error', report['error'], "", "", 0])
+
+def summarize(reports):
+    """
+    Сводка по отчетам файлов
+    
+    Args:
+        reports (list): Отчеты check_file
+    
+    Returns:
+        dict: Количество файлов (files, errors, empty, compliant,
+            partial, failed) и краткие строки по каждому файлу (rows)
+    """
+    summary = {'files': 0, 'errors': 0, 'empty': 0, 'compliant': 0, 'partial': 0, 'failed': 0, 'rows': []}
+    for report in reports:
+        summary['files'] += 1
+        if report['status'] != 'ok':
+            summary['errors'] += 1
+        elif not report['total']:
+            summary['empty'] += 1
+        elif report['passed'] == report['total']:
+            summary['compliant'] += 1
+        elif report['passed']:
+            summary['partial'] += 1
+        else:
+            summary['failed'] += 1
+        
+        stats = report['statistics'] or {}
+        row = {
+            'file': report['file'],
+            'status': report['status'],
+            'total_items': stats.get('total_items', 0),
+            'parse_errors': report['parse_errors'],
+            'passed': report['passed'],
+            'total': report['total'],
+            'seconds': report['seconds'],
+            'error': report['error']
+        }
+        for key in CRITERIA_KEYS:
+            result = report['results'].get(key)
+            row[key] = int(result['match']) if result else ""
+        summary['rows'].append(row)
+    return summary
+
+def write_summary(summary, path, report_format):
+    """
+    Сохранение сводного отчета
+    
+    Args:
+        summary (dict): Сводка summarize
+        path (str): Путь к файлу отчета
+        report_format (str): Формат отчета (csv - строка на файл, json)
+    """
+    if report_format == 'json':
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+        return
+    
+    columns = ['file', 'status', 'total_items', 'parse_errors', 'passed', 'total'] + list(CRITERIA_KEYS) + ['seconds', 'error']
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(summary['rows'])
+
+def run_batch(file_paths, criteria, output_dir, report_format='csv', workers=None, whole_document=False, engine="regex",
+              progress=None, base_dir=None):
+    """
+    Пакетная проверка файлов с сохранением отчетов по каждому файлу
+    и сводного отчета в каталог output_dir
+    
+    Args:
+        file_paths (list): Пути к файлам
+        criteria (dict): Словарь с критериями проверки
+        output_dir (str): Каталог отчетов (создается при отсутствии)
+        report_format (str): Формат отчетов (csv, json)
+        workers (int): Количество процессов (см. check_files)
+        whole_document (bool): Импортировать документы целиком
+        engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+        progress (callable): Функция progress(report), вызываемая после
+            проверки каждого файла
+        base_dir (str): Каталог, относительно которого строятся пути
+            отчетов (см. report_path; по умолчанию - общий каталог файлов)
+    
+    Returns:
+        dict: Сводка summarize
+    """
+    if report_format not in REPORT_FORMATS:
+        raise Exception(f"Неподдерживаемый формат отчета: {report_format}")
+    file_paths = list(file_paths)
+    if base_dir is None:
+        base_dir = common_directory(file_paths)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    reports = []
+    for report in check_files(file_paths, criteria, workers, whole_document, engine):
+        path = report_path(output_dir, report['file'], report_format, base_dir)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_report(report, path, report_format)
+        reports.append(report)
+        if progress:
+            progress(report)
+    
+    summary = summarize(reports)
+    write_summary(summary, os.path.join(output_dir, f"{SUMMARY_NAME}.{report_format}"), report_format)
+    return summary
@@ -1,35 +1,35 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import codecs
 import os
 from docx import Document
 from PyPDF2 import PdfReader
 
-def read_docx(file_path):
+# Кодировки текстовых файлов в порядке проверки
+TXT_ENCODINGS = ('utf-8', 'windows-1251', 'latin-1', 'cp1252')
+
+def iter_docx(file_path):
     """
-    Чтение текста из файла DOCX
+    Последовательное чтение абзацев файла DOCX
     
     Args:
         file_path (str): Путь к файлу
         
-    Returns:
-        str: Текст из файла
+    Yields:
+        str: Текст непустого абзаца
     """
     try:
         doc = Document(file_path)
-        full_text = []
-        
         for paragraph in doc.paragraphs:
             if paragraph.text.strip():
-                full_text.append(paragraph.text)
-        
-        return '\n'.join(full_text)
+                yield paragraph.text
     except Exception as e:
         raise Exception(f"Ошибка при чтении файла DOCX: {str(e)}")
 
-def read_pdf(file_path):
+def read_docx(file_path):
     """
-    Чтение текста из файла PDF
+    Чтение текста из файла DOCX
     
     Args:
         file_path (str): Путь к файлу
@@ -37,19 +37,40 @@ def read_pdf(file_path):
     Returns:
         str: Текст из файла
     """
+    return '\n'.join(iter_docx(file_path))
+
+def iter_pdf(file_path):
+    """
+    Постраничное чтение текста файла PDF: текст страницы извлекается
+    только при запросе следующей порции
+    
+    Args:
+        file_path (str): Путь к файлу
+        
+    Yields:
+        str: Текст непустой страницы
+    """
     try:
         reader = PdfReader(file_path)
-        full_text = []
-        
         for page in reader.pages:
             text = page.extract_text()
             if text.strip():
-                full_text.append(text)
-        
-        return '\n'.join(full_text)
+                yield text
     except Exception as e:
         raise Exception(f"Ошибка при чтении файла PDF: {str(e)}")
 
+def read_pdf(file_path):
+    """
+    Чтение текста из файла PDF
+    
+    Args:
+        file_path (str): Путь к файлу
+        
+    Returns:
+        str: Текст из файла
+    """
+    return '\n'.join(iter_pdf(file_path))
+
 def read_txt(file_path):
     """
     Чтение текста из текстового файла
@@ -65,8 +86,7 @@ def read_txt(file_path):
             return file.read()
     except UnicodeDecodeError:
         # Если не удалось прочитать в utf-8, пробуем другие кодировки
-        encodings = ['windows-1251', 'latin-1', 'cp1252']
-        for encoding in encodings:
+        for encoding in TXT_ENCODINGS[1:]:
             try:
                 with open(file_path, 'r', encoding=encoding) as file:
                     return file.read()
@@ -76,6 +96,48 @@ def read_txt(file_path):
     except Exception as e:
         raise Exception(f"Ошибка при чтении текстового файла: {str(e)}")
 
+def detect_txt_encoding(file_path, block_size=65536):
+    """
+    Определение кодировки текстового файла поблочным декодированием
+    без загрузки всего файла в память
+    
+    Args:
+        file_path (str): Путь к файлу
+        block_size (int): Размер читаемого блока, байт
+        
+    Returns:
+        str: Первая из TXT_ENCODINGS, в которой файл декодируется без ошибок
+    """
+    for encoding in TXT_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(file_path, 'rb') as file:
+                for block in iter(lambda: file.read(block_size), b''):
+                    decoder.decode(block)
+                decoder.decode(b'', final=True)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    raise Exception(f"Не удалось определить кодировку файла {file_path}")
+
+def iter_txt(file_path):
+    """
+    Построчное чтение текстового файла
+    
+    Args:
+        file_path (str): Путь к файлу
+        
+    Yields:
+        str: Строка файла
+    """
+    encoding = detect_txt_encoding(file_path)
+    try:
+        with open(file_path, 'r', encoding=encoding) as file:
+            for line in file:
+                yield line
+    except Exception as e:
+        raise Exception(f"Ошибка при чтении текстового файла: {str(e)}")
+
 def save_to_txt(content, file_path):
     """
     Сохранение текста в текстовый файл
@@ -132,6 +194,29 @@ def read_file(file_path):
     else:
         raise Exception(f"Неподдерживаемый формат файла: {ext}")
 
+def iter_file(file_path):
+    """
+    Последовательное чтение текста файла порциями в зависимости от формата:
+    абзацами (DOCX), страницами (PDF) или строками (TXT)
+    
+    Args:
+        file_path (str): Путь к файлу
+        
+    Returns:
+        iterator: Порции текста файла
+    """
+    _, ext = os.path.splitext(file_path)
+    ext = ext.lower()
+    
+    if ext == '.docx':
+        return iter_docx(file_path)
+    elif ext == '.pdf':
+        return iter_pdf(file_path)
+    elif ext == '.txt':
+        return iter_txt(file_path)
+    else:
+        raise Exception(f"Неподдерживаемый формат файла: {ext}")
+
 def save_file(content, file_path):
     """
     Сохранение текста в файл в зависимости от его формата
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+
+class GostTokenizer:
+    """
+    Распознавание ссылок ГОСТ 7.1/7.0.5 по разделителям областей.
+    Ссылка один раз просматривается и делится на зоны по предписанным
+    разделителям (". — ", " // ", " / "), после чего поля назначаются
+    по порядку зон, без применения шаблонов ко всей строке.
+    """
+    
+    # Виды разделителей зон
+    START = 'start'  # Начало ссылки
+    AREA = 'area'  # ". — " между областями описания
+    HOST = 'host'  # " // " перед сведениями об издании, в котором помещена статья
+    RESPONSIBILITY = 'responsibility'  # " / " перед сведениями об ответственности
+    
+    # Разделители зон. Каждая альтернатива начинается с точки или пробела,
+    # а пробелы перед разделителем сопоставляются только с начала серии
+    # пробелов, поэтому просмотр строки линеен.
+    # Область без тире (". 2016. № 7. С. 12-30.") распознается по
+    # характерному началу следующей области, но не после инициала или
+    # сокращения из одной буквы ("И. О.", "С. 10")
+    ZONE_SEPARATOR_PATTERN = re.compile(
+        r'(?P<area>\.\s+[—–-]{1,2}\s+'  # ". — "
+        r'|\.(?<!\b[^\W\d_]\.)\s+(?=\d{4}\b'  # ". 2020"
+        r'|\d+\s+[сСpP]\.'  # ". 300 с."
+        r'|(?:Т|Vol)\.\s*\d'  # ". Т. 5"
+        r'|№'  # ". № 3"
+        r'|[СсPp]\.\s*\d'  # ". С. 10"
+        r'|URL:|DOI'  # ". URL: ..."
+        r'|[^\s.,:/]{1,20}\.?\s*:\s'  # ". М. : Наука"
+        r'|[^.,/:]{1,60},\s+\d{4}\b))'  # ". Springer, 2019"
+        r'|(?P<host>\s(?<!\s\s)\s*//\s*)'
+        r'|(?P<responsibility>\s(?<!\s\s)\s*/\s+)'
+    )
+    
+    # Заголовок описания: авторы вида "Фамилия И. О." через запятую
+    AUTHORS_HEADING_PATTERN = re.compile(r"^(?:[A-ZА-ЯЁ][\w'’-]*\s+(?:[A-ZА-ЯЁ]\.\s*){1,3}(?:,\s*)?)+")
+    # Лица в сведениях об ответственности: "И. О. Фамилия"
+    RESPONSIBILITY_PERSON_PATTERN = re.compile(r"(?:[A-ZА-ЯЁ]\.\s*){1,3}[A-ZА-ЯЁ][\w'’-]+")
+    EDITORS_PATTERN = re.compile(r'^(?:под\s+(?:общ\.\s+)?ред\.|сост\.|пер\.)', re.IGNORECASE)
+    
+    # Элементы внутри зон
+    COLON_PATTERN = re.compile(r'(?<!\s)\s*:\s+')
+    COMMA_PATTERN = re.compile(r',\s+')
+    ELECTRONIC_RESOURCE_PATTERN = re.compile(r'(?<!\s)\s*\[Электронный\s+ресурс\]', re.IGNORECASE)
+    THESIS_PATTERN = re.compile(r'автореф\.\s+дис\.|дис\.\s+\.\.\.', re.IGNORECASE)
+    URL_PATTERN = re.compile(r'(?:URL:\s*)?(https?://\S+)')
+    DOI_PATTERN = re.compile(r'^DOI:?\s*(\S+)', re.IGNORECASE)
+    ISBN_PATTERN = re.compile(r'^(?:ISBN|ISSN)\b', re.IGNORECASE)
+    EDITION_PATTERN = re.compile(r'^(\d+)\s*-\s*е\s+изд', re.IGNORECASE)
+    PUBLICATION_PATTERN = re.compile(r'^(?P<city>[^:,]+?)\s*:\s*(?P<publisher>[^,]+?)(?:,\s*(?P<year>\d{4}))?$')
+    PLACE_YEAR_PATTERN = re.compile(r'^(?P<place>[^:,\d][^:,]*),\s*(?P<year>\d{4})$')
+    YEAR_PATTERN = re.compile(r'^(\d{4})(?:\s*г\.?)?$')
+    VOLUME_PATTERN = re.compile(r'^(?:Т|Vol)\.\s*(\S+)', re.IGNORECASE)
+    ISSUE_PATTERN = re.compile(r'^(?:№|No\.)\s*(.+)')
+    PAGES_PATTERN = re.compile(r'^[СсPp]\.\s*(\d.*)')
+    EXTENT_PATTERN = re.compile(r'^(\d+)\s+[сСpP]\.?$')
+    
+    @staticmethod
+    def tokenize(text):
+        """
+        Разбиение ссылки на зоны за один просмотр строки
+        
+        Args:
+            text (str): Текст библиографической ссылки
+        
+        Returns:
+            list: Пары (вид разделителя перед зоной, текст зоны); первая
+                зона имеет вид START
+        """
+        zones = []
+        kind = GostTokenizer.START
+        position = 0
+        
+        for match in GostTokenizer.ZONE_SEPARATOR_PATTERN.finditer(text):
+            zones.append((kind, text[position:match.start()].strip()))
+            kind = match.lastgroup
+            position = match.end()
+        
+        zones.append((kind, text[position:].strip().rstrip('.').strip()))
+        return zones
+    
+    @staticmethod
+    def parse(text, item):
+        """
+        Распознавание элементов ссылки ГОСТ по зонам
+        
+        Args:
+            text (str): Текст библиографической ссылки
+            item (BibliographyItem): Объект для заполнения
+        """
+        head = []
+        host = []
+        areas = []
+        
+        # Группировка зон: заголовочная часть, издание-источник и области
+        current = head
+        for kind, zone in GostTokenizer.tokenize(text):
+            if kind == GostTokenizer.HOST:
+                current = host
+            elif kind == GostTokenizer.AREA:
+                current = []
+                areas.append(current)
+            current.append((kind, zone))
+        
+        is_thesis = GostTokenizer._fill_head(head, item)
+        
+        if host:
+            journal = host[0][1]
+            item.journal = GostTokenizer.ELECTRONIC_RESOURCE_PATTERN.sub('', journal).rstrip('.').strip()
+        
+        for area in areas:
+            GostTokenizer._fill_area(' / '.join(zone for _, zone in area), item, is_thesis)
+        
+        if is_thesis:
+            item.type = 'thesis'
+        elif item.journal:
+            item.type = 'article'
+        elif item.url and not item.publisher:
+            item.type = 'web'
+        else:
+            item.type = 'book'
+    
+    @staticmethod
+    def _fill_head(zones, item):
+        """
+        Заполнение авторов, названия и подзаголовка по заголовочной части
+        
+        Args:
+            zones (list): Зоны до первой области или разделителя "//"
+            item (BibliographyItem): Объект для заполнения
+        
+        Returns:
+            bool: True, если ссылка описывает автореферат или диссертацию
+        """
+        title_zone = zones[0][1] if zones else ""
+        responsibility = [zone for kind, zone in zones[1:] if kind == GostTokenizer.RESPONSIBILITY]
+        
+        heading = GostTokenizer.AUTHORS_HEADING_PATTERN.match(title_zone)
+        if heading and title_zone[heading.end():].strip():
+            item.authors = [author.strip() for author in heading.group(0).split(',') if author.strip()]
+            title_zone = title_zone[heading.end():]
+        elif responsibility and not GostTokenizer.EDITORS_PATTERN.match(responsibility[0]):
+            # Описание под заглавием: авторы указаны только после "/"
+            item.authors = GostTokenizer.RESPONSIBILITY_PERSON_PATTERN.findall(responsibility[0])
+        
+        title_zone = GostTokenizer.ELECTRONIC_RESOURCE_PATTERN.sub('', title_zone)
+        parts = GostTokenizer.COLON_PATTERN.split(title_zone.strip(), 1)
+        item.title = parts[0].rstrip('.').strip()
+        
+        is_thesis = False
+        if len(parts) > 1:
+            if GostTokenizer.THESIS_PATTERN.search(parts[1]):
+                is_thesis = True
+            else:
+                item.subtitle = parts[1].rstrip('.').strip()
+        
+        return is_thesis
+    
+    @staticmethod
+    def _fill_area(area, item, is_thesis):
+        """
+        Заполнение полей по одной области описания
+        
+        Args:
+            area (str): Текст области
+            item (BibliographyItem): Объект для заполнения
+            is_thesis (bool): Описывается автореферат или диссертация
+                (место издания указывается без издательства)
+        """
+        area = area.rstrip('.').strip()
+        
+        url_match = GostTokenizer.URL_PATTERN.search(area)
+        if url_match:
+            item.url = url_match.group(1).rstrip('.')
+            return
+        
+        doi_match = GostTokenizer.DOI_PATTERN.match(area)
+        if doi_match:
+            item.doi = doi_match.group(1).rstrip('.')
+            return
+        
+        if GostTokenizer.ISBN_PATTERN.match(area):
+            return
+        
+        edition_match = GostTokenizer.EDITION_PATTERN.match(area)
+        if edition_match:
+            item.edition = edition_match.group(1)
+            return
+        
+        publication_match = GostTokenizer.PUBLICATION_PATTERN.match(area)
+        if publication_match:
+            item.city = publication_match.group('city').strip()
+            item.publisher = publication_match.group('publisher').strip()
+            if publication_match.group('year'):
+                item.year = publication_match.group('year')
+            return
+        
+        place_match = GostTokenizer.PLACE_YEAR_PATTERN.match(area)
+        if place_match:
+            # "М., 2017" - место издания, "Springer, 2019" - издательство
+            place = place_match.group('place').strip()
+            if is_thesis or place.endswith('.'):
+                item.city = place
+            else:
+                item.publisher = place
+            item.year = place_match.group('year')
+            return
+        
+        # Область из нескольких элементов через запятую: "Т. 5, № 3"
+        for part in GostTokenizer.COMMA_PATTERN.split(area):
+            GostTokenizer._fill_element(part.strip(), item)
+    
+    @staticmethod
+    def _fill_element(element, item):
+        """
+        Заполнение поля по одному элементу области (год, том, номер, страницы)
+        
+        Args:
+            element (str): Текст элемента
+            item (BibliographyItem): Объект для заполнения
+        """
+        match = GostTokenizer.YEAR_PATTERN.match(element)
+        if match:
+            item.year = match.group(1)
+            return
+        
+        match = GostTokenizer.VOLUME_PATTERN.match(element)
+        if match:
+            item.volume = match.group(1)
+            return
+        
+        match = GostTokenizer.ISSUE_PATTERN.match(element)
+        if match:
+            item.issue = match.group(1).strip()
+            return
+        
+        match = GostTokenizer.PAGES_PATTERN.match(element)
+        if match:
+            item.pages = match.group(1).strip()
+            return
+        
+        match = GostTokenizer.EXTENT_PATTERN.match(element)
+        if match:
+            item.pages = match.group(1)
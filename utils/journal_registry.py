@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import csv
+import hashlib
+import json
+import os
+import sys
+from array import array
+from itertools import islice
+
+# Каталог с перечнями журналов ВАК и РИНЦ
+REGISTRY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources', 'registries'
+)
+
+# Каталог кэша автоматов (в профиле пользователя: каталог программы
+# может быть недоступен для записи или общим для нескольких пользователей)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".biblioanalytics", "registries")
+
+def fold_journal_name(text):
+    """
+    Приведение названия журнала к форме для сравнения:
+    нижний регистр, "ё" заменяется на "е", пробелы схлопываются
+    
+    Args:
+        text (str): Название журнала
+    
+    Returns:
+        str: Нормализованное название
+    """
+    return ' '.join(text.lower().replace('ё', 'е').split())
+
+def load_journal_titles(path):
+    """
+    Чтение перечня журналов из файла CSV или JSON
+    
+    CSV: колонка "title" (или первая колонка, если заголовка нет).
+    JSON: список названий, список объектов с ключом "title"
+    или объект с ключом "journals", содержащий такой список.
+    
+    Args:
+        path (str): Путь к файлу перечня
+    
+    Returns:
+        list: Названия журналов
+    """
+    _, ext = os.path.splitext(path)
+    ext = ext.lower()
+    
+    try:
+        if ext == '.json':
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if isinstance(data, dict):
+                data = data.get('journals', [])
+            titles = [entry.get('title', '') if isinstance(entry, dict) else entry for entry in data]
+        elif ext == '.csv':
+            with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+                rows = list(csv.reader(file))
+            column = 0
+            if rows and 'title' in [cell.strip().lower() for cell in rows[0]]:
+                column = [cell.strip().lower() for cell in rows[0]].index('title')
+                rows = rows[1:]
+            titles = [row[column] for row in rows if len(row) > column]
+        else:
+            raise Exception(f"Неподдерживаемый формат перечня журналов: {ext}")
+    except (OSError, ValueError) as e:
+        raise Exception(f"Ошибка при чтении перечня журналов {path}: {str(e)}")
+    
+    return [title.strip() for title in titles if isinstance(title, str) and title.strip()]
+
+class JournalMatcher:
+    """
+    Автомат Ахо-Корасик для поиска названий журналов из перечня в строке.
+    Строка просматривается один раз независимо от размера перечня.
+    """
+    
+    def __init__(self, titles):
+        """
+        Построение автомата
+        
+        Args:
+            titles (iterable): Названия журналов
+        """
+        # Переходы, суффиксные ссылки и номер найденного названия для каждого узла
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [-1]
+        self.titles = []
+        
+        for title in titles:
+            pattern = fold_journal_name(title)
+            if not pattern:
+                continue
+            
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(-1)
+                node = next_node
+            
+            if self._output[node] < 0:
+                self._output[node] = len(self.titles)
+                self.titles.append(title)
+        
+        self._build_fail_links()
+    
+    def _build_fail_links(self):
+        """Построение суффиксных ссылок обходом в ширину"""
+        queue = list(self._goto[0].values())
+        position = 0
+        
+        while position < len(queue):
+            node = queue[position]
+            position += 1
+            
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                
+                # Узел наследует совпадение по суффиксной ссылке,
+                # чтобы короткое название внутри длинного не терялось
+                if self._output[child] < 0:
+                    self._output[child] = self._output[self._fail[child]]
+    
+    def find(self, text):
+        """
+        Поиск первого названия из перечня, входящего в строку
+        
+        Args:
+            text (str): Строка (например, название журнала из ссылки)
+        
+        Returns:
+            str: Найденное название из перечня или None
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        node = 0
+        
+        for char in fold_journal_name(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node] >= 0:
+                return self.titles[output[node]]
+        
+        return None
+    
+    def tables(self):
+        """
+        Таблицы автомата в виде массивов чисел и строк (для кэша на диске)
+        
+        Returns:
+            tuple: (число переходов каждого узла, символы переходов,
+                целевые узлы переходов, суффиксные ссылки, номера названий)
+        """
+        counts = array('i', (len(edges) for edges in self._goto))
+        chars = ''.join(char for edges in self._goto for char in edges)
+        targets = array('i', (target for edges in self._goto for target in edges.values()))
+        return counts, chars, targets, array('i', self._fail), array('i', self._output)
+    
+    @classmethod
+    def from_tables(cls, titles, counts, chars, targets, fail, output):
+        """
+        Восстановление автомата по таблицам (см. tables) без построения
+        
+        Args:
+            titles (list): Названия журналов
+            counts (array): Число переходов каждого узла
+            chars (str): Символы переходов
+            targets (array): Целевые узлы переходов
+            fail (array): Суффиксные ссылки
+            output (array): Номер найденного названия для каждого узла
+        
+        Returns:
+            JournalMatcher: Автомат
+        """
+        nodes = len(counts)
+        if (len(fail) != nodes or len(output) != nodes or len(chars) != len(targets)
+                or sum(counts) != len(targets)):
+            raise ValueError("Несогласованные таблицы автомата")
+        if any(not 0 <= node < nodes for table in (targets, fail) for node in table):
+            raise ValueError("Ссылка на несуществующий узел автомата")
+        if any(not -1 <= index < len(titles) for index in output):
+            raise ValueError("Ссылка на несуществующее название")
+        
+        matcher = cls([])
+        edges = zip(chars, targets)
+        matcher._goto = [dict(islice(edges, count)) for count in counts]
+        matcher._fail = fail.tolist()
+        matcher._output = output.tolist()
+        matcher.titles = list(titles)
+        return matcher
+    
+    def __contains__(self, text):
+        return self.find(text) is not None
+    
+    def __len__(self):
+        return len(self.titles)
+
+class JournalRegistry:
+    """
+    Перечни журналов ВАК и РИНЦ, загружаемые из файлов данных.
+    Построенные автоматы кэшируются на диске и перестраиваются только
+    при изменении файла перечня. Кэш содержит только данные (заголовок
+    JSON и массивы чисел), а не объекты pickle: при чтении из него не
+    может выполниться код.
+    """
+    
+    # Версия формата кэша автомата
+    CACHE_VERSION = 2
+    
+    # Перечни по умолчанию (см. default)
+    _default = None
+    
+    def __init__(self, vak_path, rinc_path, cache_dir=None):
+        """
+        Загрузка перечней
+        
+        Args:
+            vak_path (str): Путь к перечню журналов ВАК (CSV или JSON)
+            rinc_path (str): Путь к перечню журналов РИНЦ (CSV или JSON)
+            cache_dir (str): Каталог для кэша автоматов
+                (по умолчанию - CACHE_DIR в профиле пользователя)
+        """
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.vak = self._load_matcher(vak_path)
+        self.rinc = self._load_matcher(rinc_path)
+    
+    @classmethod
+    def default(cls):
+        """
+        Перечни из каталога resources/registries, загружаемые один раз
+        
+        Returns:
+            JournalRegistry: Перечни журналов ВАК и РИНЦ
+        """
+        if cls._default is None:
+            cls._default = cls(
+                os.path.join(REGISTRY_DIR, 'vak.csv'),
+                os.path.join(REGISTRY_DIR, 'rinc.csv')
+            )
+        return cls._default
+    
+    def classify(self, journal):
+        """
+        Определение принадлежности журнала к перечням ВАК и РИНЦ
+        
+        Args:
+            journal (str): Название журнала из ссылки
+        
+        Returns:
+            tuple: (is_vak, is_rinc)
+        """
+        if not journal:
+            return False, False
+        return journal in self.vak, journal in self.rinc
+    
+    def _load_matcher(self, path):
+        """
+        Получение автомата для перечня из кэша или построение заново
+        
+        Args:
+            path (str): Путь к файлу перечня
+        
+        Returns:
+            JournalMatcher: Автомат для перечня
+        """
+        if not path or not os.path.exists(path):
+            return JournalMatcher([])
+        
+        with open(path, 'rb') as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+        
+        # Имя кэша зависит от полного пути: одноименные перечни
+        # из разных каталогов не вытесняют друг друга
+        path_digest = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+        cache_path = os.path.join(self.cache_dir, f"{os.path.basename(path)}.{path_digest}.automaton")
+        
+        try:
+            matcher = JournalRegistry._read_cache(cache_path, digest)
+            if matcher is not None:
+                return matcher
+        except (OSError, ValueError, KeyError, TypeError, EOFError):
+            pass
+        
+        matcher = JournalMatcher(load_journal_titles(path))
+        
+        # Кэш - лишь ускорение: при недоступном для записи каталоге
+        # автомат просто строится при каждом запуске
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            JournalRegistry._write_cache(cache_path, digest, matcher)
+        except OSError:
+            pass
+        
+        return matcher
+    
+    @staticmethod
+    def _write_cache(cache_path, digest, matcher):
+        """
+        Сохранение автомата: строка заголовка JSON, затем массивы
+        переходов, целевых узлов, суффиксных ссылок и номеров названий
+        и символы переходов в UTF-8. Файл записывается во временный
+        и заменяется целиком (процессы пула могут писать одновременно)
+        
+        Args:
+            cache_path (str): Путь к файлу кэша
+            digest (str): SHA-1 содержимого файла перечня
+            matcher (JournalMatcher): Автомат
+        """
+        counts, chars, targets, fail, output = matcher.tables()
+        chars = chars.encode('utf-8')
+        header = {
+            'version': JournalRegistry.CACHE_VERSION,
+            'digest': digest,
+            'itemsize': counts.itemsize,
+            'byteorder': sys.byteorder,
+            'nodes': len(counts),
+            'edges': len(targets),
+            'chars': len(chars),
+            'titles': matcher.titles
+        }
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n')
+                for table in (counts, targets, fail, output):
+                    table.tofile(file)
+                file.write(chars)
+            os.replace(temp_path, cache_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    @staticmethod
+    def _read_cache(cache_path, digest):
+        """
+        Чтение автомата, сохраненного _write_cache
+        
+        Args:
+            cache_path (str): Путь к файлу кэша
+            digest (str): SHA-1 текущего содержимого файла перечня
+        
+        Returns:
+            JournalMatcher: Автомат или None, если кэш устарел
+        """
+        with open(cache_path, 'rb') as file:
+            header = json.loads(file.readline().decode('utf-8'))
+            if (header['version'] != JournalRegistry.CACHE_VERSION or header['digest'] != digest
+                    or header['itemsize'] != array('i').itemsize or header['byteorder'] != sys.byteorder):
+                return None
+            
+            tables = []
+            for size in (header['nodes'], header['edges'], header['nodes'], header['nodes']):
+                table = array('i')
+                table.fromfile(file, size)
+                tables.append(table)
+            chars = file.read(header['chars']).decode('utf-8')
+        
+        titles = header['titles']
+        if not isinstance(titles, list) or not all(isinstance(title, str) for title in titles):
+            raise ValueError("Некорректный список названий в кэше автомата")
+        
+        counts, targets, fail, output = tables
+        return JournalMatcher.from_tables(titles, counts, chars, targets, fail, output)
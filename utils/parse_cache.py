@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import os
+from collections import OrderedDict
+from models.bibliography_item import BibliographyItem
+
+class ParseCache:
+    """
+    Ограниченный LRU-кэш результатов распознавания библиографических ссылок.
+    Ключ - текст ссылки без изменений, тип формата, механизм разбора
+    и версия парсера: результат разбора зависит от пробелов, тире и
+    кавычек в тексте, поэтому ссылки, отличающиеся только ими, кэшируются
+    отдельно.
+    """
+    
+    # Версия формата ключа. Увеличивается при изменении ключа, чтобы
+    # сохраненные с прежним ключом записи не использовались (в версии 1
+    # ключом был текст с единообразными пробелами, тире и кавычками,
+    # и вариант, разобранный первым, определял результат для остальных)
+    KEY_VERSION = 2
+    
+    def __init__(self, maxsize=10000, path=None, version=""):
+        """
+        Инициализация кэша
+        
+        Args:
+            maxsize (int): Максимальное количество записей в кэше
+            path (str): Путь к файлу для сохранения кэша на диск (опционально)
+            version (str): Версия парсера; записи другой версии парсера
+                или формата ключа не используются
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.version = f"{version}/{ParseCache.KEY_VERSION}"
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        
+        if path:
+            self.load()
+    
+    def _make_key(self, text, format_type, engine):
+        """
+        Формирование ключа кэша
+        
+        Args:
+            text (str): Текст библиографической ссылки
+            format_type (str): Тип формата
+            engine (str): Механизм разбора
+        
+        Returns:
+            tuple: Ключ (тип формата, механизм разбора, текст ссылки)
+        """
+        return (format_type.lower(), engine, text)
+    
+    def get(self, text, format_type, engine="regex"):
+        """
+        Получение копии ранее распознанной записи
+        
+        Args:
+            text (str): Текст библиографической ссылки
+            format_type (str): Тип формата
+            engine (str): Механизм разбора
+        
+        Returns:
+            BibliographyItem: Новая копия записи или None, если ее нет в кэше
+        """
+        key = self._make_key(text, format_type, engine)
+        item = self._entries.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._entries.move_to_end(key)
+        
+        # Возвращаем копию, чтобы изменения записи в одном списке
+        # не затрагивали другие списки и сам кэш
+        return copy.deepcopy(item)
+    
+    def put(self, text, format_type, item, engine="regex"):
+        """
+        Сохранение распознанной записи в кэш
+        
+        Args:
+            text (str): Текст библиографической ссылки
+            format_type (str): Тип формата
+            item (BibliographyItem): Распознанная запись
+            engine (str): Механизм разбора
+        """
+        key = self._make_key(text, format_type, engine)
+        self._entries[key] = copy.deepcopy(item)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Очистка кэша и статистики"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self):
+        """
+        Статистика использования кэша
+        
+        Returns:
+            dict: Количество попаданий, промахов, доля попаданий и размер кэша
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total > 0 else 0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def load(self):
+        """
+        Загрузка кэша из файла. Файл другой версии парсера или поврежденный
+        файл игнорируется.
+        """
+        if not self.path or not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        
+        if data.get('version') != self.version:
+            return
+        
+        for format_type, engine, text, item_data in data.get('entries', [])[-self.maxsize:]:
+            self._entries[(format_type, engine, text)] = BibliographyItem.from_dict(item_data)
+    
+    def save(self):
+        """Сохранение кэша в файл (если путь задан)"""
+        if not self.path:
+            return
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        data = {
+            'version': self.version,
+            'entries': [
+                [format_type, engine, text, item.to_dict()]
+                for (format_type, engine, text), item in self._entries.items()
+            ]
+        }
+        
+        # Запись через временный файл, чтобы не повредить кэш при сбое
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
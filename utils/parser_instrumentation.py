@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import heapq
+import time
+from collections import Counter
+
+class StageStats:
+    """
+    Накопленная статистика одного этапа разбора
+    """
+    
+    __slots__ = ('calls', 'total', 'max', 'outcomes')
+    
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.outcomes = Counter()
+
+class ParserInstrumentation:
+    """
+    Сбор времени и результатов этапов разбора библиографических ссылок.
+    
+    Парсер вызывает begin() в начале разбора ссылки, mark() по завершении
+    каждого этапа и end() в конце. Время этапа - интервал от предыдущей
+    отметки, поэтому этапы без пропусков делят между собой все время разбора.
+    Подключается через ReferenceParser.enable_instrumentation(); при
+    отключенном сборе парсер лишь проверяет атрибут на None.
+    
+    Статистика собирается только в текущем процессе: для разбора
+    с инструментированием parse_many следует вызывать с workers=1.
+    """
+    
+    def __init__(self, slowest_size=20):
+        """
+        Инициализация сборщика
+        
+        Args:
+            slowest_size (int): Количество самых медленных ссылок в отчете
+        """
+        self.slowest_size = slowest_size
+        self.reset()
+    
+    def reset(self):
+        """Сброс накопленной статистики"""
+        self.stages = {}
+        self.references = 0
+        self.total = 0.0
+        self._slowest = []
+        self._sequence = 0
+        self._text = None
+        self._started = 0.0
+        self._last = 0.0
+    
+    def begin(self, text):
+        """
+        Начало разбора ссылки
+        
+        Args:
+            text (str): Текст библиографической ссылки
+        """
+        self._text = text
+        self._started = self._last = time.perf_counter()
+    
+    def mark(self, stage, outcome=None):
+        """
+        Завершение этапа разбора
+        
+        Args:
+            stage (str): Имя этапа (например, gost.book или vak_rinc)
+            outcome (str): Результат этапа (hit, miss, формат и т.п.)
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.calls += 1
+        stats.total += elapsed
+        if elapsed > stats.max:
+            stats.max = elapsed
+        if outcome is not None:
+            stats.outcomes[outcome] += 1
+    
+    def end(self, item=None):
+        """
+        Завершение разбора ссылки
+        
+        Args:
+            item (BibliographyItem): Распознанная запись (для типа в отчете)
+        """
+        elapsed = time.perf_counter() - self._started
+        self.references += 1
+        self.total += elapsed
+        
+        # Куча из slowest_size самых медленных ссылок
+        self._sequence += 1
+        entry = (elapsed, self._sequence, self._text, item.type if item is not None else "")
+        if len(self._slowest) < self.slowest_size:
+            heapq.heappush(self._slowest, entry)
+        elif elapsed > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+    
+    def slowest(self):
+        """
+        Самые медленные ссылки
+        
+        Returns:
+            list: Кортежи (время, с; текст ссылки; тип записи) по убыванию времени
+        """
+        return [(elapsed, text, item_type) for elapsed, _, text, item_type in sorted(self._slowest, reverse=True)]
+    
+    def stats(self):
+        """
+        Статистика по этапам
+        
+        Returns:
+            dict: {этап: {'calls', 'total', 'mean', 'max', 'share', 'outcomes'}},
+                время в секундах, share - доля от общего времени разбора
+        """
+        return {
+            stage: {
+                'calls': stats.calls,
+                'total': stats.total,
+                'mean': stats.total / stats.calls if stats.calls else 0.0,
+                'max': stats.max,
+                'share': stats.total / self.total if self.total > 0 else 0.0,
+                'outcomes': dict(stats.outcomes)
+            }
+            for stage, stats in sorted(self.stages.items(), key=lambda pair: pair[1].total, reverse=True)
+        }
+    
+    def report(self, top=10):
+        """
+        Текстовый отчет: этапы по убыванию суммарного времени
+        и самые медленные ссылки
+        
+        Args:
+            top (int): Количество выводимых медленных ссылок
+        
+        Returns:
+            str: Отчет
+        """
+        lines = [
+            f"Ссылок: {self.references}, время разбора: {self.total * 1000:.1f} мс",
+            "",
+            f"{'Этап':<24}{'вызовов':>9}{'всего, мс':>11}{'среднее, мкс':>14}{'макс, мс':>10}{'доля':>8}  результаты"
+        ]
+        for stage, stats in self.stats().items():
+            outcomes = ', '.join(f"{outcome}: {count}" for outcome, count in stats['outcomes'].items())
+            lines.append(
+                f"{stage:<24}{stats['calls']:>9}{stats['total'] * 1000:>11.2f}{stats['mean'] * 1e6:>14.1f}"
+                f"{stats['max'] * 1000:>10.2f}{stats['share']:>8.1%}  {outcomes}"
+            )
+        
+        slowest = self.slowest()[:top]
+        if slowest:
+            lines.extend(["", "Самые медленные ссылки:"])
+            for elapsed, text, item_type in slowest:
+                preview = text if len(text) <= 100 else text[:97] + "..."
+                lines.append(f"{elapsed * 1000:>9.2f} мс  [{item_type}] {preview}")
+        
+        return '\n'.join(lines)
@@ -1,19 +1,68 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 import re
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
 from models.bibliography_item import BibliographyItem
+from utils.gost_tokenizer import GostTokenizer
+from utils.journal_registry import JournalRegistry
+from utils.parse_cache import ParseCache
+from utils.parser_instrumentation import ParserInstrumentation
+
+class ParseBudgetExceeded(Exception):
+    """
+    Исключение, сигнализирующее об исчерпании бюджета разбора одной ссылки.
+    """
+    pass
 
 class ReferenceParser:
     """
     Класс для распознавания элементов библиографических ссылок из текста.
     """
     
+    # Версия правил распознавания. Увеличивается при изменении шаблонов,
+    # чтобы сохраненные на диске результаты разбора не использовались
+    PARSER_VERSION = 2
+    
+    # Кэш результатов распознавания (см. enable_cache)
+    cache = None
+    
+    # Словари повторяющихся значений полей проекта (см. enable_vocabularies);
+    # None - значения распознанных записей не объединяются
+    vocabularies = None
+    
+    # Сбор времени этапов разбора (см. enable_instrumentation); None - отключен
+    instrumentation = None
+    
+    # Перечни журналов ВАК/РИНЦ; None - перечни по умолчанию из resources/registries
+    journal_registry = None
+    
+    # Механизмы разбора ссылок ГОСТ: regex - полные шаблоны (по умолчанию),
+    # tokenizer - разбиение на зоны по разделителям (см. GostTokenizer)
+    ENGINES = ('regex', 'tokenizer')
+    
     # Компилированные регулярные выражения для более быстрой работы
     # Шаблоны для определения формата
     GOST_DETECT_PATTERN = re.compile(r'\.[\s]*[–-][\s]*[^\d]*\d+|С\.\s*\d+')
     IEEE_DETECT_PATTERN = re.compile(r'^\[\d+\]|IEEE', re.IGNORECASE)
     
+    # Определение формата всего списка по выборке ссылок: формат, набравший
+    # не менее LIST_FORMAT_CONFIDENCE голосов, применяется ко всем ссылкам,
+    # кроме выбивающихся из списка (см. resolve_formats)
+    LIST_FORMAT_SAMPLE_SIZE = 50
+    LIST_FORMAT_CONFIDENCE = 0.8
+    
+    # Размер порции ссылок при потоковом разборе (см. parse_stream)
+    STREAM_BATCH_SIZE = 200
+    # Признаки чужого формата: номер "[1]" или название в кавычках в списке ГОСТ,
+    # разделители " // " и ". — " в списке IEEE
+    GOST_LIST_OUTLIER_PATTERN = re.compile(r'^\[\d+\]|"')
+    IEEE_LIST_OUTLIER_PATTERN = re.compile(r'\s//\s|\.\s+—\s')
+    
     # Шаблоны ГОСТ для разных типов источников
     # Книга: Автор. Название : Подзаголовок / Авторы. — Издание — Город : Издательство, Год. — Страницы с.
     # GOST_BOOK_PATTERN = re.compile(
@@ -42,18 +91,22 @@ class ReferenceParser:
     #     r',\s+(?P<year>\d{4})'  # Год издания
     #     r'(?:\.\s+—\s+(?P<pages>\d+)\s+с\.)?'  # Количество страниц (опционально)
     # )
+    # Каждое поле ограничено классом символов, не пересекающим следующий
+    # за ним разделитель, а авторы - первой точкой с пробелом. Поэтому
+    # число вариантов разбиения линейно, и шаблон не "зависает" на длинных
+    # строках с множеством разделителей ":" и "/".
     GOST_BOOK_PATTERN = re.compile(
-        r'(?P<authors>.*?)\.\s+'
-        r'(?P<title>.*?)'
-        r'(?:\s*:\s*(?P<subtitle>.*?))?\s*/\s*'
-        r'(?P<authors2>.*?)'
-        r'(?:\.\s+—\s+(?P<edition>.*?)-е изд\.)?'
-        r'(?:\s*—\s+(?P<city>.*?))?'
+        r'^(?P<authors>(?:[^.]|\.(?!\s))*)\.\s+'  # Авторы до первой ". "
+        r'(?P<title>[^:/]*?)'  # Название
+        r'(?:\s*:\s*(?P<subtitle>[^/]*?))?\s*/\s*'  # Подзаголовок (опционально)
+        r'(?P<authors2>[^—:]*?)'  # Сведения об ответственности
+        r'(?:\.\s+—\s+(?P<edition>[^—:]*?)-е изд\.)?'  # Издание (опционально)
+        r'(?:\s*—\s+(?P<city>[^—:]*?))?'  # Город (опционально)
         r'\s*:\s*'
-        r'(?P<publisher>.*?)?'
-        r',\s+(?P<year>\d{4})?'
+        r'(?P<publisher>[^,]*?)?'  # Издательство
+        r',\s+(?P<year>\d{4})?'  # Год
         r'(?:\.\s+—\s+)?'
-        r'(?P<pages>\d+)\s+с\.'
+        r'(?P<pages>\d+)\s+с\.'  # Количество страниц
     )
 
     # # Статья в журнале: Автор. Название статьи // Название журнала. — Год. — Том X. — № Y. — С. Z-W.
@@ -75,7 +128,7 @@ class ReferenceParser:
 
     # Статья в журнале: Автор. Название статьи // Название журнала. — Год. — Том X. — № Y. — С. Z-W.
     GOST_ARTICLE_PATTERN = re.compile(
-        r'(?P<authors>.*?)\.\s+'  # Авторы (минимум 1 символ до точки)
+        r'^(?P<authors>(?:[^.]|\.(?!\s))*)\.\s+'  # Авторы до первой ". "
         #r'(?P<title>.+?)\s+//\s*'  # Название статьи (минимум 1 символ)
         r'(?P<title>.*?)(?:\s+/\s+[^/]*?)?'  # Название статьи, исключая авторов после косой черты (если есть)
         r'\s+//'  # Разделитель между названием статьи и названием сборника
@@ -89,15 +142,15 @@ class ReferenceParser:
     
     # Статья в сборнике: Автор. Название статьи // Название сборника / Под ред. Редактора. — Город : Издательство, Год. — С. X-Y.
     GOST_COLLECTION_PATTERN = re.compile(
-        r'(?P<authors>.*?)\.\s+'  # Авторы, заканчивающиеся точкой
-        r'(?P<title>.*?)(?:\s+/\s+[^/]*?)?'  # Название статьи, исключая авторов после косой черты (если есть)
+        r'^(?P<authors>(?:[^.]|\.(?!\s))*)\.\s+'  # Авторы до первой ". "
+        r'(?P<title>[^/]*?)(?:\s+/\s+[^/]*?)?'  # Название статьи, исключая авторов после косой черты (если есть)
         r'\s+//'  # Разделитель между названием статьи и названием сборника
-        r'\s+(?P<collection>.*?)'  # Название сборника
-        r'(?:\s*/\s*(?P<editors>.*?))?'  # Редакторы (опционально)
+        r'\s+(?P<collection>[^/:]*?)'  # Название сборника
+        r'(?:\s*/\s*(?P<editors>[^—:]*?))?'  # Редакторы (опционально)
         r'(?:\.\s+—\s+|\.\s+)?'  # Разделитель (опционально)
-        r'(?P<city>.*?)'  # Город издания
+        r'(?P<city>[^—:]*?)'  # Город издания
         r'\s*:\s*'  # Разделитель между городом и издательством
-        r'(?P<publisher>.*?)'  # Издательство
+        r'(?P<publisher>[^,]*?)'  # Издательство
         r',\s+(?P<year>\d{4})'  # Год издания
         r'(?:\.\s+—\s+|\.\s+)'  # Разделитель
         r'(?:С\.\s+(?P<pages>\d+(?:-\d+)?))?'  # Страницы (опционально)
@@ -105,7 +158,7 @@ class ReferenceParser:
     
     # Веб-ресурс: Автор. Название [Электронный ресурс]. — URL: http://example.com (дата обращения: ДД.ММ.ГГГГ).
     GOST_WEB_PATTERN = re.compile(
-        r'(?P<authors>.*?)\.\s+'  # Авторы, заканчивающиеся точкой
+        r'^(?P<authors>(?:[^.]|\.(?!\s))*)\.\s+'  # Авторы до первой ". "
         r'(?P<title>.*?)(?:\s+/\s+[^/]*?)?'  # Название ресурса, исключая авторов после косой черты (если есть)
         r'(?:\s+\[Электронный\s+ресурс\])?'  # Тип ресурса (опционально)
         r'(?:\.\s+—\s+|\.\s+)'  # Разделитель
@@ -116,21 +169,43 @@ class ReferenceParser:
     
     # Автореферат диссертации: Автор. Название : автореф. дис. ... канд. наук / Автор. — Город, Год. — Страницы с.
     GOST_THESIS_PATTERN = re.compile(
-        r'(?P<authors>.*?)\.\s+'  # Авторы, заканчивающиеся точкой
-        r'(?P<title>.*?)(?:\s+/\s+[^/]*?)?'  # Название работы, исключая авторов после косой черты (если есть)
+        r'^(?P<authors>(?:[^.]|\.(?!\s))*)\.\s+'  # Авторы до первой ". "
+        r'(?P<title>[^/:]*?)(?:\s+/\s+[^/:]*?)?'  # Название работы, исключая авторов после косой черты (если есть)
         r'\s*:\s*автореф\.\s+дис\.\s+\.\.\.\s+'  # Указание на автореферат
-        r'(?P<degree>.*?)'  # Степень
-        r'\s*/\s*(?P<authors2>.*?)'  # Авторы после косой черты
+        r'(?P<degree>[^/]*?)'  # Степень
+        r'\s*/\s*(?P<authors2>(?:[^.,]|\.(?!\s))*)'  # Авторы после косой черты
         r'(?:\.\s+—\s+|\.\s+)'  # Разделитель
-        r'(?P<city>.*?)'  # Город
+        r'(?P<city>[^,]*)'  # Город
         r',\s+(?P<year>\d{4})'  # Год
         r'(?:\.\s+—\s+(?P<pages>\d+(?:-\d+)?)\s+с\.)?'  # Страницы (опционально), с возможным диапазоном
     )
     
+    # Бюджет разбора одной ссылки полными шаблонами. Более длинные строки
+    # (как правило, склеенные при извлечении из PDF) и ссылки, на которые
+    # не хватило времени, разбираются упрощенным методом _parse_general
+    MAX_PATTERN_TEXT_LENGTH = 2000  # символов
+    TIME_BUDGET = 0.2  # секунд
+    
+    # Порядок применения шаблонов ГОСТ: (имя, шаблон, метод заполнения)
+    GOST_CASCADE = (
+        ('book', 'GOST_BOOK_PATTERN', '_fill_gost_book'),
+        ('article', 'GOST_ARTICLE_PATTERN', '_fill_gost_article'),
+        ('collection', 'GOST_COLLECTION_PATTERN', '_fill_gost_collection'),
+        ('web', 'GOST_WEB_PATTERN', '_fill_gost_web'),
+        ('thesis', 'GOST_THESIS_PATTERN', '_fill_gost_thesis'),
+    )
+    
+    # Признаки, без которых соответствующий шаблон ГОСТ заведомо не совпадет
+    GOST_PAGE_COUNT_MARKER = re.compile(r'\d\s+с\.')  # "350 с." в книгах
+    GOST_ARTICLE_MARKER = re.compile(r'\s//')  # " //" перед журналом или сборником
+    GOST_YEAR_MARKER = re.compile(r',\s+\d{4}')  # "Издательство, 2020"
+    GOST_WEB_MARKER = re.compile(r'https?://')  # "URL: http://..."
+    GOST_THESIS_MARKER = re.compile(r'автореф\.\s+дис\.')  # "автореф. дис. ..."
+    
     # Шаблоны IEEE
     # Статья в журнале: A. Author1, B. Author2, "Title of paper," Journal Name, vol. X, no. Y, pp. Z-W, Month Year
     IEEE_ARTICLE_PATTERN = re.compile(
-        r'(?P<authors>.*?),\s+'  # Авторы, заканчивающиеся запятой
+        r'^(?P<authors>(?:[^,]|,(?!\s+"))*),\s+'  # Авторы до первой ', "'
         r'"(?P<title>.*?)",'  # Название статьи в кавычках
         r'\s+(?P<journal>.*?),'  # Название журнала
         r'(?:\s+vol\.\s+(?P<volume>\d+))?'  # Том (опционально)
@@ -142,7 +217,7 @@ class ReferenceParser:
     
     # Статья в сборнике конференции: A. Author1, B. Author2, "Title of paper," in Proc. Conference Name, City, Country, Year, pp. X-Y.
     IEEE_CONFERENCE_PATTERN = re.compile(
-        r'(?P<authors>.*?),\s+'  # Авторы, заканчивающиеся запятой
+        r'^(?P<authors>(?:[^,]|,(?!\s+"))*),\s+'  # Авторы до первой ', "'
         r'"(?P<title>.*?)",'  # Название статьи в кавычках
         r'\s+in\s+Proc\.\s+(?P<conference>.*?),'  # Название конференции
         r'\s+(?P<city>.*?),'  # Город
@@ -153,62 +228,561 @@ class ReferenceParser:
     
     # Книга: A. Author1, B. Author2, Title of Book. City, Country: Publisher, Year.
     IEEE_BOOK_PATTERN = re.compile(
-        r'(?P<authors>.*?),\s+'  # Авторы, заканчивающиеся запятой
-        r'(?P<title>.*?)\.'  # Название книги
-        r'\s+(?P<city>.*?),'  # Город
-        r'(?:\s+(?P<country>.*?):)?'  # Страна (опционально)
+        r'^(?P<authors>(?:[^,]|,(?!\s))*),\s+'  # Авторы до первой ", "
+        r'(?P<title>(?:[^.]|\.(?!\s))*)\.'  # Название книги до первой ". "
+        r'\s+(?P<city>(?:[^,]|,(?!\s))*),'  # Город
+        r'(?:\s+(?P<country>(?:[^:]|:(?!\s))*):)?'  # Страна (опционально)
         r'\s+(?P<publisher>.*?),'  # Издательство
         r'\s+(?P<year>\d{4})'  # Год
     )
     
     # Общие шаблоны для извлечения дополнительных данных
-    YEAR_PATTERN = re.compile(r'(?:,\s+|,|\s+|.\s+)(\d{4})(?:\s*г\.?)?(?:,|\.|\s|$)')
+    # Год и URL проверяются от начала серии пробелов (через просмотр назад),
+    # чтобы длинные серии пробелов не перебирались с каждой позиции
+    YEAR_PATTERN = re.compile(r'(?<=[,\s])(\d{4})(?:\s*г\.?)?(?:,|\.|\s|$)')
     VOLUME_PATTERN = re.compile(r'[Тт]\.?\s*(\d+)|[Vv]ol\.?\s*(\d+)')
     ISSUE_PATTERN = re.compile(r'[№Nn]\.?\s*(\d+)|[Nn]o\.?\s*(\d+)')
     PAGES_PATTERN = re.compile(r'[Сс]\.?\s*(\d+)(?:[–-](\d+))?|[Pp]\.?\s*(\d+)(?:[–-](\d+))?|(\d+)[\s]*[-–][\s]*(\d+)')
-    URL_PATTERN = re.compile(r'(?:URL:|Режим доступа:)?\s*(https?://[^\s,]+)')
+    URL_PATTERN = re.compile(r'(?:URL:|Режим доступа:)?(?<!\s)\s*(https?://[^\s,]+)')
     DOI_PATTERN = re.compile(r'(DOI:?|doi\.org\/)\s*(10\.\d{4,}(?:\.\d+)*\/(?:(?!["&\'])\S)+)', re.IGNORECASE)
+    # Издательство: разделитель начинается с начала серии пробелов и двоеточий
+    # и заканчивается последним двоеточием серии (или первым пробелом), поэтому
+    # длинные серии пробелов не перебираются многократно
+    PUBLISHER_PATTERN = re.compile(
+        r'(?<![\s:])(?:[\s:]*:|\s)([^:,\.]+(?:Издательство|Изд-во|Press|Publishing)[^:,\.]+)(?:,|\.|$)',
+        re.IGNORECASE
+    )
+    PLAIN_YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+    
+    # Шаблоны разбора статьи ГОСТ по разделителю "//", если полные шаблоны не подошли
+    GOST_SPLIT_JOURNAL_PATTERN = re.compile(r'^([^\.—]+)')
+    GOST_SPLIT_AUTHORS_PATTERN = re.compile(r'^(.*?)\.\s+')
+    GOST_SPLIT_TITLE_PATTERN = re.compile(r'^.*?\.\s+(.*?)(?:\s+/\s+.*?)?$')
+    GOST_SPLIT_YEAR_PATTERN = re.compile(r'—\s+(\d{4})')
+    GOST_SPLIT_VOLUME_PATTERN = re.compile(r'Т\.\s+(\d+)')
+    GOST_SPLIT_ISSUE_PATTERN = re.compile(r'№\s+(\d+)')
+    GOST_SPLIT_PAGES_PATTERN = re.compile(r'С\.\s*(\d+(?:.\d+)?)')
+    GOST_EDITION_SUFFIX_PATTERN = re.compile(r'\s*-\s*е\s*изд\.?$', re.IGNORECASE)
+    
+    # Шаблоны для дополнительных данных IEEE
+    IEEE_NUMBER_PATTERN = re.compile(r'^\[\d+\]\s*')
+    IEEE_QUOTED_TITLE_PATTERN = re.compile(r'"([^"]+)"')
+    IEEE_JOURNAL_PATTERN = re.compile(r'^\s*,\s*([^,]+)')
+    IEEE_VOLUME_PATTERN = re.compile(r'vol\.\s*(\d+)', re.IGNORECASE)
+    IEEE_ISSUE_PATTERN = re.compile(r'no\.\s*(\d+)', re.IGNORECASE)
+    IEEE_PAGES_PATTERN = re.compile(r'pp\.\s*(\d+)[-–](\d+)|p\.\s*(\d+)', re.IGNORECASE)
+    IEEE_DOI_PATTERN = re.compile(r'doi:?\s*(10\.\d{4,}(?:\.\d+)*\/(?:(?!["&\'])\S)+)', re.IGNORECASE)
+    
+    # Шаблоны базового анализа
+    WEB_ADDRESS_PATTERN = re.compile(r'https?:|www\.', re.IGNORECASE)
+    INITIALS_PATTERN = re.compile(r'[А-Яа-яA-Za-z]\.\s*[А-Яа-яA-Za-z]\.')
+    
+    # Таблица для подсчета русских и латинских букв: буквы заменяются
+    # маркерами, которые затем считаются str.count без промежуточных списков
+    RU_LETTER_MARKER = '\x01'
+    EN_LETTER_MARKER = '\x02'
+    RU_LETTERS = 'абвгдежзийклмнопрстуфхцчшщъыьэюяАБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯёЁ'
+    EN_LETTERS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    LETTER_SCRIPT_TABLE = str.maketrans(
+        RU_LETTERS + EN_LETTERS,
+        RU_LETTER_MARKER * len(RU_LETTERS) + EN_LETTER_MARKER * len(EN_LETTERS)
+    )
+    
+    # Счетчики применения шаблонов ГОСТ: {имя шаблона: Counter(hit/miss/skip)}
+    _pattern_stats = defaultdict(Counter)
     
     @staticmethod
-    def parse(text, format_type="auto"):
+    def parse(text, format_type="auto", engine="regex", use_cache=True):
         """
         Распознавание элементов библиографической ссылки из текста
         
         Args:
             text (str): Текст библиографической ссылки
             format_type (str): Тип формата (auto, ГОСТ, IEEE)
+            engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer);
+                ссылки IEEE всегда разбираются шаблонами
+            use_cache (bool): Использовать кэш (если он включен). Пакетный
+                разбор в пуле процессов проверяет и пополняет кэш в текущем
+                процессе, а процессам передает только ссылки, которых в нем нет
             
         Returns:
             BibliographyItem: Объект с распознанными элементами
         """
+        if engine not in ReferenceParser.ENGINES:
+            raise Exception(f"Неизвестный механизм разбора: {engine}")
+        
+        instrumentation = ReferenceParser.instrumentation
+        if instrumentation is not None:
+            instrumentation.begin(text)
+        
+        cache = ReferenceParser.cache if use_cache else None
+        if cache is not None:
+            item = cache.get(text, format_type, engine)
+            if instrumentation is not None:
+                instrumentation.mark('cache', 'hit' if item is not None else 'miss')
+            if item is not None:
+                ReferenceParser._intern(item)
+                # Перечни ВАК/РИНЦ могли обновиться после сохранения в кэш
+                ReferenceParser._check_vak_rinc(item)
+                if instrumentation is not None:
+                    instrumentation.mark('vak_rinc', ReferenceParser._vak_rinc_outcome(item))
+                    instrumentation.end(item)
+                return item
+        
+        item = ReferenceParser._parse_text(text, format_type, engine)
+        # До сохранения в кэш: копии из кэша разделяют строки словарей
+        ReferenceParser._intern(item)
+        
+        # Результат, полученный при исчерпании бюджета времени, не кэшируем:
+        # при следующем разборе ссылка может уложиться в бюджет
+        if cache is not None and item.get_additional_info('parse_fallback') is None:
+            cache.put(text, format_type, item, engine)
+        
+        if instrumentation is not None:
+            if cache is not None:
+                instrumentation.mark('cache_put')
+            instrumentation.end(item)
+        
+        return item
+    
+    @staticmethod
+    def _parse_text(text, format_type, engine="regex"):
+        """
+        Распознавание элементов библиографической ссылки без использования кэша
+        
+        Args:
+            text (str): Текст библиографической ссылки
+            format_type (str): Тип формата (auto, ГОСТ, IEEE)
+            engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+            
+        Returns:
+            BibliographyItem: Объект с распознанными элементами
+        """
+        instrumentation = ReferenceParser.instrumentation
+        
         # Создание объекта библиографической записи
         item = BibliographyItem(text)
         
         # Если формат не указан или auto, определяем его автоматически
         if format_type.lower() == "auto" or format_type.lower() == "автоопределение":
             format_type = ReferenceParser._detect_format(text)
+            if instrumentation is not None:
+                instrumentation.mark('detect_format', format_type)
         
         # Выбор метода распознавания в зависимости от формата
-        if format_type.lower() == "гост" or format_type.lower() == "gost":
-            ReferenceParser._parse_gost(text, item)
-        elif format_type.lower() == "ieee":
-            ReferenceParser._parse_ieee(text, item)
-        else:
-            # Если формат не распознан, пробуем общий метод
-            ReferenceParser._parse_general(text, item)
+        deadline = time.perf_counter() + ReferenceParser.TIME_BUDGET
+        is_gost = format_type.lower() == "гост" or format_type.lower() == "gost"
+        try:
+            if is_gost and engine == "tokenizer":
+                # Разбиение на зоны линейно по длине строки,
+                # поэтому ограничения бюджета к нему не применяются
+                GostTokenizer.parse(text, item)
+                if instrumentation is not None:
+                    instrumentation.mark('tokenizer', item.type)
+            elif len(text) > ReferenceParser.MAX_PATTERN_TEXT_LENGTH:
+                raise ParseBudgetExceeded("Слишком длинная ссылка")
+            elif is_gost:
+                ReferenceParser._parse_gost(text, item, deadline)
+            elif format_type.lower() == "ieee":
+                ReferenceParser._parse_ieee(text, item, deadline)
+            else:
+                # Если формат не распознан, пробуем общий метод
+                ReferenceParser._parse_general(text, item, deadline)
+                if instrumentation is not None:
+                    instrumentation.mark('general', item.type)
+        except ParseBudgetExceeded:
+            # Бюджет исчерпан: отбрасываем частичный результат и разбираем
+            # ссылку без полных шаблонов, помечая запись
+            item = BibliographyItem(text)
+            item.additional_info['parse_fallback'] = 'budget'
+            ReferenceParser._parse_general(
+                text[:ReferenceParser.MAX_PATTERN_TEXT_LENGTH], item, use_patterns=False
+            )
+            if instrumentation is not None:
+                instrumentation.mark('budget_fallback', item.type)
         
         # Определение языка
         ReferenceParser._detect_language(item)
+        if instrumentation is not None:
+            instrumentation.mark('language', item.language)
         
         # Определение типа источника, если еще не определен
         if not item.type:
             ReferenceParser._detect_source_type(item)
+            if instrumentation is not None:
+                instrumentation.mark('source_type', item.type)
         
         # Проверка признаков ВАК/РИНЦ
         ReferenceParser._check_vak_rinc(item)
+        if instrumentation is not None:
+            instrumentation.mark('vak_rinc', ReferenceParser._vak_rinc_outcome(item))
         
         return item
     
+    @staticmethod
+    def enable_cache(maxsize=10000, path=None):
+        """
+        Включение кэша результатов распознавания
+        
+        Args:
+            maxsize (int): Максимальное количество записей в кэше
+            path (str): Путь к файлу для сохранения кэша между запусками
+                (опционально; сохранение выполняется методом cache.save())
+            
+        Returns:
+            ParseCache: Включенный кэш
+        """
+        ReferenceParser.cache = ParseCache(maxsize, path, ReferenceParser.PARSER_VERSION)
+        return ReferenceParser.cache
+    
+    @staticmethod
+    def disable_cache():
+        """Отключение кэша результатов распознавания"""
+        ReferenceParser.cache = None
+    
+    @staticmethod
+    def enable_vocabularies(vocabularies):
+        """
+        Объединение повторяющихся значений полей распознанных записей
+        (журналы, издательства, города, авторы) через словари проекта
+        
+        Args:
+            vocabularies (Vocabularies): Словари проекта
+        
+        Returns:
+            Vocabularies: Те же словари
+        """
+        ReferenceParser.vocabularies = vocabularies
+        return vocabularies
+    
+    @staticmethod
+    def disable_vocabularies():
+        """Отключение объединения значений полей"""
+        ReferenceParser.vocabularies = None
+    
+    @staticmethod
+    def _intern(item):
+        """
+        Замена значений полей записи общими экземплярами из словарей
+        (если словари подключены)
+        
+        Args:
+            item (BibliographyItem): Библиографическая запись
+        
+        Returns:
+            BibliographyItem: Та же запись
+        """
+        vocabularies = ReferenceParser.vocabularies
+        if vocabularies is not None:
+            vocabularies.intern_item(item)
+        return item
+    
+    @staticmethod
+    def enable_instrumentation(slowest_size=20):
+        """
+        Включение сбора времени и результатов этапов разбора
+        
+        Args:
+            slowest_size (int): Количество самых медленных ссылок в отчете
+            
+        Returns:
+            ParserInstrumentation: Сборщик статистики (отчет - метод report())
+        """
+        ReferenceParser.instrumentation = ParserInstrumentation(slowest_size)
+        return ReferenceParser.instrumentation
+    
+    @staticmethod
+    def disable_instrumentation():
+        """Отключение сбора времени этапов разбора"""
+        ReferenceParser.instrumentation = None
+    
+    @staticmethod
+    def parse_many(texts, format_type="auto", workers=None, chunksize=None, engine="regex"):
+        """
+        Пакетное распознавание списка библиографических ссылок.
+        Ссылки распределяются порциями по пулу процессов; модуль не зависит
+        от PyQt, поэтому метод можно вызывать из пакетных заданий.
+        
+        Args:
+            texts (iterable): Тексты библиографических ссылок
+            format_type (str): Тип формата (auto, ГОСТ, IEEE). При auto формат
+                определяется один раз для всего списка (см. resolve_formats)
+            workers (int): Количество процессов (по умолчанию - число ядер).
+                При workers <= 1 разбор выполняется в текущем процессе
+            chunksize (int): Размер порции ссылок, передаваемой процессу
+                (по умолчанию подбирается по числу ссылок и процессов)
+            engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+            
+        Returns:
+            list: Объекты BibliographyItem в порядке исходных текстов. Ошибка
+                разбора отдельной ссылки не прерывает обработку: для такой
+                ссылки возвращается запись только с исходным текстом и
+                сообщением об ошибке в additional_info['parse_error']
+        """
+        texts = list(texts)
+        formats = ReferenceParser.resolve_formats(texts, format_type)
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(texts))
+        
+        if workers <= 1:
+            return [_parse_safely(text, text_format, engine) for text, text_format in zip(texts, formats)]
+        
+        # Процессам пула передаются только ссылки, которых нет в кэше
+        items, misses = ReferenceParser._cache_lookup(texts, formats, engine)
+        miss_texts = [texts[index] for index in misses]
+        miss_formats = [formats[index] for index in misses]
+        workers = min(workers, len(misses))
+        if workers <= 1:
+            parsed = [_parse_safely(text, text_format, engine, False) for text, text_format in zip(miss_texts, miss_formats)]
+            return ReferenceParser._cache_fill(items, misses, parsed, texts, formats, engine)
+        
+        if chunksize is None:
+            # Несколько порций на процесс для выравнивания нагрузки
+            chunksize = max(1, len(misses) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(
+                _parse_safely, miss_texts, miss_formats, repeat(engine), repeat(False), chunksize=chunksize
+            ))
+        return ReferenceParser._cache_fill(items, misses, parsed, texts, formats, engine)
+    
+    @staticmethod
+    def parse_stream(texts, format_type="auto", workers=None, engine="regex", batch_size=None):
+        """
+        Потоковое распознавание ссылок: тексты читаются порциями по мере
+        поступления (например, из ReferenceSegmenter), поэтому разбор
+        начинается до окончания чтения документа. Порции распределяются
+        по пулу процессов; в обработке одновременно не более двух порций
+        на процесс, так что память ограничена независимо от длины списка.
+        
+        Args:
+            texts (iterable): Тексты библиографических ссылок
+            format_type (str): Тип формата (auto, ГОСТ, IEEE). При auto формат
+                определяется для каждой порции (см. resolve_formats)
+            workers (int): Количество процессов (по умолчанию - число ядер).
+                При workers <= 1 или списке короче одной порции разбор
+                выполняется в текущем процессе
+            engine (str): Механизм разбора ссылок ГОСТ (regex, tokenizer)
+            batch_size (int): Размер порции (по умолчанию STREAM_BATCH_SIZE)
+            
+        Yields:
+            BibliographyItem: Распознанные записи в порядке исходных текстов
+                (ошибки разбора - как в parse_many)
+        """
+        batch_size = batch_size or ReferenceParser.STREAM_BATCH_SIZE
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        texts = iter(texts)
+        first_batch = list(islice(texts, batch_size))
+        if workers <= 1 or len(first_batch) < batch_size:
+            batch = first_batch
+            while batch:
+                formats = ReferenceParser.resolve_formats(batch, format_type)
+                yield from _parse_batch(batch, formats, engine)
+                batch = list(islice(texts, batch_size))
+            return
+        
+        # Порция: (тексты, форматы, записи из кэша, индексы ссылок,
+        # которых нет в кэше, задача пула или None)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batch = first_batch
+            while batch:
+                formats = ReferenceParser.resolve_formats(batch, format_type)
+                items, misses = ReferenceParser._cache_lookup(batch, formats, engine)
+                future = None
+                if misses:
+                    future = executor.submit(
+                        _parse_batch, [batch[index] for index in misses], [formats[index] for index in misses], engine, False
+                    )
+                pending.append((batch, formats, items, misses, future))
+                if len(pending) >= workers * 2:
+                    yield from ReferenceParser._finish_batch(pending.popleft(), engine)
+                batch = list(islice(texts, batch_size))
+            
+            while pending:
+                yield from ReferenceParser._finish_batch(pending.popleft(), engine)
+    
+    @staticmethod
+    def _cache_lookup(texts, formats, engine):
+        """
+        Поиск ссылок в кэше текущего процесса перед разбором в пуле
+        (процессы пула кэш текущего процесса не видят)
+        
+        Args:
+            texts (list): Тексты библиографических ссылок
+            formats (list): Формат каждой ссылки
+            engine (str): Механизм разбора ссылок ГОСТ
+        
+        Returns:
+            tuple: (записи из кэша или None для каждой ссылки,
+                индексы ссылок, которых нет в кэше)
+        """
+        cache = ReferenceParser.cache
+        if cache is None:
+            return [None] * len(texts), list(range(len(texts)))
+        items = []
+        misses = []
+        for index, (text, text_format) in enumerate(zip(texts, formats)):
+            item = cache.get(text, text_format, engine)
+            if item is None:
+                misses.append(index)
+            else:
+                ReferenceParser._intern(item)
+                # Перечни ВАК/РИНЦ могли обновиться после сохранения в кэш
+                ReferenceParser._check_vak_rinc(item)
+            items.append(item)
+        return items, misses
+    
+    @staticmethod
+    def _cache_fill(items, misses, parsed, texts, formats, engine):
+        """
+        Подстановка записей, распознанных в пуле, и сохранение их в кэш
+        
+        Args:
+            items (list): Записи из кэша (см. _cache_lookup; изменяется на месте)
+            misses (list): Индексы ссылок, которых не было в кэше
+            parsed (list): Записи, распознанные для этих ссылок
+            texts (list): Тексты библиографических ссылок
+            formats (list): Формат каждой ссылки
+            engine (str): Механизм разбора ссылок ГОСТ
+        
+        Returns:
+            list: Записи в порядке исходных текстов
+        """
+        cache = ReferenceParser.cache
+        for index, item in zip(misses, parsed):
+            # Записи из процессов пула объединяются со словарями здесь:
+            # строки, полученные через pickle, - новые объекты
+            ReferenceParser._intern(item)
+            # Ошибки и результаты, полученные при исчерпании бюджета
+            # времени, не кэшируются (как в parse)
+            if (cache is not None and item.get_additional_info('parse_fallback') is None
+                    and item.get_additional_info('parse_error') is None):
+                cache.put(texts[index], formats[index], item, engine)
+            items[index] = item
+        return items
+    
+    @staticmethod
+    def _finish_batch(batch, engine):
+        """
+        Записи порции parse_stream по окончании ее разбора в пуле
+        
+        Args:
+            batch (tuple): Порция (тексты, форматы, записи из кэша,
+                индексы ссылок, которых нет в кэше, задача пула или None)
+            engine (str): Механизм разбора ссылок ГОСТ
+        
+        Returns:
+            list: Записи в порядке текстов порции
+        """
+        texts, formats, items, misses, future = batch
+        parsed = future.result() if future is not None else []
+        return ReferenceParser._cache_fill(items, misses, parsed, texts, formats, engine)
+    
+    @staticmethod
+    def detect_list_format(texts, sample_size=None):
+        """
+        Определение формата библиографического списка по равномерной выборке ссылок
+        
+        Args:
+            texts (list): Тексты библиографических ссылок
+            sample_size (int): Размер выборки (по умолчанию LIST_FORMAT_SAMPLE_SIZE)
+            
+        Returns:
+            tuple: (формат ГОСТ или IEEE, доля ссылок выборки этого формата от 0 до 1)
+        """
+        if not texts:
+            return "ГОСТ", 0.0
+        
+        sample_size = sample_size or ReferenceParser.LIST_FORMAT_SAMPLE_SIZE
+        step = max(1, len(texts) // sample_size)
+        sample = texts[::step][:sample_size]
+        
+        votes = Counter(ReferenceParser._detect_format(text) for text in sample)
+        list_format, count = votes.most_common(1)[0]
+        return list_format, count / len(sample)
+    
+    @staticmethod
+    def resolve_formats(texts, format_type="auto"):
+        """
+        Определение формата каждой ссылки списка. При уверенно определенном
+        формате списка отдельно определяется формат только тех ссылок,
+        в которых есть признаки другого формата
+        
+        Args:
+            texts (list): Тексты библиографических ссылок
+            format_type (str): Тип формата (auto, ГОСТ, IEEE)
+            
+        Returns:
+            list: Формат для каждой ссылки в порядке исходных текстов
+        """
+        if format_type.lower() != "auto" and format_type.lower() != "автоопределение":
+            return [format_type] * len(texts)
+        
+        list_format, confidence = ReferenceParser.detect_list_format(texts)
+        if confidence < ReferenceParser.LIST_FORMAT_CONFIDENCE:
+            return [ReferenceParser._detect_format(text) for text in texts]
+        
+        if list_format == "IEEE":
+            outlier_pattern = ReferenceParser.IEEE_LIST_OUTLIER_PATTERN
+        else:
+            outlier_pattern = ReferenceParser.GOST_LIST_OUTLIER_PATTERN
+        
+        return [
+            ReferenceParser._detect_format(text) if outlier_pattern.search(text) else list_format
+            for text in texts
+        ]
+    
+    @staticmethod
+    def get_pattern_stats():
+        """
+        Получение статистики применения шаблонов ГОСТ
+        
+        Returns:
+            dict: Словарь {имя шаблона: {'hit': n, 'miss': n, 'skip': n}}, где
+                hit - шаблон совпал, miss - шаблон применялся, но не совпал,
+                skip - шаблон пропущен предварительной классификацией
+        """
+        return {
+            name: {outcome: counter[outcome] for outcome in ('hit', 'miss', 'skip')}
+            for name, counter in ReferenceParser._pattern_stats.items()
+        }
+    
+    @staticmethod
+    def reset_pattern_stats():
+        """Сброс статистики применения шаблонов ГОСТ"""
+        ReferenceParser._pattern_stats.clear()
+    
+    @staticmethod
+    def _count_pattern(name, outcome):
+        """
+        Учет результата применения шаблона
+        
+        Args:
+            name (str): Имя шаблона
+            outcome (str): Результат (hit, miss, skip)
+        """
+        ReferenceParser._pattern_stats[name][outcome] += 1
+    
+    @staticmethod
+    def _check_budget(deadline):
+        """
+        Проверка бюджета времени разбора ссылки
+        
+        Args:
+            deadline (float): Момент (time.perf_counter), до которого должен
+                завершиться разбор, или None без ограничения
+                
+        Raises:
+            ParseBudgetExceeded: Если время разбора истекло
+        """
+        if deadline is not None and time.perf_counter() > deadline:
+            raise ParseBudgetExceeded("Истекло время разбора ссылки")
+    
     @staticmethod
     def _process_authors(authors_text):
         """
@@ -227,24 +801,8 @@ class ReferenceParser:
         # Предварительная обработка
         authors_text = authors_text.replace(" и ", ", ").replace(" and ", ", ").replace("&", ",")
         
-        # Шаблоны для различных форматов авторов
-        # ГОСТ: "Фамилия И. О." или "Фамилия И.О."
-        gost_pattern = re.compile(r'([А-Яа-яA-Za-z]+)\s+([А-Яа-яA-Za-z]\.(?:\s*[А-Яа-яA-Za-z]\.)?)')
-        
-        # IEEE: "И. О. Фамилия" или "И.О. Фамилия"
-        ieee_pattern = re.compile(r'([А-Яа-яA-Za-z]\.(?:\s*[А-Яа-яA-Za-z]\.)?)\s+([А-Яа-яA-Za-z]+)')
-        
-        # Проверка наличия шаблона ГОСТ
-        if gost_pattern.search(authors_text):
-            parts = [part.strip() for part in authors_text.split(',') if part.strip()]
-            return parts
-        
-        # Проверка наличия шаблона IEEE
-        if ieee_pattern.search(authors_text):
-            parts = [part.strip() for part in authors_text.split(',') if part.strip()]
-            return parts
-        
-        # Если ни один шаблон не подходит, просто разделяем по запятым
+        # Авторы в формате ГОСТ ("Фамилия И. О."), IEEE ("И. О. Фамилия")
+        # и в произвольной записи одинаково разделяются по запятым
         return [part.strip() for part in authors_text.split(',') if part.strip()]
     
     @staticmethod
@@ -272,87 +830,74 @@ class ReferenceParser:
         return "ГОСТ"
     
     @staticmethod
-    def _parse_gost(text, item):
+    def _classify_gost(text):
+        """
+        Быстрый отбор шаблонов ГОСТ, которые могут совпасть с текстом.
+        Проверяются только обязательные элементы шаблонов (разделитель "//",
+        URL, "автореф. дис.", количество страниц "с."), поэтому отброшенный
+        шаблон гарантированно не совпал бы.
+        
+        Args:
+            text (str): Текст библиографической ссылки
+            
+        Returns:
+            set: Имена шаблонов-кандидатов (book, article, collection, web, thesis)
+        """
+        candidates = set()
+        has_colon = ':' in text
+        
+        if has_colon and '/' in text and ReferenceParser.GOST_PAGE_COUNT_MARKER.search(text):
+            candidates.add('book')
+        
+        if ReferenceParser.GOST_ARTICLE_MARKER.search(text):
+            candidates.add('article')
+            if has_colon and ReferenceParser.GOST_YEAR_MARKER.search(text):
+                candidates.add('collection')
+        
+        if ReferenceParser.GOST_WEB_MARKER.search(text):
+            candidates.add('web')
+        
+        if has_colon and ReferenceParser.GOST_THESIS_MARKER.search(text):
+            candidates.add('thesis')
+        
+        return candidates
+    
+    @staticmethod
+    def _parse_gost(text, item, deadline=None):
         """
         Распознавание элементов библиографической ссылки в формате ГОСТ
         
         Args:
             text (str): Текст библиографической ссылки
             item (BibliographyItem): Объект для заполнения
+            deadline (float): Срок завершения разбора (см. _check_budget)
         """
-        # Пробуем применить шаблоны для разных типов источников
-        # Книга
-        book_match = ReferenceParser.GOST_BOOK_PATTERN.search(text)
-        if book_match:
-            data = book_match.groupdict()
-            if data['authors']:
-                item.authors = ReferenceParser._process_authors(data['authors']+'.')
-            item.title = data['title'] if data['title'] else ""
-            item.subtitle = data['subtitle'] if data['subtitle'] else ""
-            # Очищаем поле edition от суффикса "-е изд."
-            if data['edition']:
-                edition = data['edition'].strip()
-                # Удаляем суффикс "-е изд." если он есть
-                edition = re.sub(r'\s*-\s*е\s*изд\.?$', '', edition, flags=re.IGNORECASE)
-                item.edition = edition
-            item.city = data['city'] if data['city'] else ""
-            item.publisher = data['publisher'] if data['publisher'] else ""
-            item.year = data['year'] if data['year'] else ""
-            item.pages = data['pages'] if data['pages'] else ""
-            item.type = 'book'
-            return
+        instrumentation = ReferenceParser.instrumentation
         
-        # Статья в журнале
-        article_match = ReferenceParser.GOST_ARTICLE_PATTERN.search(text)
-        if article_match:
-            data = article_match.groupdict()
-            if data['authors']:
-                item.authors = ReferenceParser._process_authors(data['authors']+'.')
-            item.title = data['title'] if data['title'] else ""
-            item.journal = data['journal'] if data['journal'] else ""
-            item.year = data['year'] if data['year'] else ""
-            item.volume = data['volume'] if data['volume'] else ""
-            item.issue = data['issue'] if data['issue'] else ""
-            item.pages = data['pages'] if data['pages'] else ""
-            item.type = 'article'
-            return
-        
-        # Статья в сборнике
-        collection_match = ReferenceParser.GOST_COLLECTION_PATTERN.search(text)
-        if collection_match:
-            data = collection_match.groupdict()
-            if data['authors']:
-                item.authors = ReferenceParser._process_authors(data['authors']+'.')
-            item.title = data['title'] if data['title'] else ""
-            item.journal = data['collection'] if data['collection'] else ""
-            item.publisher = data['publisher'] if data['publisher'] else ""
-            item.year = data['year'] if data['year'] else ""
-            item.pages = data['pages'] if data['pages'] else ""
-            item.type = 'article'
-            return
+        # Предварительная классификация: запускаем только те шаблоны,
+        # обязательные признаки которых присутствуют в тексте
+        candidates = ReferenceParser._classify_gost(text)
+        if instrumentation is not None:
+            instrumentation.mark('gost.classify', f"candidates={len(candidates)}")
         
-        # Веб-ресурс
-        web_match = ReferenceParser.GOST_WEB_PATTERN.search(text)
-        if web_match:
-            data = web_match.groupdict()
-            if data['authors']:
-                item.authors = ReferenceParser._process_authors(data['authors']+'.')
-            item.title = data['title'] if data['title'] else ""
-            item.url = data['url'] if data['url'] else ""
-            item.type = 'web'
-            return
+        for name, pattern_attr, fill_attr in ReferenceParser.GOST_CASCADE:
+            if name not in candidates:
+                ReferenceParser._count_pattern(name, 'skip')
+                continue
+            
+            ReferenceParser._check_budget(deadline)
+            match = getattr(ReferenceParser, pattern_attr).search(text)
+            if match:
+                ReferenceParser._count_pattern(name, 'hit')
+                getattr(ReferenceParser, fill_attr)(match.groupdict(), item)
+                if instrumentation is not None:
+                    instrumentation.mark('gost.' + name, 'hit')
+                return
+            ReferenceParser._count_pattern(name, 'miss')
+            if instrumentation is not None:
+                instrumentation.mark('gost.' + name, 'miss')
         
-        # Автореферат диссертации
-        thesis_match = ReferenceParser.GOST_THESIS_PATTERN.search(text)
-        if thesis_match:
-            data = thesis_match.groupdict()
-            if data['authors']:
-                item.authors = ReferenceParser._process_authors(data['authors']+'.')
-            item.title = data['title'] if data['title'] else ""
-            item.year = data['year'] if data['year'] else ""
-            item.pages = data['pages'] if data['pages'] else ""
-            item.type = 'thesis'
-            return
+        ReferenceParser._check_budget(deadline)
         
         # Если ни один из шаблонов не подошел, но есть признаки статьи ('//')
         if '//' in text and not item.journal:
@@ -365,19 +910,19 @@ class ReferenceParser:
                 second_part = parts[1].strip()
                 
                 # Извлекаем название журнала до первой точки или тире
-                journal_match = re.search(r'^([^\.—]+)', second_part)
+                journal_match = ReferenceParser.GOST_SPLIT_JOURNAL_PATTERN.search(second_part)
                 if journal_match:
                     item.journal = journal_match.group(1).strip()
                 
                 # Если авторы не определены, пробуем извлечь из первой части
                 if not item.authors:
                     # Ищем авторов до первой точки
-                    author_match = re.search(r'^(.*?)\.\s+', first_part)
+                    author_match = ReferenceParser.GOST_SPLIT_AUTHORS_PATTERN.search(first_part)
                     if author_match:
                         item.authors = ReferenceParser._process_authors(author_match.group(1))
                     
                     # Извлекаем название после авторов (после первой точки)
-                    title_match = re.search(r'^.*?\.\s+(.*?)(?:\s+/\s+.*?)?$', first_part)
+                    title_match = ReferenceParser.GOST_SPLIT_TITLE_PATTERN.search(first_part)
                     if title_match:
                         item.title = title_match.group(1).strip()
                 
@@ -386,27 +931,29 @@ class ReferenceParser:
                     item.type = 'article'
                     
                 # Извлекаем дополнительную информацию из второй части
-                year_match = re.search(r'—\s+(\d{4})', second_part)
+                year_match = ReferenceParser.GOST_SPLIT_YEAR_PATTERN.search(second_part)
                 if year_match:
                     item.year = year_match.group(1)
                 
-                volume_match = re.search(r'Т\.\s+(\d+)', second_part)
+                volume_match = ReferenceParser.GOST_SPLIT_VOLUME_PATTERN.search(second_part)
                 if volume_match:
                     item.volume = volume_match.group(1)
                 
-                issue_match = re.search(r'№\s+(\d+)', second_part)
+                issue_match = ReferenceParser.GOST_SPLIT_ISSUE_PATTERN.search(second_part)
                 if issue_match:
                     item.issue = issue_match.group(1)
                 
-                pages_match = re.search(r'С\.\s*(\d+(?:.\d+)?)', second_part)
+                pages_match = ReferenceParser.GOST_SPLIT_PAGES_PATTERN.search(second_part)
                 if pages_match:
                     item.pages = pages_match.group(1)
                 
+                if instrumentation is not None:
+                    instrumentation.mark('gost.split_fallback', item.type or 'unknown')
                 return
         
         # Дополнительная информация
         # Издательство
-        publisher_match = re.search(r'(?:[\s:]+)([^:,\.]+(?:Издательство|Изд-во|Press|Publishing)[^:,\.]+)(?:,|\.|$)', text, re.IGNORECASE)
+        publisher_match = ReferenceParser.PUBLISHER_PATTERN.search(text)
         if publisher_match:
             item.publisher = publisher_match.group(1).strip()
             item.type = 'book'
@@ -447,21 +994,122 @@ class ReferenceParser:
         doi_match = ReferenceParser.DOI_PATTERN.search(text)
         if doi_match:
             item.doi = doi_match.group(2)
+        
+        if instrumentation is not None:
+            instrumentation.mark('gost.fields', item.type or 'unknown')
+    
+    @staticmethod
+    def _fill_gost_book(data, item):
+        """
+        Заполнение записи по результату шаблона книги ГОСТ
+        
+        Args:
+            data (dict): Группы совпадения шаблона
+            item (BibliographyItem): Объект для заполнения
+        """
+        if data['authors']:
+            item.authors = ReferenceParser._process_authors(data['authors']+'.')
+        item.title = data['title'] if data['title'] else ""
+        item.subtitle = data['subtitle'] if data['subtitle'] else ""
+        # Очищаем поле edition от суффикса "-е изд."
+        if data['edition']:
+            edition = data['edition'].strip()
+            # Удаляем суффикс "-е изд." если он есть
+            edition = ReferenceParser.GOST_EDITION_SUFFIX_PATTERN.sub('', edition)
+            item.edition = edition
+        item.city = data['city'] if data['city'] else ""
+        item.publisher = data['publisher'] if data['publisher'] else ""
+        item.year = data['year'] if data['year'] else ""
+        item.pages = data['pages'] if data['pages'] else ""
+        item.type = 'book'
+    
+    @staticmethod
+    def _fill_gost_article(data, item):
+        """
+        Заполнение записи по результату шаблона статьи в журнале ГОСТ
+        
+        Args:
+            data (dict): Группы совпадения шаблона
+            item (BibliographyItem): Объект для заполнения
+        """
+        if data['authors']:
+            item.authors = ReferenceParser._process_authors(data['authors']+'.')
+        item.title = data['title'] if data['title'] else ""
+        item.journal = data['journal'] if data['journal'] else ""
+        item.year = data['year'] if data['year'] else ""
+        item.volume = data['volume'] if data['volume'] else ""
+        item.issue = data['issue'] if data['issue'] else ""
+        item.pages = data['pages'] if data['pages'] else ""
+        item.type = 'article'
+    
+    @staticmethod
+    def _fill_gost_collection(data, item):
+        """
+        Заполнение записи по результату шаблона статьи в сборнике ГОСТ
+        
+        Args:
+            data (dict): Группы совпадения шаблона
+            item (BibliographyItem): Объект для заполнения
+        """
+        if data['authors']:
+            item.authors = ReferenceParser._process_authors(data['authors']+'.')
+        item.title = data['title'] if data['title'] else ""
+        item.journal = data['collection'] if data['collection'] else ""
+        item.publisher = data['publisher'] if data['publisher'] else ""
+        item.year = data['year'] if data['year'] else ""
+        item.pages = data['pages'] if data['pages'] else ""
+        item.type = 'article'
+    
+    @staticmethod
+    def _fill_gost_web(data, item):
+        """
+        Заполнение записи по результату шаблона веб-ресурса ГОСТ
+        
+        Args:
+            data (dict): Группы совпадения шаблона
+            item (BibliographyItem): Объект для заполнения
+        """
+        if data['authors']:
+            item.authors = ReferenceParser._process_authors(data['authors']+'.')
+        item.title = data['title'] if data['title'] else ""
+        item.url = data['url'] if data['url'] else ""
+        item.type = 'web'
+    
+    @staticmethod
+    def _fill_gost_thesis(data, item):
+        """
+        Заполнение записи по результату шаблона автореферата ГОСТ
+        
+        Args:
+            data (dict): Группы совпадения шаблона
+            item (BibliographyItem): Объект для заполнения
+        """
+        if data['authors']:
+            item.authors = ReferenceParser._process_authors(data['authors']+'.')
+        item.title = data['title'] if data['title'] else ""
+        item.year = data['year'] if data['year'] else ""
+        item.pages = data['pages'] if data['pages'] else ""
+        item.type = 'thesis'
     
     @staticmethod
-    def _parse_ieee(text, item):
+    def _parse_ieee(text, item, deadline=None):
         """
         Распознавание элементов библиографической ссылки в формате IEEE
         
         Args:
             text (str): Текст библиографической ссылки
             item (BibliographyItem): Объект для заполнения
+            deadline (float): Срок завершения разбора (см. _check_budget)
         """
+        instrumentation = ReferenceParser.instrumentation
+        
         # Удаляем номер ссылки, если есть
-        cleaned_text = re.sub(r'^\[\d+\]\s*', '', text)
+        cleaned_text = ReferenceParser.IEEE_NUMBER_PATTERN.sub('', text)
         
         # Проверяем наличие цитаты в кавычках для определения названия
-        title_match = re.search(r'"([^"]+)"', cleaned_text)
+        title_match = ReferenceParser.IEEE_QUOTED_TITLE_PATTERN.search(cleaned_text)
+        if instrumentation is not None:
+            instrumentation.mark('ieee.quoted_title', 'hit' if title_match else 'miss')
         if title_match:
             item.title = title_match.group(1).strip()
             
@@ -480,7 +1128,7 @@ class ReferenceParser:
                 after_title = parts[1].strip()
                 
                 # Журнал часто идет сразу после названия до следующей запятой
-                journal_match = re.search(r'^\s*,\s*([^,]+)', after_title)
+                journal_match = ReferenceParser.IEEE_JOURNAL_PATTERN.search(after_title)
                 if journal_match:
                     item.journal = journal_match.group(1).strip()
                     item.type = 'article'
@@ -488,6 +1136,8 @@ class ReferenceParser:
             # Если нет названия в кавычках, пробуем стандартные шаблоны
             # Статья в журнале
             article_match = ReferenceParser.IEEE_ARTICLE_PATTERN.search(cleaned_text)
+            if instrumentation is not None:
+                instrumentation.mark('ieee.article', 'hit' if article_match else 'miss')
             if article_match:
                 data = article_match.groupdict()
                 if data['authors']:
@@ -504,8 +1154,11 @@ class ReferenceParser:
                 item.type = 'article'
                 return
                 
+            ReferenceParser._check_budget(deadline)
             # Статья в сборнике конференции
             conference_match = ReferenceParser.IEEE_CONFERENCE_PATTERN.search(cleaned_text)
+            if instrumentation is not None:
+                instrumentation.mark('ieee.conference', 'hit' if conference_match else 'miss')
             if conference_match:
                 data = conference_match.groupdict()
                 if data['authors']:
@@ -520,8 +1173,11 @@ class ReferenceParser:
                 item.type = 'conference'
                 return
                 
+            ReferenceParser._check_budget(deadline)
             # Книга
             book_match = ReferenceParser.IEEE_BOOK_PATTERN.search(cleaned_text)
+            if instrumentation is not None:
+                instrumentation.mark('ieee.book', 'hit' if book_match else 'miss')
             if book_match:
                 data = book_match.groupdict()
                 if data['authors']:
@@ -532,21 +1188,23 @@ class ReferenceParser:
                 item.type = 'book'
                 return
         
+        ReferenceParser._check_budget(deadline)
+        
         # Дополнительная информация
         # Том, номер, страницы, год, DOI
-        volume_match = re.search(r'vol\.\s*(\d+)', cleaned_text, re.IGNORECASE)
+        volume_match = ReferenceParser.IEEE_VOLUME_PATTERN.search(cleaned_text)
         if volume_match:
             item.volume = volume_match.group(1)
             if not item.type:
                 item.type = 'article'
         
-        issue_match = re.search(r'no\.\s*(\d+)', cleaned_text, re.IGNORECASE)
+        issue_match = ReferenceParser.IEEE_ISSUE_PATTERN.search(cleaned_text)
         if issue_match:
             item.issue = issue_match.group(1)
             if not item.type:
                 item.type = 'article'
         
-        pages_match = re.search(r'pp\.\s*(\d+)[-–](\d+)|p\.\s*(\d+)', cleaned_text, re.IGNORECASE)
+        pages_match = ReferenceParser.IEEE_PAGES_PATTERN.search(cleaned_text)
         if pages_match:
             if pages_match.group(1) and pages_match.group(2):
                 item.pages = f"{pages_match.group(1)}–{pages_match.group(2)}"
@@ -570,36 +1228,43 @@ class ReferenceParser:
                 elif groups[2]:  # P. X
                     item.pages = groups[2]
         
-        year_match = re.search(r'\b(19|20)\d{2}\b', cleaned_text)
+        year_match = ReferenceParser.PLAIN_YEAR_PATTERN.search(cleaned_text)
         if year_match:
             item.year = year_match.group(0)
         
-        doi_match = re.search(r'doi:?\s*(10\.\d{4,}(?:\.\d+)*\/(?:(?!["&\'])\S)+)', cleaned_text, re.IGNORECASE)
+        doi_match = ReferenceParser.IEEE_DOI_PATTERN.search(cleaned_text)
         if doi_match:
             item.doi = doi_match.group(1)
         
         # Определение типа источника по содержимому текста
         if 'IEEE' in cleaned_text and not item.type:
             item.type = 'article'
+        
+        if instrumentation is not None:
+            instrumentation.mark('ieee.fields', item.type or 'unknown')
     
     @staticmethod
-    def _parse_general(text, item):
+    def _parse_general(text, item, deadline=None, use_patterns=True):
         """
         Общий метод распознавания элементов библиографической ссылки
         
         Args:
             text (str): Текст библиографической ссылки
             item (BibliographyItem): Объект для заполнения
+            deadline (float): Срок завершения разбора (см. _check_budget)
+            use_patterns (bool): Применять ли полные шаблоны ГОСТ и IEEE.
+                При False выполняется только базовый анализ
         """
         # Для общего метода пробуем сначала шаблоны ГОСТ, затем IEEE
         # Если ни один из них не подходит, используем базовый анализ
         
-        # Пробуем шаблоны ГОСТ
-        ReferenceParser._parse_gost(text, item)
-        
-        # Если не удалось распознать авторов или название, пробуем IEEE
-        if not item.authors and not item.title:
-            ReferenceParser._parse_ieee(text, item)
+        if use_patterns:
+            # Пробуем шаблоны ГОСТ
+            ReferenceParser._parse_gost(text, item, deadline)
+            
+            # Если не удалось распознать авторов или название, пробуем IEEE
+            if not item.authors and not item.title:
+                ReferenceParser._parse_ieee(text, item, deadline)
         
         # Если всё ещё нет данных, используем базовый анализ
         if not item.authors and not item.title:
@@ -611,12 +1276,12 @@ class ReferenceParser:
                 first_part = parts[0].strip()
                 
                 # Если в первой части есть запятые и это не URL
-                if ',' in first_part and not re.search(r'https?:|www\.', first_part, re.IGNORECASE):
+                if ',' in first_part and not ReferenceParser.WEB_ADDRESS_PATTERN.search(first_part):
                     # Анализируем как список, возможно авторов
                     potential_items = [p.strip() for p in first_part.split(',') if p.strip()]
                     
                     # Проверяем, есть ли в списке инициалы
-                    has_initials = any(re.search(r'[А-Яа-яA-Za-z]\.\s*[А-Яа-яA-Za-z]\.', p) for p in potential_items)
+                    has_initials = any(ReferenceParser.INITIALS_PATTERN.search(p) for p in potential_items)
                     
                     if has_initials:
                         # Вероятно, это авторы
@@ -635,12 +1300,12 @@ class ReferenceParser:
         # Дополнительно ищем информацию о годе, томе, номере, страницах и т.д.
         # если они еще не были найдены
         if not item.year:
-            year_match = re.search(r'\b(19|20)\d{2}\b', text)
+            year_match = ReferenceParser.PLAIN_YEAR_PATTERN.search(text)
             if year_match:
                 item.year = year_match.group(0)
         
         if not item.publisher:
-            publisher_match = re.search(r'(?:[\s:]+)([^:,\.]+(?:Издательство|Изд-во|Press|Publishing)[^:,\.]+)(?:,|\.|$)', text, re.IGNORECASE)
+            publisher_match = ReferenceParser.PUBLISHER_PATTERN.search(text)
             if publisher_match:
                 item.publisher = publisher_match.group(1).strip()
                 if not item.type:
@@ -685,11 +1350,9 @@ class ReferenceParser:
         """
         # Подсчет русских и латинских букв в заголовке
         if item.title:
-            ru_pattern = re.compile(r'[а-яА-ЯёЁ]')
-            en_pattern = re.compile(r'[a-zA-Z]')
-            
-            ru_count = len(ru_pattern.findall(item.title))
-            en_count = len(en_pattern.findall(item.title))
+            marked = item.title.translate(ReferenceParser.LETTER_SCRIPT_TABLE)
+            ru_count = marked.count(ReferenceParser.RU_LETTER_MARKER)
+            en_count = marked.count(ReferenceParser.EN_LETTER_MARKER)
             
             if ru_count > en_count:
                 item.language = 'ru'
@@ -716,32 +1379,73 @@ class ReferenceParser:
     @staticmethod
     def _check_vak_rinc(item):
         """
-        Проверка признаков ВАК/РИНЦ
+        Проверка признаков ВАК/РИНЦ по перечням журналов
         
         Args:
             item (BibliographyItem): Объект библиографической записи
         """
-        # Предположим, что есть некий словарь или список ВАК/РИНЦ журналов
-        # В реальном приложении здесь должна быть проверка по базе данных
+        if item.journal:
+            registry = ReferenceParser.journal_registry or JournalRegistry.default()
+            item.is_vak, item.is_rinc = registry.classify(item.journal)
+    
+    @staticmethod
+    def _vak_rinc_outcome(item):
+        """
+        Результат проверки ВАК/РИНЦ для отчета инструментирования
         
-        vak_journals = [
-            'Вестник МГУ', 'Известия РАН', 'Доклады Академии наук', 
-            'Вопросы философии', 'Вопросы экономики'
-        ]
+        Args:
+            item (BibliographyItem): Объект библиографической записи
+            
+        Returns:
+            str: no_journal, vak, rinc, vak+rinc или not_listed
+        """
+        if not item.journal:
+            return 'no_journal'
+        if item.is_vak and item.is_rinc:
+            return 'vak+rinc'
+        if item.is_vak:
+            return 'vak'
+        if item.is_rinc:
+            return 'rinc'
+        return 'not_listed'
+
+
+def _parse_batch(texts, formats, engine="regex", use_cache=True):
+    """
+    Распознавание порции ссылок для ReferenceParser.parse_stream
+    (функция уровня модуля, чтобы передаваться в процессы)
+    
+    Args:
+        texts (list): Тексты библиографических ссылок
+        formats (list): Формат каждой ссылки
+        engine (str): Механизм разбора ссылок ГОСТ
+        use_cache (bool): Использовать кэш (см. ReferenceParser.parse)
         
-        rinc_journals = [
-            'Научный журнал', 'Системный администратор', 'Прикладная информатика',
-            'Вестник СПбГУ', 'Вестник МГТУ'
-        ]
+    Returns:
+        list: Распознанные записи
+    """
+    return [_parse_safely(text, text_format, engine, use_cache) for text, text_format in zip(texts, formats)]
+
+def _parse_safely(text, format_type, engine="regex", use_cache=True):
+    """
+    Распознавание одной ссылки для ReferenceParser.parse_many без прерывания
+    пакета при ошибке (функция уровня модуля, чтобы передаваться в процессы)
+    
+    Args:
+        text (str): Текст библиографической ссылки
+        format_type (str): Тип формата
+        engine (str): Механизм разбора ссылок ГОСТ
+        use_cache (bool): Использовать кэш (см. ReferenceParser.parse)
         
-        if item.journal:
-            # Компилируем регулярные выражения для более эффективного поиска
-            vak_patterns = [re.compile(re.escape(vj.lower())) for vj in vak_journals]
-            rinc_patterns = [re.compile(re.escape(rj.lower())) for rj in rinc_journals]
-            
-            journal_lower = item.journal.lower()
-            item.is_vak = any(pattern.search(journal_lower) for pattern in vak_patterns)
-            item.is_rinc = any(pattern.search(journal_lower) for pattern in rinc_patterns)
+    Returns:
+        BibliographyItem: Распознанная запись или запись с описанием ошибки
+    """
+    try:
+        return ReferenceParser.parse(text, format_type, engine, use_cache)
+    except Exception as e:
+        item = BibliographyItem(text)
+        item.additional_info['parse_error'] = str(e)
+        return item
 
 # Примеры использования:
 # reference = "Иванов А.А., Петров Б.Б. Название книги. М.: Издательство, 2022. 300 с."
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+
+class ReferenceSegmenter:
+    """
+    Потоковое выделение библиографических ссылок из текста документа.
+    Текст поступает порциями (страница PDF, абзац DOCX, строка TXT),
+    ссылки выдаются по мере готовности, а в памяти хранится только
+    текущая незавершенная ссылка.
+    """
+    
+    # Предельная длина одной ссылки: при превышении накопленный текст
+    # выдается как есть, чтобы память оставалась ограниченной
+    MAX_REFERENCE_LENGTH = 5000
+    
+    # Нумерация ссылки: "[12]", "12.", "12)"
+    NUMBERING_PATTERN = re.compile(r'^(?:\[(\d{1,4})\]|(\d{1,4})[.)])\s+')
+    
+    # Заголовки раздела списка литературы (возможно, с номером раздела)
+    HEADING_PATTERN = re.compile(
+        r'^(?:\d+(?:\.\d+)*\.?\s+)?'
+        r'(?:список\s+(?:использованн\w+\s+|цитируем\w+\s+)?(?:литературы|источников)'
+        r'|библиографическ\w+\s+список|библиография|литература'
+        r'|references|bibliography|works\s+cited)\s*:?$',
+        re.IGNORECASE
+    )
+    
+    # Заголовок приложения: "Приложения", "ПРИЛОЖЕНИЕ А", "Приложение 1.
+    # Листинг программы", "Appendix B: Proofs". Обозначение приложения -
+    # заглавная буква или номер, название после него начинается
+    # с заглавной буквы, поэтому ссылки вида "Приложение к приказу ..."
+    # и "Приложение 1 к постановлению ..." заголовком не считаются
+    APPENDIX_HEADING_PATTERN = re.compile(
+        r'^(?:приложени[ея]|appendix|appendices)'
+        r'(?:\s+(?-i:[A-ZА-ЯЁ]|\d{1,2})(?:[.:)]?\s+(?:[-–—]\s+)?(?-i:[A-ZА-ЯЁ«"]).*|[.:]?)|[.:]?)$',
+        re.IGNORECASE
+    )
+    
+    # Заголовки других разделов работы на отдельной строке (только
+    # слово заголовка, возможно, с номером раздела)
+    SECTION_HEADING_PATTERN = re.compile(
+        r'^(?:\d+(?:\.\d+)*\.?\s+)?'
+        r'(?:содержание|оглавление|введение|заключение|contents|introduction|conclusions?)\s*:?$',
+        re.IGNORECASE
+    )
+    
+    # Пунктуация областей библиографической ссылки (" / ", " // ", ". — "):
+    # строка с ней - ссылка, а не заголовок
+    REFERENCE_PUNCTUATION_PATTERN = re.compile(r'\s/\s|//|\.\s+[-–—]\s')
+    
+    # Заголовок раздела занимает короткую строку
+    MAX_HEADING_LENGTH = 80
+    
+    # Колонтитулы с номером страницы: "12", "- 12 -", "Стр. 12", "Page 3 of 10"
+    PAGE_NUMBER_PATTERN = re.compile(
+        r'^(?:[-–—]\s*)?(?:(?:стр|page)\.?\s*)?\d{1,4}(?:\s*(?:из|of)\s*\d{1,4})?(?:\s*[-–—])?$',
+        re.IGNORECASE
+    )
+    
+    # Начало ссылки без нумерации: "Фамилия И. О." или "И. О. Фамилия"
+    AUTHOR_START_PATTERN = re.compile(
+        r"^(?:[A-ZА-ЯЁ][\w'’-]+,?\s+(?:[A-ZА-ЯЁ]\.\s*){1,3}"
+        r"|(?:[A-ZА-ЯЁ]\.\s*){1,3}[A-ZА-ЯЁ][\w'’-]+)"
+    )
+    
+    # Перенос слова по слогам в конце строки: "програм-" + "мирования"
+    HYPHENATION_PATTERN = re.compile(r'[^\W\d_]-$')
+    # Адрес, разорванный переносом строки после "/", "-", "_", "." и т.п.
+    URL_TAIL_PATTERN = re.compile(r'https?://\S*[/\-_.?=&#]$')
+    
+    @staticmethod
+    def segment(chunks, wrapped=False):
+        """
+        Выделение ссылок из последовательности порций текста
+        
+        Args:
+            chunks (iterable): Порции текста документа (страницы, абзацы, строки)
+            wrapped (bool): Строки перенесены по ширине страницы (PDF): ссылка
+                может занимать несколько строк. Иначе каждая строка -
+                отдельная ссылка (TXT, DOCX)
+        
+        Yields:
+            str: Текст ссылки без нумерации
+        """
+        current = ""
+        # Номер последней нумерованной ссылки; None - список без нумерации
+        last_number = None
+        
+        for chunk in chunks:
+            for line in chunk.split('\n'):
+                line = line.replace('\xad', '').strip()
+                
+                if not line:
+                    # Пустая строка завершает ссылку
+                    if current:
+                        yield current
+                        current = ""
+                    continue
+                
+                if ReferenceSegmenter.HEADING_PATTERN.match(line):
+                    # Новый список литературы нумеруется заново
+                    if current:
+                        yield current
+                        current = ""
+                    last_number = None
+                    continue
+                
+                if ReferenceSegmenter._is_heading(line):
+                    # Заголовок другого раздела завершает ссылку; нумерация
+                    # не сбрасывается (строка могла ошибочно оказаться
+                    # заголовком, и следующая ссылка списка не должна
+                    # приклеиться к предыдущей)
+                    if current:
+                        yield current
+                        current = ""
+                    continue
+                
+                if wrapped and ReferenceSegmenter.PAGE_NUMBER_PATTERN.match(line):
+                    continue
+                
+                numbering = ReferenceSegmenter.NUMBERING_PATTERN.match(line)
+                if numbering and ReferenceSegmenter._is_next_number(numbering, last_number, current, wrapped):
+                    last_number = int(numbering.group(1) or numbering.group(2))
+                    line = line[numbering.end():]
+                    starts_reference = True
+                elif not wrapped:
+                    starts_reference = True
+                elif last_number is not None:
+                    # В нумерованном списке ссылка начинается только с номера
+                    starts_reference = False
+                else:
+                    starts_reference = not current or (
+                        current.endswith('.') and ReferenceSegmenter.AUTHOR_START_PATTERN.match(line) is not None
+                    )
+                
+                if starts_reference:
+                    if current:
+                        yield current
+                    current = line
+                else:
+                    current = ReferenceSegmenter._join_lines(current, line)
+                
+                if len(current) > ReferenceSegmenter.MAX_REFERENCE_LENGTH:
+                    yield current
+                    current = ""
+        
+        if current:
+            yield current
+    
+    @staticmethod
+    def is_appendix_heading(line):
+        """
+        Проверка, является ли строка заголовком приложения
+        
+        Args:
+            line (str): Строка текста без начальных и конечных пробелов
+        
+        Returns:
+            bool: True для заголовка приложения
+        """
+        return (
+            len(line) <= ReferenceSegmenter.MAX_HEADING_LENGTH
+            and ReferenceSegmenter.APPENDIX_HEADING_PATTERN.match(line) is not None
+            and ReferenceSegmenter.REFERENCE_PUNCTUATION_PATTERN.search(line) is None
+        )
+    
+    @staticmethod
+    def _is_heading(line):
+        """
+        Проверка, является ли строка заголовком раздела, отличного от
+        списка литературы (строки из заглавных букв без такого заголовка -
+        например, перенесенное "WORLD HEALTH ORGANIZATION" - остаются
+        частью ссылки)
+        
+        Args:
+            line (str): Строка текста без концевых пробелов
+        
+        Returns:
+            bool: True для заголовка приложения ("ПРИЛОЖЕНИЕ А")
+                или раздела работы ("ЗАКЛЮЧЕНИЕ")
+        """
+        return (
+            ReferenceSegmenter.SECTION_HEADING_PATTERN.match(line) is not None
+            or ReferenceSegmenter.is_appendix_heading(line)
+        )
+    
+    @staticmethod
+    def _is_next_number(numbering, last_number, current, wrapped):
+        """
+        Проверка, что нумерация в начале строки начинает новую ссылку,
+        а не является продолжением перенесенной ("2020. — 300 с.")
+        
+        Args:
+            numbering (re.Match): Совпадение NUMBERING_PATTERN
+            last_number (int): Номер предыдущей ссылки или None
+            current (str): Накопленный текст текущей ссылки
+            wrapped (bool): Строки перенесены по ширине страницы
+        
+        Returns:
+            bool: True, если строка начинает нумерованную ссылку
+        """
+        # Номер в квадратных скобках в продолжении ссылки не встречается
+        if numbering.group(1):
+            return True
+        number = int(numbering.group(2))
+        if last_number is not None:
+            return number == last_number + 1
+        # Начало нумерованного списка: первая строка ссылки или номер 1,
+        # а для построчного текста - любая строка
+        return not wrapped or not current or number == 1
+    
+    @staticmethod
+    def _join_lines(current, line):
+        """
+        Присоединение перенесенной строки к тексту ссылки
+        
+        Args:
+            current (str): Накопленный текст ссылки
+            line (str): Следующая строка
+        
+        Returns:
+            str: Объединенный текст
+        """
+        if line[0].islower() and ReferenceSegmenter.HYPHENATION_PATTERN.search(current):
+            return current[:-1] + line
+        if ReferenceSegmenter.URL_TAIL_PATTERN.search(current):
+            return current + line
+        return current + ' ' + line
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from docx import Document
+from PyPDF2 import PdfReader
+from utils.file_utils import detect_txt_encoding
+from utils.reference_segmenter import ReferenceSegmenter
+
+# Заголовок раздела списка литературы на отдельной строке
+# ("Список литературы", "Список использованных источников", "References")
+BIBLIOGRAPHY_HEADING_PATTERN = ReferenceSegmenter.HEADING_PATTERN
+
+# Заголовок раздела, следующего за списком литературы ("ПРИЛОЖЕНИЕ А",
+# "Appendix B: Proofs"; см. ReferenceSegmenter.APPENDIX_HEADING_PATTERN)
+SECTION_END_PATTERN = ReferenceSegmenter.APPENDIX_HEADING_PATTERN
+
+def is_section_end(line):
+    """
+    Проверка, является ли строка заголовком раздела после списка литературы
+    
+    Args:
+        line (str): Строка текста без начальных и конечных пробелов
+    
+    Returns:
+        bool: True для заголовка приложения
+    """
+    return ReferenceSegmenter.is_appendix_heading(line)
+
+def find_last_heading(lines):
+    """
+    Поиск последнего заголовка списка литературы среди строк
+
+    Args:
+        lines (list): Строки текста
+
+    Returns:
+        int: Индекс строки заголовка или None, если заголовка нет
+    """
+    for index in range(len(lines) - 1, -1, -1):
+        if BIBLIOGRAPHY_HEADING_PATTERN.match(lines[index].strip()):
+            return index
+    return None
+
+def cut_at_section_end(chunks):
+    """
+    Выдача порций текста до заголовка следующего раздела (приложения)
+
+    Args:
+        chunks (iterable): Порции текста после заголовка списка литературы
+
+    Yields:
+        str: Порции текста (последняя - до заголовка следующего раздела)
+    """
+    for chunk in chunks:
+        lines = chunk.split('\n')
+        for index, line in enumerate(lines):
+            if is_section_end(line.strip()):
+                if index:
+                    yield '\n'.join(lines[:index])
+                return
+        yield chunk
+
+def iter_pdf_section(file_path):
+    """
+    Чтение раздела списка литературы из файла PDF. Страницы
+    просматриваются с конца документа до последнего заголовка списка,
+    поэтому текст остальных страниц не извлекается
+
+    Args:
+        file_path (str): Путь к файлу
+
+    Yields:
+        str: Текст страниц раздела (весь документ, если заголовок не найден)
+    """
+    try:
+        reader = PdfReader(file_path)
+        tail = []
+        found = False
+        for page in reversed(reader.pages):
+            text = page.extract_text() or ""
+            lines = text.split('\n')
+            heading = find_last_heading(lines)
+            if heading is not None:
+                tail.append('\n'.join(lines[heading + 1:]))
+                found = True
+                break
+            tail.append(text)
+    except Exception as e:
+        raise Exception(f"Ошибка при чтении файла PDF: {str(e)}")
+
+    pages = (text for text in reversed(tail) if text.strip())
+    if found:
+        yield from cut_at_section_end(pages)
+    else:
+        yield from pages
+
+def iter_docx_section(file_path):
+    """
+    Чтение раздела списка литературы из файла DOCX
+
+    Args:
+        file_path (str): Путь к файлу
+
+    Yields:
+        str: Текст непустых абзацев раздела (весь документ,
+            если заголовок не найден)
+    """
+    try:
+        paragraphs = [paragraph.text for paragraph in Document(file_path).paragraphs]
+    except Exception as e:
+        raise Exception(f"Ошибка при чтении файла DOCX: {str(e)}")
+
+    heading = find_last_heading(paragraphs)
+    texts = (text for text in paragraphs[(heading + 1 if heading is not None else 0):] if text.strip())
+    if heading is not None:
+        yield from cut_at_section_end(texts)
+    else:
+        yield from texts
+
+def iter_txt_section(file_path):
+    """
+    Чтение раздела списка литературы из текстового файла в два прохода:
+    первый находит последний заголовок, второй выдает строки после него
+
+    Args:
+        file_path (str): Путь к файлу
+
+    Yields:
+        str: Строки раздела (весь файл, если заголовок не найден)
+    """
+    encoding = detect_txt_encoding(file_path)
+    try:
+        heading = None
+        with open(file_path, 'r', encoding=encoding) as file:
+            for index, line in enumerate(file):
+                if BIBLIOGRAPHY_HEADING_PATTERN.match(line.strip()):
+                    heading = index
+
+        with open(file_path, 'r', encoding=encoding) as file:
+            if heading is None:
+                yield from file
+            else:
+                lines = (line for index, line in enumerate(file) if index > heading)
+                yield from cut_at_section_end(lines)
+    except Exception as e:
+        raise Exception(f"Ошибка при чтении текстового файла: {str(e)}")
+
+def iter_bibliography_section(file_path):
+    """
+    Чтение раздела списка литературы из файла в зависимости от его формата
+
+    Args:
+        file_path (str): Путь к файлу
+
+    Returns:
+        iterator: Порции текста раздела списка литературы
+    """
+    _, ext = os.path.splitext(file_path)
+    ext = ext.lower()
+
+    if ext == '.docx':
+        return iter_docx_section(file_path)
+    elif ext == '.pdf':
+        return iter_pdf_section(file_path)
+    elif ext == '.txt':
+        return iter_txt_section(file_path)
+    else:
+        raise Exception(f"Неподдерживаемый формат файла: {ext}")
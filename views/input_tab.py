@@ -11,6 +11,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QFont
 from datetime import datetime
+from bisect import bisect_left
+from models.model_events import BibliographyEvent
 
 class BibliographyTableModel(QAbstractTableModel):
     """
@@ -21,7 +23,16 @@ class BibliographyTableModel(QAbstractTableModel):
         super().__init__()
         self.items = items or []
         self.filtered_items = []
+        # Индексы отображаемых записей в исходном списке (по возрастанию);
+        # None - фильтр не задан и отображаются все записи
+        self.filtered_indices = None
         self.filter_text = ""
+        # Индексы записей, найденных по тексту в индексе файла проекта;
+        # None - текст ищется в самих записях
+        self.indexed_matches = None
+        # Текст для поиска каждой записи списка (BibliographyItem.search_text):
+        # строится при поиске по записям и освобождается при сбросе фильтра
+        self.search_texts = None
         self.headers = [
             "Библиографическая ссылка", 
             "Авторы", 
@@ -120,17 +131,21 @@ class BibliographyTableModel(QAbstractTableModel):
     def setItems(self, items):
         self.beginResetModel()
         self.items = items
+        self.search_texts = None
         self._apply_filter()
         self.endResetModel()
     
-    def set_filter(self, filter_text):
+    def set_filter(self, filter_text, indexed_matches=None):
         """
         Установка фильтра для отображаемых элементов
         
         Args:
             filter_text (str): Текст для фильтрации
+            indexed_matches (list): Индексы записей, найденных по тексту
+                в индексе файла проекта (None - поиск в записях)
         """
         self.filter_text = filter_text.lower()
+        self.indexed_matches = set(indexed_matches) if indexed_matches is not None else None
         self.beginResetModel()
         self._apply_filter()
         self.endResetModel()
@@ -139,47 +154,192 @@ class BibliographyTableModel(QAbstractTableModel):
         """Применение фильтра к элементам"""
         if not self.filter_text:
             self.filtered_items = self.items
+            self.filtered_indices = None
+            self.search_texts = None
             return
         
+        matches = self._filter_matcher()
         self.filtered_items = []
-        for item in self.items:
-            # Получаем строковое представление для поиска
-            item_str = str(item).lower()
-            
-            # Проверяем авторов
-            authors_match = False
-            if hasattr(item, 'authors'):
-                if isinstance(item.authors, list):
-                    authors_match = any(self.filter_text in author.lower() for author in item.authors)
-                else:
-                    authors_match = self.filter_text in str(item.authors).lower()
-            
-            # Проверяем другие поля
-            title_match = self.filter_text in getattr(item, 'title', "").lower()
-            year_match = self.filter_text in getattr(item, 'year', "").lower()
-            journal_match = self.filter_text in getattr(item, 'journal', "").lower()
-            publisher_match = self.filter_text in getattr(item, 'publisher', "").lower()
-            
-            # Проверка по новым полям
-            doi_match = self.filter_text in getattr(item, 'doi', "").lower()
-            url_match = self.filter_text in getattr(item, 'url', "").lower()
+        self.filtered_indices = []
+        for index, item in enumerate(self.items):
+            # Если хотя бы одно совпадение, добавляем в отфильтрованный список
+            if matches(index, item):
+                self.filtered_items.append(item)
+                self.filtered_indices.append(index)
+    
+    def _filter_matcher(self):
+        """
+        Проверка записи на соответствие текущему фильтру
+        
+        Returns:
+            callable: Функция индекса и записи, возвращающая True при совпадении
+        """
+        filter_text = self.filter_text
+        indexed_matches = self.indexed_matches
+        if indexed_matches is None and self.search_texts is None:
+            self.search_texts = [item.search_text for item in self.items]
+        search_texts = self.search_texts
+        
+        # Совпадения по флагам ВАК, РИНЦ и языку не зависят от записи
+        match_vak = filter_text in "вак"
+        match_rinc = filter_text in "ринц"
+        match_ru = filter_text in "русский"
+        match_en = filter_text in "английский"
+        
+        def matches(index, item):
+            # Текст записи, авторы, название, год, источник, DOI и URL
+            # в нижнем регистре (search_texts) или найденные по индексу
+            # файла проекта
+            if indexed_matches is not None:
+                text_match = index in indexed_matches
+            else:
+                text_match = filter_text in search_texts[index]
             
             # Проверка по флагам ВАК и РИНЦ
-            vak_match = (self.filter_text in "вак" and getattr(item, 'is_vak', False))
-            rinc_match = (self.filter_text in "ринц" and getattr(item, 'is_rinc', False))
+            vak_match = match_vak and item.is_vak
+            rinc_match = match_rinc and item.is_rinc
             
             # Проверка по языку
-            language = getattr(item, 'language', 'ru')
             language_match = (
-                (self.filter_text in "русский" and language == 'ru') or
-                (self.filter_text in "английский" and language == 'en')
+                (match_ru and item.language == 'ru') or
+                (match_en and item.language == 'en')
             )
             
-            # Если хотя бы одно совпадение, добавляем в отфильтрованный список
-            if (self.filter_text in item_str or authors_match or title_match or 
-                year_match or journal_match or publisher_match or doi_match or 
-                url_match or vak_match or rinc_match or language_match):
-                self.filtered_items.append(item)
+            return text_match or vak_match or rinc_match or language_match
+        
+        return matches
+    
+    def apply_event(self, event):
+        """
+        Точечное обновление таблицы по событию изменения списка модели
+        (без сброса модели: выделение и размеры строк сохраняются)
+        
+        Args:
+            event (BibliographyEvent): Событие; список уже изменен
+        """
+        # Результаты поиска по файлу проекта относятся к прежнему списку
+        self.indexed_matches = None
+        
+        if event.kind == BibliographyEvent.MOVED:
+            self._apply_move(event.order)
+            return
+        if event.kind == BibliographyEvent.RESET:
+            self.setItems(self.items)
+            return
+        
+        if self.filtered_indices is None:
+            # Без фильтра строки таблицы совпадают с индексами списка
+            if event.kind == BibliographyEvent.INSERTED:
+                self.beginInsertRows(QModelIndex(), event.first, event.last)
+                self.endInsertRows()
+            elif event.kind == BibliographyEvent.REMOVED:
+                self.beginRemoveRows(QModelIndex(), event.first, event.last)
+                self.endRemoveRows()
+            elif event.kind == BibliographyEvent.CHANGED:
+                self.dataChanged.emit(
+                    self.index(event.first, 0),
+                    self.index(event.last, len(self.headers) - 1)
+                )
+            return
+        
+        self._update_search_texts(event)
+        indices = self.filtered_indices
+        # Первая отображаемая строка, затронутая событием
+        row = bisect_left(indices, event.first)
+        if event.kind == BibliographyEvent.INSERTED:
+            count = event.count
+            for position in range(row, len(indices)):
+                indices[position] += count
+            matches = self._filter_matcher()
+            for index in range(event.first, event.last + 1):
+                item = self.items[index]
+                if matches(index, item):
+                    self.beginInsertRows(QModelIndex(), row, row)
+                    self.filtered_items.insert(row, item)
+                    indices.insert(row, index)
+                    self.endInsertRows()
+                    row += 1
+        elif event.kind == BibliographyEvent.REMOVED:
+            end = bisect_left(indices, event.last + 1)
+            if end > row:
+                self.beginRemoveRows(QModelIndex(), row, end - 1)
+                del self.filtered_items[row:end]
+                del indices[row:end]
+                self.endRemoveRows()
+            count = event.count
+            for position in range(row, len(indices)):
+                indices[position] -= count
+        elif event.kind == BibliographyEvent.CHANGED:
+            # Измененная запись может начать или перестать совпадать с фильтром
+            matches = self._filter_matcher()
+            for index in range(event.first, event.last + 1):
+                item = self.items[index]
+                row = bisect_left(indices, index)
+                shown = row < len(indices) and indices[row] == index
+                if matches(index, item):
+                    if shown:
+                        self.filtered_items[row] = item
+                        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1))
+                    else:
+                        self.beginInsertRows(QModelIndex(), row, row)
+                        self.filtered_items.insert(row, item)
+                        indices.insert(row, index)
+                        self.endInsertRows()
+                elif shown:
+                    self.beginRemoveRows(QModelIndex(), row, row)
+                    del self.filtered_items[row]
+                    del indices[row]
+                    self.endRemoveRows()
+    
+    def _update_search_texts(self, event):
+        """
+        Обновление текста для поиска по событию изменения списка
+        
+        Args:
+            event (BibliographyEvent): Событие вставки, удаления или изменения
+        """
+        search_texts = self.search_texts
+        if search_texts is None:
+            return
+        if event.kind == BibliographyEvent.INSERTED:
+            search_texts[event.first:event.first] = [
+                self.items[index].search_text for index in range(event.first, event.last + 1)
+            ]
+        elif event.kind == BibliographyEvent.REMOVED:
+            del search_texts[event.first:event.last + 1]
+        elif event.kind == BibliographyEvent.CHANGED:
+            for index in range(event.first, event.last + 1):
+                search_texts[index] = self.items[index].search_text
+    
+    def _apply_move(self, order):
+        """
+        Обновление таблицы после перестановки записей с сохранением
+        выделения (постоянные индексы переносятся на новые строки)
+        
+        Args:
+            order (list): order[новый индекс] = старый индекс
+        """
+        self.layoutAboutToBeChanged.emit()
+        # Новый индекс записи в списке по старому
+        new_indices = [0] * len(order)
+        for position, index in enumerate(order):
+            new_indices[index] = position
+        
+        if self.filtered_indices is None:
+            new_rows = new_indices
+        else:
+            if self.search_texts is not None:
+                self.search_texts = [self.search_texts[index] for index in order]
+            old_indices = self.filtered_indices
+            self._apply_filter()
+            rows = {index: row for row, index in enumerate(self.filtered_indices)}
+            new_rows = [rows[new_indices[index]] for index in old_indices]
+        
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(persistent, [
+            self.index(new_rows[index.row()], index.column()) for index in persistent
+        ])
+        self.layoutChanged.emit()
     
     def sort(self, column, order):
         """
@@ -189,8 +349,6 @@ class BibliographyTableModel(QAbstractTableModel):
             column (int): Индекс колонки для сортировки
             order (Qt.SortOrder): Порядок сортировки
         """
-        self.beginResetModel()
-        
         # Ключ для сортировки в зависимости от колонки
         if column == 0:  # Полная ссылка
             key = lambda x: getattr(x, 'full_reference', str(x))
@@ -237,8 +395,14 @@ class BibliographyTableModel(QAbstractTableModel):
             key = lambda x: str(x)
         
         reverse = (order == Qt.DescendingOrder)
-        self.items.sort(key=key, reverse=reverse)
+        # Сортировка через контроллер (с записью в журнал отмены);
+        # таблица обновляется по событию перестановки из модели
+        if hasattr(self, 'parent') and hasattr(self.parent(), 'sort_bibliography_signal'):
+            self.parent().sort_bibliography_signal.emit(key, reverse)
+            return
         
+        self.beginResetModel()
+        self.items.sort(key=key, reverse=reverse)
         self._apply_filter()
         self.endResetModel()
     
@@ -253,11 +417,9 @@ class BibliographyTableModel(QAbstractTableModel):
             int: Индекс в исходном списке или -1, если не найден
         """
         if 0 <= filtered_index < len(self.filtered_items):
-            item = self.filtered_items[filtered_index]
-            try:
-                return self.items.index(item)
-            except ValueError:
-                return -1
+            if self.filtered_indices is None:
+                return filtered_index
+            return self.filtered_indices[filtered_index]
         return -1
 
     def setData(self, index, value, role=Qt.EditRole):
@@ -285,19 +447,16 @@ class BibliographyTableModel(QAbstractTableModel):
         
         # Обработка чекбоксов
         if role == Qt.CheckStateRole:
-            if col == 7:  # ВАК
-                item.is_vak = (value == Qt.Checked)
-                self.dataChanged.emit(index, index)
-                # Сигнал для уведомления контроллера
-                if hasattr(self, 'parent') and hasattr(self.parent(), 'update_item_property_signal'):
-                    self.parent().update_item_property_signal.emit(original_index, 'is_vak', item.is_vak)
-                return True
-            elif col == 8:  # РИНЦ
-                item.is_rinc = (value == Qt.Checked)
-                self.dataChanged.emit(index, index)
-                # Сигнал для уведомления контроллера
+            if col == 7 or col == 8:  # ВАК или РИНЦ
+                property_name = 'is_vak' if col == 7 else 'is_rinc'
+                checked = (value == Qt.Checked)
+                # Изменение через контроллер (с записью в журнал отмены)
+                # (таблица обновляется по событию изменения из модели)
                 if hasattr(self, 'parent') and hasattr(self.parent(), 'update_item_property_signal'):
-                    self.parent().update_item_property_signal.emit(original_index, 'is_rinc', item.is_rinc)
+                    self.parent().update_item_property_signal.emit(original_index, property_name, checked)
+                else:
+                    setattr(item, property_name, checked)
+                    self.dataChanged.emit(index, index)
                 return True
         
         return False
@@ -334,6 +493,8 @@ class InputTab(QWidget):
     add_structured_bibliography_signal = pyqtSignal(dict)  # словарь с структурированными данными
     edit_bibliography_signal = pyqtSignal(str, int, str)  # текст, индекс, тип формата
     update_item_property_signal = pyqtSignal(int, str, object)  # индекс, имя свойства, значение
+    sort_bibliography_signal = pyqtSignal(object, bool)  # ключ сортировки, по убыванию
+    search_signal = pyqtSignal(str)  # поисковый запрос
     parse_text_signal = pyqtSignal(str)  # текст для распознавания
     remove_item_signal = pyqtSignal(int)  # индекс удаляемого элемента
     
@@ -1063,6 +1224,15 @@ class InputTab(QWidget):
         """
         self.bibliography_model.setItems(items)
     
+    def apply_bibliography_event(self, event):
+        """
+        Точечное обновление списка библиографических ссылок
+        
+        Args:
+            event (BibliographyEvent): Событие изменения списка модели
+        """
+        self.bibliography_model.apply_event(event)
+    
     def fill_form_with_data(self, data):
         """
         Заполнение формы данными
@@ -1103,7 +1273,18 @@ class InputTab(QWidget):
     def on_search(self):
         """Обработчик поиска по таблице"""
         search_text = self.search_edit.text().strip()
-        self.bibliography_model.set_filter(search_text)
+        self.search_signal.emit(search_text)
+    
+    def apply_search(self, search_text, indexed_matches=None):
+        """
+        Фильтрация таблицы по поисковому запросу
+        
+        Args:
+            search_text (str): Поисковый запрос
+            indexed_matches (list): Индексы записей, найденных по индексу
+                файла проекта (None - поиск в записях)
+        """
+        self.bibliography_model.set_filter(search_text, indexed_matches)
     
     def on_clear_search(self):
         """Обработчик очистки поискового запроса"""
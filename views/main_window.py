@@ -4,7 +4,7 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QStatusBar, QAction, QMenuBar, QMenu,
-    QMessageBox, QFileDialog
+    QMessageBox, QFileDialog, QInputDialog
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
@@ -18,6 +18,18 @@ class MainWindow(QMainWindow):
     # Сигналы для взаимодействия с контроллером
     import_bibliography_signal = pyqtSignal(str, str)  # путь к файлу, формат
     export_bibliography_signal = pyqtSignal(str, str)  # путь к файлу, формат
+    open_project_signal = pyqtSignal(str)  # путь к файлу проекта
+    save_project_signal = pyqtSignal(str)  # путь к файлу проекта
+    create_bibliography_signal = pyqtSignal(str)  # название нового списка
+    duplicate_bibliography_signal = pyqtSignal(str)  # название копии текущего списка
+    switch_bibliography_signal = pyqtSignal(str)  # название списка
+    
+    # Фильтр файлов проекта в диалогах
+    PROJECT_FILE_FILTER = (
+        "Проекты БиблиоАналитики (*.bibproj);;"
+        "Архивы БиблиоАналитики (*.bibarc);;"
+        "Все файлы (*.*)"
+    )
     
     def __init__(self):
         """Инициализация главного окна"""
@@ -26,6 +38,10 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("БиблиоАналитика")
         self.setMinimumSize(800, 600)
         
+        # Названия списков сеанса и текущий список (задаются контроллером)
+        self.bibliography_names = []
+        self.active_bibliography = ""
+        
         # Создание центрального виджета
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -52,11 +68,28 @@ class MainWindow(QMainWindow):
         file_menu = menu_bar.addMenu("&Файл")
         
         # Действия в меню "Файл"
+        open_project_action = QAction("&Открыть проект...", self)
+        open_project_action.setShortcut("Ctrl+Shift+O")
+        open_project_action.triggered.connect(self.on_open_project)
+        file_menu.addAction(open_project_action)
+        
+        save_project_action = QAction("&Сохранить проект...", self)
+        save_project_action.setShortcut("Ctrl+Shift+S")
+        save_project_action.triggered.connect(self.on_save_project)
+        file_menu.addAction(save_project_action)
+        
+        file_menu.addSeparator()
+        
         import_action = QAction("&Импорт из файла...", self)
         import_action.setShortcut("Ctrl+O")
         import_action.triggered.connect(self.on_import)
         file_menu.addAction(import_action)
         
+        # По умолчанию импортируется только раздел списка литературы
+        self.import_whole_document_action = QAction("Импортировать весь &документ", self)
+        self.import_whole_document_action.setCheckable(True)
+        file_menu.addAction(self.import_whole_document_action)
+        
         export_action = QAction("&Экспорт в файл...", self)
         export_action.setShortcut("Ctrl+S")
         export_action.triggered.connect(self.on_export)
@@ -74,9 +107,31 @@ class MainWindow(QMainWindow):
         
         undo_action = QAction("&Отменить", self)
         undo_action.setShortcut("Ctrl+Z")
-        undo_action.triggered.connect(self.on_undo)
+        # Обработчики назначаются контроллером после создания окна
+        undo_action.triggered.connect(lambda: self.on_undo())
         edit_menu.addAction(undo_action)
         
+        redo_action = QAction("&Повторить", self)
+        redo_action.setShortcut("Ctrl+Y")
+        redo_action.triggered.connect(lambda: self.on_redo())
+        edit_menu.addAction(redo_action)
+        
+        # Меню "Списки"
+        lists_menu = menu_bar.addMenu("&Списки")
+        
+        new_list_action = QAction("&Новый список...", self)
+        new_list_action.triggered.connect(self.on_new_bibliography)
+        lists_menu.addAction(new_list_action)
+        
+        duplicate_list_action = QAction("&Копировать текущий список...", self)
+        duplicate_list_action.triggered.connect(self.on_duplicate_bibliography)
+        lists_menu.addAction(duplicate_list_action)
+        
+        switch_list_action = QAction("&Перейти к списку...", self)
+        switch_list_action.setShortcut("Ctrl+L")
+        switch_list_action.triggered.connect(self.on_switch_bibliography)
+        lists_menu.addAction(switch_list_action)
+        
         # Меню "Помощь"
         help_menu = menu_bar.addMenu("&Справка")
         
@@ -105,6 +160,70 @@ class MainWindow(QMainWindow):
         # self.export_tab = QWidget()
         # self.tabs.addTab(self.export_tab, "Форматирование и экспорт")
     
+    def on_open_project(self):
+        """Обработчик открытия файла проекта"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Открытие проекта",
+            "",
+            MainWindow.PROJECT_FILE_FILTER
+        )
+        
+        if file_path:
+            self.open_project_signal.emit(file_path)
+    
+    def on_save_project(self):
+        """Обработчик сохранения файла проекта"""
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            "Сохранение проекта",
+            "",
+            MainWindow.PROJECT_FILE_FILTER
+        )
+        
+        if file_path:
+            # Расширение по выбранному типу файла, если не указано
+            if not file_path.lower().endswith(('.bibproj', '.bibarc')):
+                file_path += '.bibarc' if '*.bibarc' in selected_filter else '.bibproj'
+            self.save_project_signal.emit(file_path)
+    
+    def update_bibliography_names(self, names, active):
+        """
+        Обновление названий списков сеанса
+        
+        Args:
+            names (list): Названия списков
+            active (str): Название текущего списка
+        """
+        self.bibliography_names = list(names)
+        self.active_bibliography = active
+        self.setWindowTitle(f"БиблиоАналитика - {active}")
+    
+    def on_new_bibliography(self):
+        """Обработчик создания пустого списка"""
+        name, ok = QInputDialog.getText(self, "Новый список", "Название списка:")
+        if ok and name:
+            self.create_bibliography_signal.emit(name)
+    
+    def on_duplicate_bibliography(self):
+        """Обработчик копирования текущего списка"""
+        name, ok = QInputDialog.getText(
+            self, "Копирование списка", "Название копии:", text=f"{self.active_bibliography} (копия)"
+        )
+        if ok and name:
+            self.duplicate_bibliography_signal.emit(name)
+    
+    def on_switch_bibliography(self):
+        """Обработчик перехода к другому списку"""
+        names = self.bibliography_names
+        if len(names) < 2:
+            self.show_status_message("Других списков нет")
+            return
+        current = names.index(self.active_bibliography) if self.active_bibliography in names else 0
+        name, ok = QInputDialog.getItem(self, "Переход к списку", "Список:", names, current, False)
+        if ok and name:
+            self.switch_bibliography_signal.emit(name)
+    
     def on_import(self):
         """Обработчик импорта из файла"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -119,6 +238,16 @@ class MainWindow(QMainWindow):
             file_format = file_path.split('.')[-1].lower()
             self.import_bibliography_signal.emit(file_path, file_format)
     
+    def is_whole_document_import(self):
+        """
+        Проверка режима импорта всего документа
+        
+        Returns:
+            bool: True - импортировать весь документ, False - только
+                раздел списка литературы
+        """
+        return self.import_whole_document_action.isChecked()
+    
     def on_export(self):
         """Обработчик экспорта в файл"""
         file_path, _ = QFileDialog.getSaveFileName(
@@ -138,6 +267,11 @@ class MainWindow(QMainWindow):
         # Этот метод будет связан с контроллером
         pass
     
+    def on_redo(self):
+        """Обработчик повтора отмененного действия"""
+        # Этот метод будет связан с контроллером
+        pass
+    
     def on_about(self):
         """Отображение информации о программе"""
         QMessageBox.about(